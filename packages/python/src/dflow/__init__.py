@@ -23,110 +23,246 @@ Example:
     >>> print(f"You'll receive: {quote.out_amount} tokens")
 """
 
-# API classes
-from dflow.api import (
-    EventsAPI,
-    IntentAPI,
-    LiveDataAPI,
-    MarketsAPI,
-    OrderbookAPI,
-    OrdersAPI,
-    PredictionMarketAPI,
-    ProofAPI,
-    SearchAPI,
-    SeriesAPI,
-    SportsAPI,
-    SwapAPI,
-    TagsAPI,
-    TokensAPI,
-    TradesAPI,
-    VenuesAPI,
-)
-from dflow.client import DFlowClient, DFlowEnvironment
-
-# Solana utilities
-from dflow.solana import (
-    calculate_scalar_payout,
-    get_token_balances,
-    get_user_positions,
-    is_redemption_eligible,
-    sign_and_send_transaction,
-    sign_send_and_confirm,
-    wait_for_confirmation,
-    wait_for_confirmation_async,
-)
-
-# Types - export the most commonly used ones
-from dflow.types import (
-    Candlestick,
-    DeepLinkParams,
-    Event,
-    EventsResponse,
-    ForecastHistory,
-    IntentQuote,
-    IntentResponse,
-    LiveData,
-    Market,
-    MarketAccount,
-    MarketsResponse,
-    Orderbook,
-    OrderbookLevel,
-    OrderbookUpdate,
-    OrderResponse,
-    OrderStatusResponse,
-    PredictionMarketInitResponse,
-    PriceUpdate,
-    PriorityFeeConfig,
-    SearchResult,
-    Series,
-    SportsFilters,
-    SwapQuote,
-    SwapResponse,
-    Token,
-    TokenBalance,
-    TokenWithDecimals,
-    Trade,
-    TradesResponse,
-    TradeUpdate,
-    TransactionConfirmation,
-    UserPosition,
-    Venue,
-    VerifyAddressResponse,
-    WebSocketOptions,
-)
-
-# Utilities
-from dflow.utils import (
-    DEFAULT_SLIPPAGE_BPS,
-    MAX_BATCH_SIZE,
-    MAX_FILTER_ADDRESSES,
-    METADATA_API_BASE_URL,
-    OUTCOME_TOKEN_DECIMALS,
-    PROD_METADATA_API_BASE_URL,
-    PROD_TRADE_API_BASE_URL,
-    PROD_WEBSOCKET_URL,
-    PROOF_API_BASE_URL,
-    PROOF_DEEP_LINK_BASE_URL,
-    PROOF_SIGNATURE_MESSAGE_PREFIX,
-    SOL_MINT,
-    TRADE_API_BASE_URL,
-    USDC_MINT,
-    WEBSOCKET_URL,
-    DFlowApiError,
-    HttpClient,
-    collect_all,
-    count_all,
-    create_retryable,
-    default_should_retry,
-    find_first,
-    paginate,
-    paginate_async,
-    with_retry,
-    with_retry_async,
-)
-
-# WebSocket
-from dflow.websocket import DFlowWebSocket
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # API classes
+    from dflow.api import (
+        EventsAPI,
+        IntentAPI,
+        LiveDataAPI,
+        MarketsAPI,
+        OrderbookAPI,
+        OrdersAPI,
+        PredictionMarketAPI,
+        ProofAPI,
+        SearchAPI,
+        SeriesAPI,
+        SportsAPI,
+        SwapAPI,
+        TagsAPI,
+        TokensAPI,
+        TradesAPI,
+        VenuesAPI,
+    )
+    from dflow.client import DFlowClient, DFlowEnvironment
+
+    # Solana utilities
+    from dflow.solana import (
+        calculate_scalar_payout,
+        calculate_scalar_payouts,
+        clear_mint_decimals,
+        get_token_balances,
+        get_user_positions,
+        is_redemption_eligible,
+        sign_and_send_transaction,
+        sign_send_and_confirm,
+        wait_for_confirmation,
+        wait_for_confirmation_async,
+    )
+
+    # Types - export the most commonly used ones
+    from dflow.types import (
+        Candlestick,
+        DeepLinkParams,
+        Event,
+        EventsResponse,
+        ForecastHistory,
+        IntentQuote,
+        IntentResponse,
+        LiveData,
+        Market,
+        MarketAccount,
+        MarketsResponse,
+        Orderbook,
+        OrderbookLevel,
+        OrderbookUpdate,
+        OrderResponse,
+        OrderStatusResponse,
+        PredictionMarketInitResponse,
+        PriceUpdate,
+        PriorityFeeConfig,
+        SearchResult,
+        Series,
+        SportsFilters,
+        SwapQuote,
+        SwapResponse,
+        Token,
+        TokenBalance,
+        TokenWithDecimals,
+        Trade,
+        TradesResponse,
+        TradeUpdate,
+        TransactionConfirmation,
+        UserPosition,
+        Venue,
+        VerifyAddressResponse,
+        WebSocketOptions,
+    )
+
+    # Utilities
+    from dflow.utils import (
+        DEFAULT_SLIPPAGE_BPS,
+        MAX_BATCH_SIZE,
+        MAX_FILTER_ADDRESSES,
+        METADATA_API_BASE_URL,
+        OUTCOME_TOKEN_DECIMALS,
+        PROD_METADATA_API_BASE_URL,
+        PROD_TRADE_API_BASE_URL,
+        PROD_WEBSOCKET_URL,
+        PROOF_API_BASE_URL,
+        PROOF_DEEP_LINK_BASE_URL,
+        PROOF_SIGNATURE_MESSAGE_PREFIX,
+        SOL_MINT,
+        TRADE_API_BASE_URL,
+        USDC_MINT,
+        WEBSOCKET_URL,
+        AsyncHttpClient,
+        CircuitBreaker,
+        CircuitOpenError,
+        DFlowApiError,
+        HttpClient,
+        collect_all,
+        collect_all_raw,
+        count_all,
+        create_retryable,
+        create_retryable_async,
+        default_should_retry,
+        find_first,
+        paginate,
+        paginate_async,
+        with_retry,
+        with_retry_async,
+    )
+
+    # WebSocket
+    from dflow.websocket import DFlowWebSocket
+
+# Public names are imported on first access (PEP 562), so ``import dflow`` does
+# not load httpx, pydantic models, websockets, and solana until they are used.
+_LAZY_MODULES: dict[str, tuple[str, ...]] = {
+    "dflow.api": (
+        "EventsAPI",
+        "IntentAPI",
+        "LiveDataAPI",
+        "MarketsAPI",
+        "OrderbookAPI",
+        "OrdersAPI",
+        "PredictionMarketAPI",
+        "ProofAPI",
+        "SearchAPI",
+        "SeriesAPI",
+        "SportsAPI",
+        "SwapAPI",
+        "TagsAPI",
+        "TokensAPI",
+        "TradesAPI",
+        "VenuesAPI",
+    ),
+    "dflow.client": (
+        "DFlowClient",
+        "DFlowEnvironment",
+    ),
+    "dflow.solana": (
+        "calculate_scalar_payout",
+        "calculate_scalar_payouts",
+        "clear_mint_decimals",
+        "get_token_balances",
+        "get_user_positions",
+        "is_redemption_eligible",
+        "sign_and_send_transaction",
+        "sign_send_and_confirm",
+        "wait_for_confirmation",
+        "wait_for_confirmation_async",
+    ),
+    "dflow.types": (
+        "Candlestick",
+        "DeepLinkParams",
+        "Event",
+        "EventsResponse",
+        "ForecastHistory",
+        "IntentQuote",
+        "IntentResponse",
+        "LiveData",
+        "Market",
+        "MarketAccount",
+        "MarketsResponse",
+        "Orderbook",
+        "OrderbookLevel",
+        "OrderbookUpdate",
+        "OrderResponse",
+        "OrderStatusResponse",
+        "PredictionMarketInitResponse",
+        "PriceUpdate",
+        "PriorityFeeConfig",
+        "SearchResult",
+        "Series",
+        "SportsFilters",
+        "SwapQuote",
+        "SwapResponse",
+        "Token",
+        "TokenBalance",
+        "TokenWithDecimals",
+        "Trade",
+        "TradesResponse",
+        "TradeUpdate",
+        "TransactionConfirmation",
+        "UserPosition",
+        "Venue",
+        "VerifyAddressResponse",
+        "WebSocketOptions",
+    ),
+    "dflow.utils": (
+        "DEFAULT_SLIPPAGE_BPS",
+        "MAX_BATCH_SIZE",
+        "MAX_FILTER_ADDRESSES",
+        "METADATA_API_BASE_URL",
+        "OUTCOME_TOKEN_DECIMALS",
+        "PROD_METADATA_API_BASE_URL",
+        "PROD_TRADE_API_BASE_URL",
+        "PROD_WEBSOCKET_URL",
+        "PROOF_API_BASE_URL",
+        "PROOF_DEEP_LINK_BASE_URL",
+        "PROOF_SIGNATURE_MESSAGE_PREFIX",
+        "SOL_MINT",
+        "TRADE_API_BASE_URL",
+        "USDC_MINT",
+        "WEBSOCKET_URL",
+        "AsyncHttpClient",
+        "CircuitBreaker",
+        "CircuitOpenError",
+        "DFlowApiError",
+        "HttpClient",
+        "collect_all",
+        "collect_all_raw",
+        "count_all",
+        "create_retryable",
+        "create_retryable_async",
+        "default_should_retry",
+        "find_first",
+        "paginate",
+        "paginate_async",
+        "with_retry",
+        "with_retry_async",
+    ),
+    "dflow.websocket": ("DFlowWebSocket",),
+}
+_LAZY_IMPORTS = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 __version__ = "0.2.0"
 
@@ -159,21 +295,28 @@ __all__ = [
     "wait_for_confirmation_async",
     "sign_send_and_confirm",
     "get_token_balances",
+    "clear_mint_decimals",
     "get_user_positions",
     "is_redemption_eligible",
     "calculate_scalar_payout",
+    "calculate_scalar_payouts",
     # HTTP utilities
     "HttpClient",
+    "AsyncHttpClient",
     "DFlowApiError",
     # Retry utilities
     "with_retry",
     "with_retry_async",
     "create_retryable",
+    "create_retryable_async",
     "default_should_retry",
+    "CircuitBreaker",
+    "CircuitOpenError",
     # Pagination utilities
     "paginate",
     "paginate_async",
     "collect_all",
+    "collect_all_raw",
     "count_all",
     "find_first",
     # Constants
@@ -1,5 +1,7 @@
 """Events API for DFlow SDK."""
 
+from pydantic import TypeAdapter
+
 from dflow.types import (
     CandlestickParams,
     Event,
@@ -12,6 +14,9 @@ from dflow.types import (
 )
 from dflow.utils.http import HttpClient
 
+# Validate whole lists in one pydantic-core call instead of per item
+_MARKET_CANDLESTICK_LIST = TypeAdapter(list[MarketCandlestick])
+
 
 class EventsAPI:
     """API for discovering and querying prediction market events.
@@ -243,8 +248,8 @@ class EventsAPI:
                 if index < len(market_candlesticks):
                     candles_data = market_candlesticks[index]
                     if candles_data:
-                        result[market_ticker] = [
-                            MarketCandlestick.model_validate(c) for c in candles_data
-                        ]
+                        result[market_ticker] = _MARKET_CANDLESTICK_LIST.validate_python(
+                            candles_data
+                        )
 
         return result
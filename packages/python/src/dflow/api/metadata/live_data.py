@@ -1,5 +1,8 @@
 """Live Data API for DFlow SDK."""
 
+import time
+from typing import Any
+
 from dflow.types import LiveData, LiveDataResponse
 from dflow.utils.http import HttpClient
 
@@ -21,8 +24,50 @@ class LiveDataAPI:
         >>> event_data = dflow.live_data.get_live_data_by_event("BTCD-25DEC0313")
     """
 
-    def __init__(self, http: HttpClient):
+    # Maximum number of event/mint lookups remembered by the response cache
+    _CACHE_MAX_SIZE = 256
+
+    def __init__(self, http: HttpClient, cache_ttl: float = 1.0):
+        """Initialize LiveDataAPI.
+
+        Args:
+            http: HttpClient configured for the metadata API base URL
+            cache_ttl: Seconds to reuse a by-event/by-mint response without
+                contacting the server (default: 1.0). After that the response
+                is revalidated with its ETag. Use 0 to always revalidate.
+        """
         self._http = http
+        self._cache_ttl = cache_ttl
+        # (path, params) -> (fetched at, ETag, parsed live data)
+        self._cache: dict[
+            tuple[str, tuple[tuple[str, Any], ...]], tuple[float, str | None, LiveData]
+        ] = {}
+
+    def _get_cached(self, path: str, params: dict[str, Any]) -> LiveData:
+        """Fetch live data, reusing fresh or unmodified cached responses."""
+        key = (path, tuple((k, v) for k, v in params.items() if v is not None))
+        cache = self._cache
+        hit = cache.get(key)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < self._cache_ttl:
+            return hit[2]
+
+        data, etag = self._http.get_conditional(path, params, hit[1] if hit else None)
+        if data is None and hit is not None:
+            # 304 Not Modified: keep the already validated model
+            live_data = hit[2]
+        else:
+            live_data = LiveData.model_validate(data)
+
+        if key not in cache and len(cache) >= self._CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            cache.pop(next(iter(cache), key), None)
+        cache[key] = (now, etag, live_data)
+        return live_data
+
+    def clear_cache(self) -> None:
+        """Forget all cached by-event and by-mint responses."""
+        self._cache.clear()
 
     def get_live_data(self, milestone_ids: list[str]) -> list[LiveData]:
         """Get live data for specific milestones.
@@ -59,6 +104,9 @@ class LiveDataAPI:
         Fetches all live data for an event by automatically looking up all related
         milestones and batching the live data requests. Supports all milestone filtering options.
 
+        Responses are cached for ``cache_ttl`` seconds and then revalidated
+        with ``If-None-Match``, so frequent polling is cheap.
+
         Args:
             event_ticker: The event ticker
             minimum_start_date: Minimum start date to filter milestones (RFC3339 format)
@@ -81,7 +129,7 @@ class LiveDataAPI:
             ...     competition="NFL",
             ... )
         """
-        data = self._http.get(
+        return self._get_cached(
             f"/live_data/by-event/{event_ticker}",
             {
                 "minimumStartDate": minimum_start_date,
@@ -91,7 +139,6 @@ class LiveDataAPI:
                 "type": type,
             },
         )
-        return LiveData.model_validate(data)
 
     def get_live_data_by_mint(
         self,
@@ -107,6 +154,9 @@ class LiveDataAPI:
         Looks up the event ticker from a market mint address, then fetches all live data
         for that event. Supports all milestone filtering options.
 
+        Responses are cached for ``cache_ttl`` seconds and then revalidated
+        with ``If-None-Match``, so frequent polling is cheap.
+
         Args:
             mint_address: Market mint address (ledger or outcome mint)
             minimum_start_date: Minimum start date to filter milestones (RFC3339 format)
@@ -127,7 +177,7 @@ class LiveDataAPI:
             ...     type="price",
             ... )
         """
-        data = self._http.get(
+        return self._get_cached(
             f"/live_data/by-mint/{mint_address}",
             {
                 "minimumStartDate": minimum_start_date,
@@ -137,4 +187,3 @@ class LiveDataAPI:
                 "type": type,
             },
         )
-        return LiveData.model_validate(data)
@@ -1,6 +1,8 @@
 """Markets API for DFlow SDK."""
 
-from typing import cast
+from typing import Any, cast
+
+from pydantic import TypeAdapter
 
 from dflow.types import (
     Candlestick,
@@ -10,9 +12,26 @@ from dflow.types import (
     MarketStatus,
     SortField,
 )
+from dflow.utils.cache import ttl_cache
 from dflow.utils.constants import MAX_BATCH_SIZE, MAX_FILTER_ADDRESSES
+from dflow.utils.diskcache import FileCache
 from dflow.utils.http import HttpClient
 
+# Validate whole lists in one pydantic-core call instead of per item
+_MARKET_LIST = TypeAdapter(list[Market])
+_CANDLESTICK_LIST = TypeAdapter(list[Candlestick])
+
+# Market statuses after which a market's data no longer changes
+_FINAL_STATUSES: frozenset[MarketStatus] = frozenset({"finalized"})
+
+# Price and volume columns returned by get_market_candlestick_columns
+_CANDLESTICK_VALUE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def _chunks(items: list[str], size: int) -> list[list[str]]:
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
 
 class MarketsAPI:
     """API for querying prediction market data, pricing, and batch operations.
@@ -34,12 +53,36 @@ class MarketsAPI:
         >>> markets = dflow.markets.get_markets_batch(tickers=["MARKET-1", "MARKET-2"])
     """
 
-    def __init__(self, http: HttpClient):
+    def __init__(
+        self,
+        http: HttpClient,
+        cache_ttl: float = 60.0,
+        disk_cache: FileCache | None = None,
+    ):
+        """Initialize MarketsAPI.
+
+        Args:
+            http: HttpClient configured for the metadata API base URL
+            cache_ttl: Seconds to keep outcome mint lists from
+                ``get_outcome_mints`` (default: 60.0). Use 0 to disable caching.
+            disk_cache: Optional on-disk cache for finalized markets, which no
+                longer change, so ``get_market`` can skip the network across runs
+        """
         self._http = http
+        self._cache_ttl = cache_ttl
+        self._cache: dict[Any, tuple[float, Any]] = {}
+        self._disk_cache = disk_cache
+
+    def clear_cache(self) -> None:
+        """Forget all cached ``get_outcome_mints`` results."""
+        self._cache.clear()
 
     def get_market(self, market_id: str) -> Market:
         """Get a single market by its ticker.
 
+        If a ``disk_cache`` is configured, finalized markets are stored on disk
+        and later calls for them are served without a request.
+
         Args:
             market_id: The market ticker (e.g., 'BTCD-25DEC0313-T92749.99')
 
@@ -51,8 +94,18 @@ class MarketsAPI:
             >>> print(f"YES: {market.yes_ask}, NO: {market.no_ask}")
             >>> print(f"Volume: {market.volume}")
         """
-        data = self._http.get(f"/market/{market_id}")
-        return Market.model_validate(data)
+        path = f"/market/{market_id}"
+        disk_cache = self._disk_cache
+        key = f"{self._http.base_url}{path.lstrip('/')}"
+        data = disk_cache.get(key) if disk_cache is not None else None
+        if data is not None:
+            return Market.model_validate(data)
+
+        data = self._http.get(path)
+        market = Market.model_validate(data)
+        if disk_cache is not None and market.status in _FINAL_STATUSES:
+            disk_cache.set(key, data)
+        return market
 
     def get_market_by_mint(self, mint_address: str) -> Market:
         """Get a market by its outcome token mint address.
@@ -133,21 +186,29 @@ class MarketsAPI:
         self,
         tickers: list[str] | None = None,
         mints: list[str] | None = None,
+        chunk: bool = False,
     ) -> list[Market]:
         """Batch query multiple markets by tickers and/or mint addresses.
 
         More efficient than multiple individual requests when you need
-        data for several markets at once. Results are capped at 100 markets maximum.
+        data for several markets at once. The API accepts at most 100 items per
+        request. With ``chunk=True``, larger lookups are split into chunks that
+        are fetched concurrently and merged in order. If any chunk fails, the
+        error of the first failing chunk (in order) is raised, chunks that have
+        not started are cancelled, and results from the others are discarded.
 
         Args:
             tickers: Array of market tickers to fetch
             mints: Array of mint addresses to fetch
+            chunk: Split lookups over MAX_BATCH_SIZE into several concurrent
+                requests instead of raising ValueError (default: False)
 
         Returns:
             Array of market data
 
         Raises:
-            ValueError: If total items exceed MAX_BATCH_SIZE (100)
+            ValueError: If ``chunk`` is False and total items exceed
+                MAX_BATCH_SIZE (100)
 
         Example:
             >>> markets = dflow.markets.get_markets_batch(
@@ -155,17 +216,23 @@ class MarketsAPI:
             ...     mints=["mint-address-1"],
             ... )
         """
-        total_items = len(tickers or []) + len(mints or [])
-        if total_items > MAX_BATCH_SIZE:
+        tickers = tickers or []
+        mints = mints or []
+        if len(tickers) + len(mints) <= MAX_BATCH_SIZE:
+            bodies = [{"tickers": tickers, "mints": mints}]
+        elif not chunk:
             raise ValueError(f"Batch size exceeds maximum of {MAX_BATCH_SIZE} items")
+        else:
+            bodies = [
+                {"tickers": c, "mints": []} for c in _chunks(tickers, MAX_BATCH_SIZE)
+            ] + [{"tickers": [], "mints": c} for c in _chunks(mints, MAX_BATCH_SIZE)]
 
-        data = self._http.post(
-            "/markets/batch",
-            {"tickers": tickers or [], "mints": mints or []},
-        )
-        markets_data = data.get("markets", []) if isinstance(data, dict) else data
-        return [Market.model_validate(m) for m in markets_data]
+        markets_data: list[Any] = []
+        for data in self._post_all("/markets/batch", bodies):
+            markets_data.extend(data.get("markets", []) if isinstance(data, dict) else data)
+        return _MARKET_LIST.validate_python(markets_data)
 
+    @ttl_cache
     def get_outcome_mints(self, min_close_ts: int | None = None) -> list[str]:
         """Get all outcome token mint addresses.
 
@@ -194,20 +261,47 @@ class MarketsAPI:
         data = self._http.get("/outcome_mints", params)
         return cast(list[str], data.get("mints", []))
 
-    def filter_outcome_mints(self, addresses: list[str]) -> list[str]:
+    @ttl_cache
+    def get_outcome_mint_set(self, min_close_ts: int | None = None) -> frozenset[str]:
+        """Get all outcome token mint addresses as a set for fast membership tests.
+
+        Cached like ``get_outcome_mints``, so repeated lookups reuse the same set
+        instead of rebuilding it from the list.
+
+        Args:
+            min_close_ts: Minimum close timestamp (Unix timestamp in seconds).
+                         Only markets with close_time >= minCloseTs will be included.
+
+        Returns:
+            Frozen set of mint addresses
+
+        Example:
+            >>> outcome_mints = dflow.markets.get_outcome_mint_set()
+            >>> held = [m for m in wallet_mints if m in outcome_mints]
+        """
+        return frozenset(self.get_outcome_mints(min_close_ts))
+
+    def filter_outcome_mints(self, addresses: list[str], chunk: bool = False) -> list[str]:
         """Filter a list of addresses to find which are outcome token mints.
 
         Given a list of token addresses (e.g., from a wallet), returns only
         those that are prediction market outcome tokens (yes_mint or no_mint).
+        The API accepts at most 200 addresses per request. With ``chunk=True``,
+        longer lists are split into chunks that are checked concurrently and
+        merged in order; a failing chunk fails the whole call, as in
+        ``get_markets_batch``.
 
         Args:
-            addresses: Array of Solana token addresses to check (max 200)
+            addresses: Array of Solana token addresses to check
+            chunk: Split lists over MAX_FILTER_ADDRESSES into several concurrent
+                requests instead of raising ValueError (default: False)
 
         Returns:
             Array of addresses that are outcome token mints
 
         Raises:
-            ValueError: If addresses exceed MAX_FILTER_ADDRESSES (200)
+            ValueError: If ``chunk`` is False and addresses exceed
+                MAX_FILTER_ADDRESSES (200)
 
         Example:
             >>> # Get user's wallet tokens
@@ -216,13 +310,26 @@ class MarketsAPI:
             >>> # Filter to find prediction market tokens
             >>> prediction_tokens = dflow.markets.filter_outcome_mints(wallet_tokens)
         """
-        if len(addresses) > MAX_FILTER_ADDRESSES:
+        if len(addresses) > MAX_FILTER_ADDRESSES and not chunk:
             raise ValueError(
                 f"Address count exceeds maximum of {MAX_FILTER_ADDRESSES}"
             )
 
-        data = self._http.post("/filter_outcome_mints", {"addresses": addresses})
-        return cast(list[str], data.get("outcomeMints", []))
+        bodies = [{"addresses": c} for c in _chunks(addresses, MAX_FILTER_ADDRESSES)]
+        outcome_mints: list[str] = []
+        for data in self._post_all("/filter_outcome_mints", bodies or [{"addresses": []}]):
+            outcome_mints.extend(data.get("outcomeMints", []))
+        return outcome_mints
+
+    def _post_all(self, path: str, bodies: list[dict[str, Any]]) -> list[Any]:
+        """POST each body to ``path``, concurrently if there is more than one.
+
+        Results keep the order of ``bodies``. The first failure (in order) is
+        raised; ``Executor.map`` then cancels the requests not yet started.
+        """
+        if len(bodies) == 1:
+            return [self._http.post(path, bodies[0])]
+        return list(self._http.executor.map(lambda body: self._http.post(path, body), bodies))
 
     def get_market_candlesticks(
         self,
@@ -262,7 +369,58 @@ class MarketsAPI:
                 "periodInterval": params.period_interval,
             },
         )
-        return [Candlestick.model_validate(c) for c in data.get("candlesticks", [])]
+        return _CANDLESTICK_LIST.validate_python(data.get("candlesticks", []))
+
+    def get_market_candlestick_columns(
+        self,
+        ticker: str,
+        params: CandlestickParams,
+    ) -> dict[str, list[float]]:
+        """Get OHLCV candlestick data for a market as parallel columns.
+
+        Same data as ``get_market_candlesticks``, but returned column-wise
+        (``timestamp``, ``open``, ``high``, ``low``, ``close``, ``volume``)
+        without building a ``Candlestick`` model per point. This is faster for
+        long ranges and can be passed straight to ``pandas.DataFrame`` or
+        ``numpy.asarray``.
+
+        Args:
+            ticker: The market ticker
+            params: Required candlestick parameters
+
+        Returns:
+            Mapping of column name to values, one entry per candlestick
+
+        Raises:
+            KeyError: If a candlestick is missing one of the columns
+            ValueError: If a price or volume is not numeric
+
+        Example:
+            >>> import pandas as pd
+            >>> from dflow.types import CandlestickParams
+            >>> columns = dflow.markets.get_market_candlestick_columns(
+            ...     "BTCD-25DEC0313-T92749.99",
+            ...     CandlestickParams(
+            ...         start_ts=1704067200,
+            ...         end_ts=1704153600,
+            ...         period_interval=1,
+            ...     )
+            ... )
+            >>> df = pd.DataFrame(columns).set_index("timestamp")
+        """
+        data = self._http.get(
+            f"/market/{ticker}/candlesticks",
+            {
+                "startTs": params.start_ts,
+                "endTs": params.end_ts,
+                "periodInterval": params.period_interval,
+            },
+        )
+        candles = data.get("candlesticks", [])
+        columns: dict[str, list[float]] = {"timestamp": [c["timestamp"] for c in candles]}
+        for field in _CANDLESTICK_VALUE_FIELDS:
+            columns[field] = [float(c[field]) for c in candles]
+        return columns
 
     def get_market_candlesticks_by_mint(
         self,
@@ -300,4 +458,4 @@ class MarketsAPI:
                 "periodInterval": params.period_interval,
             },
         )
-        return [Candlestick.model_validate(c) for c in data.get("candlesticks", [])]
+        return _CANDLESTICK_LIST.validate_python(data.get("candlesticks", []))
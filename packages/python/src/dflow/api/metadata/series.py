@@ -1,6 +1,9 @@
 """Series API for DFlow SDK."""
 
+from typing import Any
+
 from dflow.types import MarketStatus, Series, SeriesResponse
+from dflow.utils.cache import ttl_cache
 from dflow.utils.http import HttpClient
 
 
@@ -21,9 +24,23 @@ class SeriesAPI:
         >>> btc_series = dflow.series.get_series_by_ticker("KXBTC")
     """
 
-    def __init__(self, http: HttpClient):
+    def __init__(self, http: HttpClient, cache_ttl: float = 300.0):
+        """Initialize SeriesAPI.
+
+        Args:
+            http: HttpClient configured for the metadata API base URL
+            cache_ttl: Seconds to keep series returned by ``get_series`` and
+                ``get_series_by_ticker`` (default: 300.0). Use 0 to disable caching.
+        """
         self._http = http
+        self._cache_ttl = cache_ttl
+        self._cache: dict[Any, tuple[float, Any]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget all cached ``get_series`` and ``get_series_by_ticker`` results."""
+        self._cache.clear()
 
+    @ttl_cache
     def get_series(
         self,
         category: str | None = None,
@@ -72,6 +89,7 @@ class SeriesAPI:
         response = SeriesResponse.model_validate(data)
         return response.series
 
+    @ttl_cache
     def get_series_by_ticker(self, ticker: str) -> Series:
         """Get a specific series by its ticker.
 
@@ -1,6 +1,9 @@
 """Sports API for DFlow SDK."""
 
+from typing import Any
+
 from dflow.types import FiltersBySportsResponse
+from dflow.utils.cache import ttl_cache
 from dflow.utils.http import HttpClient
 
 
@@ -20,9 +23,23 @@ class SportsAPI:
         ...         print(f"{sport}: {filters.competitions}")
     """
 
-    def __init__(self, http: HttpClient):
+    def __init__(self, http: HttpClient, cache_ttl: float = 300.0):
+        """Initialize SportsAPI.
+
+        Args:
+            http: HttpClient configured for the metadata API base URL
+            cache_ttl: Seconds to keep the ``get_filters_by_sports`` response
+                (default: 300.0). Use 0 to disable caching.
+        """
         self._http = http
+        self._cache_ttl = cache_ttl
+        self._cache: dict[Any, tuple[float, Any]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget all cached ``get_filters_by_sports`` results."""
+        self._cache.clear()
 
+    @ttl_cache
     def get_filters_by_sports(self) -> FiltersBySportsResponse:
         """Get all available sports filters.
 
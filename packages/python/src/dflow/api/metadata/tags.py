@@ -1,6 +1,9 @@
 """Tags API for DFlow SDK."""
 
+from typing import Any
+
 from dflow.types import CategoryTags, TagsByCategoriesResponse
+from dflow.utils.cache import ttl_cache
 from dflow.utils.http import HttpClient
 
 
@@ -16,9 +19,23 @@ class TagsAPI:
         >>> print(list(tags.keys()))  # List of categories
     """
 
-    def __init__(self, http: HttpClient):
+    def __init__(self, http: HttpClient, cache_ttl: float = 300.0):
+        """Initialize TagsAPI.
+
+        Args:
+            http: HttpClient configured for the metadata API base URL
+            cache_ttl: Seconds to keep the ``get_tags_by_categories`` response
+                (default: 300.0). Use 0 to disable caching.
+        """
         self._http = http
+        self._cache_ttl = cache_ttl
+        self._cache: dict[Any, tuple[float, Any]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget all cached ``get_tags_by_categories`` results."""
+        self._cache.clear()
 
+    @ttl_cache
     def get_tags_by_categories(self) -> CategoryTags:
         """Get all tags organized by category.
 
@@ -1,7 +1,8 @@
 """Proof KYC API for DFlow SDK."""
 
+import threading
 import time
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 
 from dflow.types.proof import DeepLinkParams, VerifyAddressResponse
 from dflow.utils.constants import (
@@ -40,17 +41,35 @@ class ProofAPI:
         ... ))
     """
 
-    def __init__(self, http: HttpClient):
+    # Maximum number of verified addresses remembered by verify_address
+    _VERIFY_CACHE_MAX_SIZE = 1024
+    # Maximum number of deep links remembered by build_deep_link
+    _DEEP_LINK_CACHE_MAX_SIZE = 256
+
+    def __init__(self, http: HttpClient, verify_cache_ttl: float = 60.0):
         """Initialize ProofAPI.
 
         Args:
             http: HttpClient configured for the Proof API base URL
+            verify_cache_ttl: Seconds to reuse a verified result from
+                ``verify_address`` (default: 60.0). Use 0 to disable caching.
         """
         self._http = http
+        self._verify_cache_ttl = verify_cache_ttl
+        self._verify_cache: dict[str, tuple[float, VerifyAddressResponse]] = {}
+        # Guards _verify_cache, which verify_addresses updates from many threads
+        self._verify_lock = threading.Lock()
+        self._signature_prefix = PROOF_SIGNATURE_MESSAGE_PREFIX
+        self._deep_link_base = f"{PROOF_DEEP_LINK_BASE_URL}?"
+        self._deep_link_cache: dict[DeepLinkParams, str] = {}
 
     def verify_address(self, address: str) -> VerifyAddressResponse:
         """Check if a wallet address has completed KYC verification.
 
+        Verified results are cached for ``verify_cache_ttl`` seconds, so
+        repeated checks of the same wallet skip the network. Unverified results
+        are never cached, so a user who just completed KYC is seen right away.
+
         Args:
             address: Solana wallet address to check
 
@@ -66,8 +85,61 @@ class ProofAPI:
             ... else:
             ...     print("User needs to complete KYC")
         """
+        cache = self._verify_cache
+        with self._verify_lock:
+            hit = cache.get(address)
+            if hit is not None:
+                if time.monotonic() - hit[0] < self._verify_cache_ttl:
+                    return hit[1]
+                del cache[address]
+
         data = self._http.get(f"/verify/{address}")
-        return VerifyAddressResponse.model_validate(data)
+        result = VerifyAddressResponse.model_validate(data)
+
+        if result.verified and self._verify_cache_ttl > 0:
+            with self._verify_lock:
+                if address not in cache and len(cache) >= self._VERIFY_CACHE_MAX_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del cache[next(iter(cache))]
+                cache[address] = (time.monotonic(), result)
+        return result
+
+    def verify_addresses(self, addresses: list[str]) -> dict[str, bool]:
+        """Check KYC verification status for many wallet addresses.
+
+        Duplicate addresses are checked once. Lookups run concurrently on the
+        HTTP client's shared thread pool, so its size bounds how many are in
+        flight, and share the ``verify_address`` cache.
+
+        Args:
+            addresses: Solana wallet addresses to check
+
+        Returns:
+            Mapping of each address to its verified status
+
+        Raises:
+            DFlowApiError: If any lookup fails
+
+        Example:
+            >>> status = dflow.proof.verify_addresses([wallet_a, wallet_b])
+            >>> unverified = [w for w, ok in status.items() if not ok]
+        """
+        unique = list(dict.fromkeys(addresses))
+        if not unique:
+            return {}
+
+        responses = self._http.executor.map(self.verify_address, unique)
+        return {address: response.verified for address, response in zip(unique, responses)}
+
+    def clear_verify_cache(self) -> None:
+        """Forget all cached ``verify_address`` results.
+
+        Example:
+            >>> dflow.proof.clear_verify_cache()
+            >>> result = dflow.proof.verify_address(wallet)  # always hits the API
+        """
+        with self._verify_lock:
+            self._verify_cache.clear()
 
     def generate_signature_message(self, timestamp: int | None = None) -> str:
         """Generate the message to be signed for KYC verification.
@@ -92,7 +164,7 @@ class ProofAPI:
         if timestamp is None:
             timestamp = int(time.time() * 1000)
 
-        return f"{PROOF_SIGNATURE_MESSAGE_PREFIX}{timestamp}"
+        return f"{self._signature_prefix}{timestamp}"
 
     def build_deep_link(self, params: DeepLinkParams) -> str:
         """Build a deep link URL for the Proof KYC verification flow.
@@ -117,14 +189,23 @@ class ProofAPI:
             >>> print(link)
             # https://dflow.net/proof?wallet=7xKXtg...&signature=...&...
         """
-        query_params = {
-            "wallet": params.wallet,
-            "signature": params.signature,
-            "timestamp": str(params.timestamp),
-            "redirect_uri": params.redirect_uri,
-        }
-
+        cached = self._deep_link_cache.get(params)
+        if cached is not None:
+            return cached
+
+        # Same encoding as urlencode (quote_plus, nothing safe), for known fields
+        q = quote_plus
+        parts = [
+            "wallet=" + q(params.wallet, safe=""),
+            "signature=" + q(params.signature, safe=""),
+            f"timestamp={params.timestamp}",
+            "redirect_uri=" + q(params.redirect_uri, safe=""),
+        ]
         if params.project_id:
-            query_params["projectId"] = params.project_id
+            parts.append("projectId=" + q(params.project_id, safe=""))
 
-        return f"{PROOF_DEEP_LINK_BASE_URL}?{urlencode(query_params)}"
+        link = self._deep_link_base + "&".join(parts)
+        if len(self._deep_link_cache) >= self._DEEP_LINK_CACHE_MAX_SIZE:
+            self._deep_link_cache.pop(next(iter(self._deep_link_cache)))
+        self._deep_link_cache[params] = link
+        return link
@@ -1,8 +1,17 @@
 """Tokens API for DFlow SDK."""
 
+from typing import Any
+
+from pydantic import TypeAdapter
+
 from dflow.types import Token, TokenWithDecimals
+from dflow.utils.cache import ttl_cache
 from dflow.utils.http import HttpClient
 
+# Validate whole lists in one pydantic-core call instead of per item
+_TOKEN_LIST = TypeAdapter(list[Token])
+_TOKEN_WITH_DECIMALS_LIST = TypeAdapter(list[TokenWithDecimals])
+
 
 class TokensAPI:
     """API for retrieving available token information.
@@ -20,9 +29,23 @@ class TokensAPI:
         >>> tokens_with_decimals = dflow.tokens.get_tokens_with_decimals()
     """
 
-    def __init__(self, http: HttpClient):
+    def __init__(self, http: HttpClient, cache_ttl: float = 300.0):
+        """Initialize TokensAPI.
+
+        Args:
+            http: HttpClient configured for the trade API base URL
+            cache_ttl: Seconds to keep the token lists (default: 300.0). Use 0
+                to disable caching.
+        """
         self._http = http
+        self._cache_ttl = cache_ttl
+        self._cache: dict[Any, tuple[float, Any]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget all cached token list results."""
+        self._cache.clear()
 
+    @ttl_cache
     def get_tokens(self) -> list[Token]:
         """Get all available tokens for trading.
 
@@ -35,8 +58,9 @@ class TokensAPI:
             ...     print(f"{token.symbol}: {token.mint}")
         """
         data = self._http.get("/tokens")
-        return [Token.model_validate(t) for t in data]
+        return _TOKEN_LIST.validate_python(data)
 
+    @ttl_cache
     def get_tokens_with_decimals(self) -> list[TokenWithDecimals]:
         """Get all available tokens with decimal information.
 
@@ -54,4 +78,4 @@ class TokensAPI:
             ...     base_units = 1 * (10 ** token.decimals)
         """
         data = self._http.get("/tokens-with-decimals")
-        return [TokenWithDecimals.model_validate(t) for t in data]
+        return _TOKEN_WITH_DECIMALS_LIST.validate_python(data)
@@ -1,8 +1,16 @@
 """Venues API for DFlow SDK."""
 
+from typing import Any
+
+from pydantic import TypeAdapter
+
 from dflow.types import Venue
+from dflow.utils.cache import ttl_cache
 from dflow.utils.http import HttpClient
 
+# Validate whole lists in one pydantic-core call instead of per item
+_VENUE_LIST = TypeAdapter(list[Venue])
+
 
 class VenuesAPI:
     """API for retrieving trading venue information.
@@ -17,9 +25,23 @@ class VenuesAPI:
         ...     print(venue.name)
     """
 
-    def __init__(self, http: HttpClient):
+    def __init__(self, http: HttpClient, cache_ttl: float = 300.0):
+        """Initialize VenuesAPI.
+
+        Args:
+            http: HttpClient configured for the trade API base URL
+            cache_ttl: Seconds to keep the venue list (default: 300.0). Use 0
+                to disable caching.
+        """
         self._http = http
+        self._cache_ttl = cache_ttl
+        self._cache: dict[Any, tuple[float, Any]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget all cached ``get_venues`` results."""
+        self._cache.clear()
 
+    @ttl_cache
     def get_venues(self) -> list[Venue]:
         """Get all available trading venues.
 
@@ -32,4 +54,4 @@ class VenuesAPI:
             ...     print(f"{venue.name}: {venue.label}")
         """
         data = self._http.get("/venues")
-        return [Venue.model_validate(v) for v in data]
+        return _VENUE_LIST.validate_python(data)
@@ -1,7 +1,10 @@
 """Main DFlow client for Python SDK."""
 
+import os
 from typing import Any, Literal
 
+import httpx
+
 from dflow.api.metadata import (
     EventsAPI,
     LiveDataAPI,
@@ -31,6 +34,7 @@ from dflow.utils.constants import (
     TRADE_API_BASE_URL,
     WEBSOCKET_URL,
 )
+from dflow.utils.diskcache import FileCache
 from dflow.utils.http import HttpClient
 from dflow.websocket import DFlowWebSocket
 
@@ -92,6 +96,11 @@ class DFlowClient:
         metadata_base_url: str | None = None,
         trade_base_url: str | None = None,
         ws_url: str | None = None,
+        transport: httpx.BaseTransport | None = None,
+        http2: bool = False,
+        cache_ttl: float | None = None,
+        max_retries: int = 0,
+        cache_dir: str | os.PathLike[str] | None = None,
     ):
         """Create a new DFlow client instance.
 
@@ -103,6 +112,21 @@ class DFlowClient:
             metadata_base_url: Custom base URL for the metadata API (overrides environment)
             trade_base_url: Custom base URL for the trade API (overrides environment)
             ws_url: Custom WebSocket URL (overrides environment)
+            transport: Custom httpx transport shared by all HTTP APIs (e.g.,
+                ``httpx.MockTransport`` for tests)
+            http2: Use HTTP/2 for all HTTP APIs, multiplexing concurrent
+                requests over one connection per host. Requires the ``h2``
+                package (``pip install dflow-sdk[http2]``).
+            cache_ttl: Seconds to cache slow-changing reference data (series,
+                tags, sports filters, tokens, venues, outcome mints). Defaults
+                to each API's own TTL (300s, or 60s for outcome mints). Use 0
+                to disable caching.
+            max_retries: Times to retry rate-limited (429) and transient 5xx
+                responses with backoff that honours ``Retry-After`` of up to
+                30 seconds (default: 0)
+            cache_dir: Directory for a persistent cache of finalized markets,
+                which never change, so ``markets.get_market`` can skip the
+                network across runs (default: None, no disk cache)
         """
         is_prod = environment == "production"
 
@@ -115,19 +139,29 @@ class DFlowClient:
         )
         websocket_url = ws_url or (PROD_WEBSOCKET_URL if is_prod else WEBSOCKET_URL)
 
-        self._metadata_http = HttpClient(metadata_url, api_key)
-        self._trade_http = HttpClient(trade_url, api_key)
-        self._proof_http = HttpClient(PROOF_API_BASE_URL, api_key)
+        http_options: dict[str, Any] = {
+            "transport": transport,
+            "http2": http2,
+            "max_retries": max_retries,
+        }
+        self._metadata_http = HttpClient(metadata_url, api_key, **http_options)
+        # Every HTTP client fans out on one shared thread pool
+        http_options["executor"] = self._metadata_http.executor
+        self._trade_http = HttpClient(trade_url, api_key, **http_options)
+        self._proof_http = HttpClient(PROOF_API_BASE_URL, api_key, **http_options)
+
+        ttl: dict[str, Any] = {} if cache_ttl is None else {"cache_ttl": cache_ttl}
 
         # Metadata APIs
         self.events = EventsAPI(self._metadata_http)
-        self.markets = MarketsAPI(self._metadata_http)
+        disk_cache = FileCache(cache_dir) if cache_dir is not None else None
+        self.markets = MarketsAPI(self._metadata_http, disk_cache=disk_cache, **ttl)
         self.orderbook = OrderbookAPI(self._metadata_http)
         self.trades = TradesAPI(self._metadata_http)
         self.live_data = LiveDataAPI(self._metadata_http)
-        self.series = SeriesAPI(self._metadata_http)
-        self.tags = TagsAPI(self._metadata_http)
-        self.sports = SportsAPI(self._metadata_http)
+        self.series = SeriesAPI(self._metadata_http, **ttl)
+        self.tags = TagsAPI(self._metadata_http, **ttl)
+        self.sports = SportsAPI(self._metadata_http, **ttl)
         self.search = SearchAPI(self._metadata_http)
 
         # Trade APIs
@@ -135,8 +169,8 @@ class DFlowClient:
         self.swap = SwapAPI(self._trade_http)
         self.intent = IntentAPI(self._trade_http)
         self.prediction_market = PredictionMarketAPI(self._trade_http)
-        self.tokens = TokensAPI(self._trade_http)
-        self.venues = VenuesAPI(self._trade_http)
+        self.tokens = TokensAPI(self._trade_http, **ttl)
+        self.venues = VenuesAPI(self._trade_http, **ttl)
 
         # Proof API
         self.proof = ProofAPI(self._proof_http)
@@ -173,9 +207,10 @@ class DFlowClient:
 
         Closes HTTP clients and disconnects WebSocket.
         """
-        self._metadata_http.close()
         self._trade_http.close()
         self._proof_http.close()
+        # Closed last because it owns the shared thread pool
+        self._metadata_http.close()
         self.ws.disconnect()
 
     def __enter__(self) -> "DFlowClient":
@@ -2,6 +2,8 @@
 
 from .positions import (
     calculate_scalar_payout,
+    calculate_scalar_payouts,
+    clear_mint_decimals,
     get_token_balances,
     get_user_positions,
     is_redemption_eligible,
@@ -19,7 +21,9 @@ __all__ = [
     "wait_for_confirmation_async",
     "sign_send_and_confirm",
     "get_token_balances",
+    "clear_mint_decimals",
     "get_user_positions",
     "is_redemption_eligible",
     "calculate_scalar_payout",
+    "calculate_scalar_payouts",
 ]
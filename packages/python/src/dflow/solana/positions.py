@@ -1,26 +1,102 @@
 """Position tracking utilities for DFlow SDK."""
 
+import logging
+import struct
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 from solana.rpc.api import Client
-from solana.rpc.types import TokenAccountOpts
+from solana.rpc.types import DataSliceOpts, TokenAccountOpts
 from solders.pubkey import Pubkey
 from spl.token.constants import TOKEN_2022_PROGRAM_ID, TOKEN_PROGRAM_ID
 
 from dflow.api.metadata.markets import MarketsAPI
-from dflow.types import Market, TokenBalance, UserPosition
+from dflow.types import Market, PositionType, TokenBalance, UserPosition
+
+logger = logging.getLogger(__name__)
+
+# Market and position for a wallet token that no fetched market claims
+_UNMATCHED_MINT: tuple[Market | None, PositionType] = (None, "UNKNOWN")
+
+# Start of an SPL token account (same for Token-2022): mint, owner, u64 amount
+_TOKEN_ACCOUNT_HEAD = struct.Struct("<32s32sQ")
+_TOKEN_ACCOUNT_SLICE = DataSliceOpts(offset=0, length=_TOKEN_ACCOUNT_HEAD.size)
+# The decimals byte of an SPL mint account
+_MINT_DECIMALS_SLICE = DataSliceOpts(offset=44, length=1)
+# getMultipleAccounts accepts at most 100 accounts per request
+_MAX_MULTIPLE_ACCOUNTS = 100
+
+# A mint's decimals never change, so lookups are kept for the process lifetime
+_mint_decimals: dict[str, int] = {}
+
+
+def clear_mint_decimals() -> None:
+    """Forget the mint decimals remembered by ``get_token_balances``.
+
+    Example:
+        >>> from dflow import clear_mint_decimals
+        >>>
+        >>> clear_mint_decimals()
+        >>> balances = get_token_balances(connection, wallet)  # refetches decimals
+    """
+    _mint_decimals.clear()
+
+
+def _fetch_token_accounts(
+    fetch: Callable[[Pubkey, TokenAccountOpts], Any],
+    wallet_address: Pubkey,
+    data_slice: DataSliceOpts | None = None,
+) -> list[Any]:
+    """Fetch a wallet's Token and Token-2022 accounts concurrently."""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        responses = pool.map(
+            lambda program_id: fetch(
+                wallet_address,
+                TokenAccountOpts(program_id=program_id, data_slice=data_slice),
+            ),
+            (TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID),
+        )
+        return [account for response in responses for account in response.value]
+
+
+def _get_mint_decimals(connection: Client, mints: list[str]) -> dict[str, int]:
+    """Look up decimals for mints, fetching only mints not seen before."""
+    missing = [m for m in dict.fromkeys(mints) if m not in _mint_decimals]
+    for start in range(0, len(missing), _MAX_MULTIPLE_ACCOUNTS):
+        batch = missing[start : start + _MAX_MULTIPLE_ACCOUNTS]
+        response = connection.get_multiple_accounts(
+            [Pubkey.from_string(m) for m in batch],
+            data_slice=_MINT_DECIMALS_SLICE,
+        )
+        for mint, account in zip(batch, response.value):
+            if account is not None and account.data:
+                _mint_decimals[mint] = account.data[0]
+    return {m: _mint_decimals[m] for m in mints if m in _mint_decimals}
 
 
 def get_token_balances(
     connection: Client,
     wallet_address: Pubkey,
+    parsed: bool = False,
 ) -> list[TokenBalance]:
     """Get all token balances for a wallet.
 
-    Queries both the standard Token Program and Token-2022 Program to find
-    all token holdings. Returns only tokens with non-zero balances.
+    Queries both the standard Token Program and Token-2022 Program (in
+    parallel) to find all token holdings. Returns only tokens with non-zero
+    balances.
+
+    By default only the first 72 bytes of each token account (mint, owner,
+    amount) are requested and unpacked directly, and mint decimals are looked
+    up once per mint and remembered. Pass ``parsed=True`` to request the RPC
+    node's ``jsonParsed`` encoding instead. Accounts whose data is shorter
+    than that layout are skipped and logged as a warning on the
+    ``dflow.solana.positions`` logger.
 
     Args:
         connection: Solana RPC connection
         wallet_address: Wallet public key to query
+        parsed: Use ``jsonParsed`` account data instead of raw account slices
 
     Returns:
         Array of token balances with mint, balance, and decimal info
@@ -37,20 +113,52 @@ def get_token_balances(
         >>> for token in balances:
         ...     print(f"{token.mint}: {token.balance} ({token.decimals} decimals)")
     """
-    # Query both Token Program and Token-2022 Program
-    token_accounts = connection.get_token_accounts_by_owner(
-        wallet_address,
-        TokenAccountOpts(program_id=TOKEN_PROGRAM_ID),
-    )
-    token_2022_accounts = connection.get_token_accounts_by_owner(
-        wallet_address,
-        TokenAccountOpts(program_id=TOKEN_2022_PROGRAM_ID),
+    if parsed:
+        return _get_parsed_token_balances(connection, wallet_address)
+
+    accounts = _fetch_token_accounts(
+        connection.get_token_accounts_by_owner, wallet_address, _TOKEN_ACCOUNT_SLICE
     )
 
-    all_accounts = list(token_accounts.value) + list(token_2022_accounts.value)
+    holdings: list[tuple[str, int]] = []
+    for account in accounts:
+        data = account.account.data
+        if len(data) < _TOKEN_ACCOUNT_HEAD.size:
+            logger.warning(
+                "Skipping token account %s: expected %d bytes of data, got %d",
+                account.pubkey,
+                _TOKEN_ACCOUNT_HEAD.size,
+                len(data),
+            )
+            continue
+        mint, _owner, amount = _TOKEN_ACCOUNT_HEAD.unpack_from(data)
+        if amount:
+            holdings.append((str(Pubkey.from_bytes(mint)), amount))
+
+    decimals = _get_mint_decimals(connection, [mint for mint, _ in holdings])
+    return [
+        TokenBalance(
+            mint=mint,
+            raw_balance=str(amount),
+            balance=amount / 10 ** decimals[mint],
+            decimals=decimals[mint],
+        )
+        for mint, amount in holdings
+        if mint in decimals
+    ]
+
+
+def _get_parsed_token_balances(
+    connection: Client,
+    wallet_address: Pubkey,
+) -> list[TokenBalance]:
+    """Get token balances from ``jsonParsed`` token accounts."""
+    accounts = _fetch_token_accounts(
+        connection.get_token_accounts_by_owner_json_parsed, wallet_address
+    )
 
     balances = []
-    for account in all_accounts:
+    for account in accounts:
         # Parse the account data
         try:
             data = account.account.data
@@ -82,6 +190,11 @@ def get_user_positions(
     Finds all prediction market outcome tokens in a wallet and enriches them
     with market data and position type (YES/NO).
 
+    Wallet mints are matched locally against the cached set from
+    ``markets_api.get_outcome_mint_set()``, so there is no per-call filter
+    request and no limit on how many tokens the wallet holds. Use
+    ``markets_api.filter_outcome_mints`` if you need the server to do the filtering.
+
     Args:
         connection: Solana RPC connection
         wallet_address: Wallet public key to query
@@ -110,52 +223,33 @@ def get_user_positions(
     if not token_balances:
         return []
 
-    all_mints = [t.mint for t in token_balances]
-    prediction_mints = markets_api.filter_outcome_mints(all_mints)
+    outcome_mint_set = markets_api.get_outcome_mint_set()
+    outcome_tokens = [t for t in token_balances if t.mint in outcome_mint_set]
 
-    if not prediction_mints:
+    if not outcome_tokens:
         return []
 
-    outcome_tokens = [t for t in token_balances if t.mint in prediction_mints]
-    markets = markets_api.get_markets_batch(mints=prediction_mints)
+    prediction_mints = list(dict.fromkeys(t.mint for t in outcome_tokens))
+    markets = markets_api.get_markets_batch(mints=prediction_mints, chunk=True)
 
-    # Build lookup map
-    markets_by_mint: dict[str, Market] = {}
+    # Map every market mint to its market and side once, so each token is a
+    # single lookup. YES is written last so it wins if a mint appears twice.
+    mint_index: dict[str, tuple[Market, PositionType]] = {}
     for m in markets:
         for account in m.accounts.values():
-            markets_by_mint[account.yes_mint] = m
-            markets_by_mint[account.no_mint] = m
-            markets_by_mint[account.market_ledger] = m
+            mint_index[account.market_ledger] = (m, "UNKNOWN")
+            mint_index[account.no_mint] = (m, "NO")
+            mint_index[account.yes_mint] = (m, "YES")
 
     positions = []
     for token in outcome_tokens:
-        market: Market | None = markets_by_mint.get(token.mint)
-
-        if not market:
-            positions.append(
-                UserPosition(
-                    mint=token.mint,
-                    balance=token.balance,
-                    decimals=token.decimals,
-                    position="UNKNOWN",
-                    market=None,
-                )
-            )
-            continue
-
-        is_yes_token = any(
-            account.yes_mint == token.mint for account in market.accounts.values()
-        )
-        is_no_token = any(
-            account.no_mint == token.mint for account in market.accounts.values()
-        )
-
+        market, side = mint_index.get(token.mint, _UNMATCHED_MINT)
         positions.append(
             UserPosition(
                 mint=token.mint,
                 balance=token.balance,
                 decimals=token.decimals,
-                position="YES" if is_yes_token else "NO" if is_no_token else "UNKNOWN",
+                position=side,
                 market=market,
             )
         )
@@ -244,3 +338,41 @@ def calculate_scalar_payout(
             return (amount * (10000 - account.scalar_outcome_pct)) / 10000
 
     return 0.0
+
+
+def calculate_scalar_payouts(
+    market: Market,
+    positions: Iterable[tuple[str, float]],
+) -> list[float]:
+    """Calculate scalar payouts for many positions in the same market.
+
+    Equivalent to calling ``calculate_scalar_payout`` for each position, but the
+    market's accounts are scanned once up front instead of once per position.
+
+    Args:
+        market: The market data
+        positions: ``(outcome_mint, amount)`` pairs for positions in ``market``
+
+    Returns:
+        The payout for each position, in input order (0.0 for unknown mints)
+
+    Example:
+        >>> from dflow import calculate_scalar_payouts
+        >>>
+        >>> held = [(p.mint, p.balance) for p in positions if p.market is market]
+        >>> total = sum(calculate_scalar_payouts(market, held))
+    """
+    # Payout numerator per mint; the first matching account wins, as in
+    # calculate_scalar_payout
+    shares: dict[str, int] = {}
+    for account in market.accounts.values():
+        pct = account.scalar_outcome_pct
+        if pct is None:
+            continue
+        shares.setdefault(account.yes_mint, pct)
+        shares.setdefault(account.no_mint, 10000 - pct)
+
+    return [
+        (amount * shares[mint]) / 10000 if mint in shares else 0.0
+        for mint, amount in positions
+    ]
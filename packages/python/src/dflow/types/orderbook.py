@@ -1,6 +1,11 @@
 """Orderbook types for DFlow SDK."""
 
-from pydantic import BaseModel, Field
+from operator import itemgetter
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+# Sorted levels with the bids dict and the length they were built from
+_LevelsCache = tuple[dict[str, int], int, tuple["OrderbookLevel", ...]]
 
 
 class OrderbookLevel(BaseModel):
@@ -10,36 +15,72 @@ class OrderbookLevel(BaseModel):
     quantity: float
 
 
+def _to_levels(bids: dict[str, int]) -> tuple[OrderbookLevel, ...]:
+    """Convert a price -> quantity dict to levels sorted by price, highest first."""
+    prices = sorted(
+        ((float(price), qty) for price, qty in bids.items()), key=itemgetter(0), reverse=True
+    )
+    return tuple(OrderbookLevel(price=price, quantity=qty) for price, qty in prices)
+
+
+def _cached_levels(bids: dict[str, int], cache: _LevelsCache | None) -> _LevelsCache:
+    """Reuse cached levels while ``bids`` is the same dict with the same length.
+
+    The check is O(1): holding a reference to the dict keeps its identity from
+    being reused, so reassigning the field or adding or removing a price level
+    triggers a rebuild.
+    """
+    if cache is not None and cache[0] is bids and cache[1] == len(bids):
+        return cache
+    return bids, len(bids), _to_levels(bids)
+
+
 class Orderbook(BaseModel):
     """Orderbook snapshot for a market.
 
     Note: The API returns bids as dicts mapping price strings to quantities.
     The `yes_bids` and `no_bids` represent buy orders for YES and NO tokens.
+
+    The sorted levels are cached. They are rebuilt when a bids dict is
+    replaced or gains or loses a price, but not when a quantity is changed in
+    place; reassign the dict (e.g. ``book.yes_bids = {**book.yes_bids, p: q}``)
+    to update an existing level.
     """
 
     yes_bids: dict[str, int] = Field(default_factory=dict, alias="yes_bids")
     no_bids: dict[str, int] = Field(default_factory=dict, alias="no_bids")
     sequence: int = 0
 
+    _yes_levels: _LevelsCache | None = PrivateAttr(default=None)
+    _no_levels: _LevelsCache | None = PrivateAttr(default=None)
+
     model_config = {"populate_by_name": True}
 
+    @property
+    def yes_levels(self) -> tuple[OrderbookLevel, ...]:
+        """YES bids as levels sorted by price, highest first.
+
+        Only rebuilt when ``yes_bids`` was replaced or resized since the last read.
+        """
+        self._yes_levels = _cached_levels(self.yes_bids, self._yes_levels)
+        return self._yes_levels[2]
+
+    @property
+    def no_levels(self) -> tuple[OrderbookLevel, ...]:
+        """NO bids as levels sorted by price, highest first.
+
+        Only rebuilt when ``no_bids`` was replaced or resized since the last read.
+        """
+        self._no_levels = _cached_levels(self.no_bids, self._no_levels)
+        return self._no_levels[2]
+
     def get_yes_levels(self) -> list[OrderbookLevel]:
         """Convert yes_bids dict to list of OrderbookLevel objects."""
-        return [
-            OrderbookLevel(price=float(price), quantity=float(qty))
-            for price, qty in sorted(
-                self.yes_bids.items(), key=lambda x: float(x[0]), reverse=True
-            )
-        ]
+        return list(self.yes_levels)
 
     def get_no_levels(self) -> list[OrderbookLevel]:
         """Convert no_bids dict to list of OrderbookLevel objects."""
-        return [
-            OrderbookLevel(price=float(price), quantity=float(qty))
-            for price, qty in sorted(
-                self.no_bids.items(), key=lambda x: float(x[0]), reverse=True
-            )
-        ]
+        return list(self.no_levels)
 
     @property
     def yes_bid(self) -> list[OrderbookLevel]:
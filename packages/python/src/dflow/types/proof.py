@@ -26,6 +26,8 @@ class DeepLinkParams(BaseModel):
         ...     redirect_uri="https://myapp.com/callback",
         ...     project_id="my-project"
         ... )
+
+    Instances are immutable and hashable, so they can be reused as cache keys.
     """
 
     wallet: str = Field(description="Solana wallet address to verify")
@@ -45,4 +47,4 @@ class DeepLinkParams(BaseModel):
         description="Optional partner project identifier",
     )
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
@@ -12,8 +12,12 @@ class WebSocketOptions(BaseModel):
 
     url: str | None = None
     reconnect: bool = True
-    reconnect_interval: float = 5.0
+    # Deprecated alias for reconnect_initial_s
+    reconnect_interval: float | None = None
     max_reconnect_attempts: int = 10
+    reconnect_initial_s: float = 1.0
+    reconnect_max_s: float = 60.0
+    reconnect_multiplier: float = 2.0
 
 
 class PriceLevel(BaseModel):
@@ -1,5 +1,6 @@
 """Utility modules for DFlow SDK."""
 
+from .circuit import CircuitBreaker, CircuitOpenError, get_circuit_breaker
 from .constants import (
     DEFAULT_SLIPPAGE_BPS,
     MAX_BATCH_SIZE,
@@ -17,10 +18,18 @@ from .constants import (
     USDC_MINT,
     WEBSOCKET_URL,
 )
-from .http import DFlowApiError, HttpClient
-from .pagination import collect_all, count_all, find_first, paginate, paginate_async
+from .http import AsyncHttpClient, DFlowApiError, HttpClient
+from .pagination import (
+    collect_all,
+    collect_all_raw,
+    count_all,
+    find_first,
+    paginate,
+    paginate_async,
+)
 from .retry import (
     create_retryable,
+    create_retryable_async,
     default_should_retry,
     with_retry,
     with_retry_async,
@@ -45,16 +54,23 @@ __all__ = [
     "PROOF_SIGNATURE_MESSAGE_PREFIX",
     # HTTP
     "HttpClient",
+    "AsyncHttpClient",
     "DFlowApiError",
     # Retry
     "with_retry",
     "with_retry_async",
     "create_retryable",
+    "create_retryable_async",
     "default_should_retry",
+    # Circuit breaker
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "get_circuit_breaker",
     # Pagination
     "paginate",
     "paginate_async",
     "collect_all",
+    "collect_all_raw",
     "count_all",
     "find_first",
 ]
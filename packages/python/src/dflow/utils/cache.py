@@ -0,0 +1,84 @@
+"""TTL caching for slow-changing DFlow API endpoints."""
+
+import functools
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Maximum number of argument combinations remembered per API instance
+TTL_CACHE_MAX_SIZE = 128
+
+# Guards lookups, evictions and inserts; the wrapped call runs outside it
+_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert list, tuple, set and dict arguments into hashable equivalents."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+def ttl_cache(method: F) -> F:
+    """Cache an API method's results on its instance for ``self._cache_ttl`` seconds.
+
+    The instance must define ``_cache_ttl`` (seconds, 0 disables caching) and a
+    ``_cache`` dict. Results are keyed by method name and arguments; list and
+    dict arguments are frozen into tuples, and calls with other unhashable
+    arguments are passed through uncached. Lists are returned as shallow
+    copies so callers cannot mutate the cached value.
+
+    Example:
+        >>> class TokensAPI:
+        ...     def __init__(self, http, cache_ttl=300.0):
+        ...         self._http = http
+        ...         self._cache_ttl = cache_ttl
+        ...         self._cache = {}
+        ...
+        ...     @ttl_cache
+        ...     def get_tokens(self):
+        ...         return self._http.get("/tokens")
+
+    Args:
+        method: API method to cache
+
+    Returns:
+        Wrapped method that serves fresh cached results without calling ``method``
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        ttl = self._cache_ttl
+        if ttl <= 0:
+            return method(self, *args, **kwargs)
+
+        cache: dict[Any, tuple[float, Any]] = self._cache
+        try:
+            key = (name, _freeze(args), _freeze(kwargs))
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+        now = time.monotonic()
+        with _lock:
+            hit = cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            value = hit[1]
+        else:
+            value = method(self, *args, **kwargs)
+            with _lock:
+                if key not in cache and len(cache) >= TTL_CACHE_MAX_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    cache.pop(next(iter(cache)), None)
+                cache[key] = (now, value)
+        return list(value) if isinstance(value, list) else value
+
+    return cast(F, wrapper)
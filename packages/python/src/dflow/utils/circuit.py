@@ -0,0 +1,180 @@
+"""Circuit breaker for failing fast during persistent outages."""
+
+import threading
+import time
+from collections import deque
+from typing import Literal
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because its circuit is open.
+
+    Example:
+        >>> try:
+        ...     markets = with_retry(fetch_markets, breaker_key="metadata")
+        ... except CircuitOpenError as e:
+        ...     print(f"Backend {e.key} is unavailable, try again later")
+    """
+
+    def __init__(self, key: str):
+        """Create a new circuit open error.
+
+        Args:
+            key: Key of the circuit breaker that rejected the call
+        """
+        super().__init__(f"Circuit '{key}' is open")
+        self.key = key
+
+
+class CircuitBreaker:
+    """Closed -> open -> half-open state machine guarding a backend.
+
+    While closed, calls pass through and their outcomes are recorded in a
+    sliding window. Once the window holds at least ``failure_threshold``
+    failures and the failure rate reaches ``error_rate``, the circuit opens
+    and rejects calls for ``cooldown_s`` seconds. After the cooldown a single
+    probe is admitted (half-open): success closes the circuit, failure
+    re-opens it.
+
+    Safe to share between threads and coroutines; no state transition awaits.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=5, cooldown_s=30.0)
+        >>> if breaker.allow():
+        ...     try:
+        ...         result = call_backend()
+        ...         breaker.on_success()
+        ...     except ConnectionError:
+        ...         breaker.on_failure()
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 20,
+        error_rate: float = 0.5,
+        cooldown_s: float = 10.0,
+        window_size: int = 100,
+    ):
+        """Create a new circuit breaker.
+
+        Args:
+            failure_threshold: Minimum failures in the window before opening (default: 20)
+            error_rate: Failure rate in the window required to open (default: 0.5)
+            cooldown_s: Seconds to reject calls before admitting a probe (default: 10.0)
+            window_size: Number of recent outcomes tracked (default: 100)
+        """
+        self.failure_threshold = failure_threshold
+        self.error_rate = error_rate
+        self.cooldown_s = cooldown_s
+
+        self._lock = threading.Lock()
+        self._state: CircuitState = "closed"
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current circuit state."""
+        return self._state
+
+    def allow(self) -> bool:
+        """Check whether a call may proceed.
+
+        Returns:
+            True if the call should be attempted, False if it should fail fast
+        """
+        with self._lock:
+            if self._state == "closed":
+                return True
+
+            if self._state == "open":
+                if time.monotonic() - self._opened_at < self.cooldown_s:
+                    return False
+                self._state = "half_open"
+                self._probe_in_flight = False
+
+            # Half-open: admit a single probe
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def on_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            if self._state == "half_open":
+                self._reset()
+                return
+            self._record(False)
+
+    def on_failure(self) -> None:
+        """Record a failed call."""
+        with self._lock:
+            if self._state == "half_open":
+                self._trip()
+                return
+            self._record(True)
+            if (
+                self._state == "closed"
+                and self._failures >= self.failure_threshold
+                and self._failures / len(self._outcomes) >= self.error_rate
+            ):
+                self._trip()
+
+    def release(self) -> None:
+        """Abandon an admitted call without recording an outcome.
+
+        Use when a call is interrupted (e.g. cancelled) before the backend
+        answered, so a half-open probe slot is freed for the next caller.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _record(self, failed: bool) -> None:
+        """Append an outcome to the sliding window."""
+        outcomes = self._outcomes
+        if len(outcomes) == outcomes.maxlen and outcomes[0]:
+            self._failures -= 1
+        outcomes.append(failed)
+        if failed:
+            self._failures += 1
+
+    def _trip(self) -> None:
+        """Open the circuit."""
+        self._state = "open"
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def _reset(self) -> None:
+        """Close the circuit and clear recorded outcomes."""
+        self._state = "closed"
+        self._outcomes.clear()
+        self._failures = 0
+        self._probe_in_flight = False
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(key: str) -> CircuitBreaker:
+    """Get the shared circuit breaker for a key, creating it on first use.
+
+    Retry helpers called with the same ``breaker_key`` share one breaker, so
+    concurrent callers of a failing backend stop retrying together.
+
+    Args:
+        key: Identifier of the guarded backend (e.g., "metadata")
+
+    Returns:
+        The circuit breaker registered under the key
+    """
+    breaker = _breakers.get(key)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(key, CircuitBreaker())
+    return breaker
@@ -0,0 +1,43 @@
+"""JSON encoding helpers for DFlow SDK.
+
+Uses ``orjson`` when it is installed (``pip install dflow-sdk[fast]``) and
+falls back to the standard library ``json`` module otherwise.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document from text or raw bytes.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
@@ -0,0 +1,73 @@
+"""On-disk JSON cache for API responses that never change."""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .codec import json_dumps, json_loads
+
+
+class FileCache:
+    """Store JSON-serializable values as files in a directory.
+
+    Each key is stored in its own file named by the key's SHA-256 hash, so
+    entries survive process restarts. Writes go to a temporary file that is
+    renamed into place, so concurrent readers never see a partial entry.
+    Unreadable or corrupt entries are treated as misses.
+
+    Example:
+        >>> cache = FileCache("~/.cache/dflow")
+        >>> cache.set("market:BTCD-25DEC0313-T92749.99", {"ticker": "..."})
+        >>> cache.get("market:BTCD-25DEC0313-T92749.99")
+        {'ticker': '...'}
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]):
+        """Create a file cache.
+
+        Args:
+            directory: Directory to store entries in (created if missing)
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        """Return the file that stores ``key``."""
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str) -> Any | None:
+        """Return the value stored for ``key``, or None if there is none.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The stored value, or None on a miss
+        """
+        try:
+            return json_loads(self._path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` for ``key``, replacing any existing entry.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json_dumps(value))
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def clear(self) -> None:
+        """Delete all stored entries."""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
@@ -1,9 +1,32 @@
 """HTTP client for DFlow API requests."""
 
+import asyncio
+import functools
+import ssl
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
 
+from .codec import json_dumps, json_loads
+
+# Worker threads in the pool HttpClient uses for concurrent fan-out requests
+_EXECUTOR_MAX_WORKERS = 16
+
+
+@functools.cache
+def _ssl_context() -> ssl.SSLContext:
+    """Return the process-wide default SSL context.
+
+    Loading the CA bundle takes tens of milliseconds, so it is done once and
+    shared by every client instead of once per ``httpx`` client.
+    """
+    return httpx.create_ssl_context()
+
 
 class DFlowApiError(Exception):
     """Custom error class for DFlow API errors.
@@ -19,17 +42,105 @@ class DFlowApiError(Exception):
         ...     print(f"Response: {e.response}")
     """
 
-    def __init__(self, message: str, status_code: int, response: Any = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        response: Any = None,
+        retry_after: float | None = None,
+        idempotent: bool = True,
+    ):
         """Create a new API error.
 
         Args:
             message: Error message
             status_code: HTTP status code from the response
             response: Parsed response body (if available)
+            retry_after: Seconds to wait before retrying, from the
+                ``Retry-After`` response header (if present)
+            idempotent: Whether the failed request is safe to repeat. False for
+                POST requests sent without an ``Idempotency-Key`` header.
         """
         super().__init__(message)
         self.status_code = status_code
         self.response = response
+        self.retry_after = retry_after
+        self.idempotent = idempotent
+
+
+def _is_idempotent(request: httpx.Request) -> bool:
+    """Check whether a request can be safely repeated."""
+    return request.method != "POST" or "Idempotency-Key" in request.headers
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delay-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def _build_headers(api_key: str | None, extra: dict[str, str]) -> dict[str, str]:
+    """Build request headers including auth if available."""
+    headers = {
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        **extra,
+    }
+    if api_key:
+        headers["x-api-key"] = api_key
+    return headers
+
+
+def _clean_params(params: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Drop query parameters whose value is None."""
+    return {k: v for k, v in params.items() if v is not None} if params else None
+
+
+def _request_key(path: str, params: dict[str, Any] | None) -> tuple[Any, ...]:
+    """Build a hashable key identifying a GET request."""
+    if not params:
+        return (path,)
+    return (
+        path,
+        *sorted(
+            (k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()
+        ),
+    )
+
+
+def _handle_response(response: httpx.Response) -> Any:
+    """Handle API response, raising errors for non-2xx status codes."""
+    if not response.is_success:
+        try:
+            error_body = json_loads(response.content)
+        except Exception:
+            error_body = response.text
+
+        raise DFlowApiError(
+            f"HTTP {response.status_code}: {response.reason_phrase}",
+            response.status_code,
+            error_body,
+            retry_after=_parse_retry_after(response.headers.get("Retry-After")),
+            idempotent=_is_idempotent(response.request),
+        )
+
+    try:
+        return json_loads(response.content)
+    except Exception:
+        raise DFlowApiError(
+            "Failed to parse response as JSON",
+            response.status_code,
+            response.text,
+        )
 
 
 class HttpClient:
@@ -45,6 +156,10 @@ class HttpClient:
         api_key: str | None = None,
         headers: dict[str, str] | None = None,
         timeout: float = 30.0,
+        transport: httpx.BaseTransport | None = None,
+        http2: bool = False,
+        max_retries: int = 0,
+        executor: ThreadPoolExecutor | None = None,
     ):
         """Create a new HTTP client.
 
@@ -53,31 +168,67 @@ class HttpClient:
             api_key: Optional API key for authenticated requests
             headers: Optional additional headers to include in all requests
             timeout: Request timeout in seconds (default: 30.0)
+            transport: Optional httpx transport (e.g., ``httpx.MockTransport``
+                for testing). Defaults to httpx's network transport.
+            http2: Negotiate HTTP/2 so concurrent requests share one connection.
+                Requires the ``h2`` package (``pip install dflow-sdk[http2]``).
+            max_retries: Times to retry rate-limited (429) and transient 5xx
+                responses, and failed connection attempts, using ``with_retry``
+                backoff that honours ``Retry-After`` (default: 0, no retries)
+            executor: Thread pool to run concurrent requests on, shared with
+                other clients. Defaults to a pool owned (and shut down) by this
+                client, created on first use.
         """
         # Ensure base_url ends with /
         self.base_url = base_url.rstrip("/") + "/"
         self.api_key = api_key
         self._default_headers = headers or {}
+        self.http2 = http2
+        self.max_retries = max_retries
+        # In-flight GETs by request key, so concurrent duplicates share one call
+        self._inflight: dict[tuple[Any, ...], Future[Any]] = {}
+        self._inflight_lock = threading.Lock()
+        self._executor = executor
+        self._owns_executor = executor is None
         self._client = httpx.Client(
             base_url=self.base_url,
             headers=self._build_headers(),
             timeout=timeout,
+            verify=_ssl_context(),
+            transport=transport,
+            http2=http2,
         )
 
     def _build_headers(self) -> dict[str, str]:
         """Build request headers including auth if available."""
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            **self._default_headers,
-        }
-        if self.api_key:
-            headers["x-api-key"] = self.api_key
-        return headers
+        return _build_headers(self.api_key, self._default_headers)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool for issuing requests concurrently (e.g., batch fan-out)."""
+        if self._executor is None:
+            with self._inflight_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=_EXECUTOR_MAX_WORKERS, thread_name_prefix="dflow"
+                    )
+        return self._executor
+
+    def _send(self, request: Callable[[], Any]) -> Any:
+        """Run a request, retrying transient failures if ``max_retries`` is set."""
+        if not self.max_retries:
+            return request()
+        # Imported here because the retry module imports DFlowApiError from this one
+        from .retry import with_retry
+
+        return with_retry(request, max_retries=self.max_retries)
 
     def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
         """Make a GET request.
 
+        Identical GETs issued concurrently from several threads are coalesced:
+        only the first is sent and the others wait for and share its result.
+
         Args:
             path: API endpoint path
             params: Optional query parameters
@@ -90,12 +241,64 @@ class HttpClient:
         """
         # Clean path and filter None params
         clean_path = path.lstrip("/")
-        clean_params = (
-            {k: v for k, v in params.items() if v is not None} if params else None
-        )
+        clean_params = _clean_params(params)
+        key = _request_key(clean_path, clean_params)
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+        if not is_leader:
+            return future.result()
 
-        response = self._client.get(clean_path, params=clean_params)
-        return self._handle_response(response)
+        try:
+            result = self._send(
+                lambda: _handle_response(self._client.get(clean_path, params=clean_params))
+            )
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def get_conditional(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        etag: str | None = None,
+    ) -> tuple[Any, str | None]:
+        """Make a GET request revalidated with an ETag.
+
+        Args:
+            path: API endpoint path
+            params: Optional query parameters
+            etag: ETag of a previously fetched response, sent as ``If-None-Match``
+
+        Returns:
+            Tuple of (parsed JSON response, or None if the server answered
+            ``304 Not Modified``; ETag of the response, if any)
+
+        Raises:
+            DFlowApiError: If the request fails
+        """
+        headers = {"If-None-Match": etag} if etag else None
+
+        def request() -> tuple[Any, str | None]:
+            response = self._client.get(
+                path.lstrip("/"), params=_clean_params(params), headers=headers
+            )
+            new_etag = response.headers.get("ETag")
+            if response.status_code == 304:
+                return None, new_etag or etag
+            return _handle_response(response), new_etag
+
+        result: tuple[Any, str | None] = self._send(request)
+        return result
 
     def post(self, path: str, json: Any = None) -> Any:
         """Make a POST request.
@@ -110,32 +313,10 @@ class HttpClient:
         Raises:
             DFlowApiError: If the request fails
         """
-        clean_path = path.lstrip("/")
-        response = self._client.post(clean_path, json=json)
-        return self._handle_response(response)
-
-    def _handle_response(self, response: httpx.Response) -> Any:
-        """Handle API response, raising errors for non-2xx status codes."""
-        if not response.is_success:
-            try:
-                error_body = response.json()
-            except Exception:
-                error_body = response.text
-
-            raise DFlowApiError(
-                f"HTTP {response.status_code}: {response.reason_phrase}",
-                response.status_code,
-                error_body,
-            )
-
-        try:
-            return response.json()
-        except Exception:
-            raise DFlowApiError(
-                "Failed to parse response as JSON",
-                response.status_code,
-                response.text,
-            )
+        body = json_dumps(json) if json is not None else None
+        return self._send(
+            lambda: _handle_response(self._client.post(path.lstrip("/"), content=body))
+        )
 
     def set_api_key(self, api_key: str) -> None:
         """Update the API key for subsequent requests.
@@ -144,19 +325,163 @@ class HttpClient:
             api_key: New API key to use
         """
         self.api_key = api_key
-        # Rebuild client with new headers
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            headers=self._build_headers(),
-            timeout=self._client.timeout,
-        )
+        # Swap headers in place so pooled connections (and HTTP/2 sessions) survive
+        self._client.headers = self._build_headers()
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and shut down its own thread pool."""
         self._client.close()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
 
     def __enter__(self) -> "HttpClient":
         return self
 
     def __exit__(self, *args: Any) -> None:
         self.close()
+
+
+class AsyncHttpClient:
+    """Async HTTP client for making API requests concurrently.
+
+    Mirrors HttpClient on top of ``httpx.AsyncClient`` so independent requests
+    can be awaited together instead of one after another.
+
+    Example:
+        >>> import asyncio
+        >>> from dflow import AsyncHttpClient, METADATA_API_BASE_URL, Market
+        >>>
+        >>> async def fetch_markets(tickers):
+        ...     async with AsyncHttpClient(METADATA_API_BASE_URL) as http:
+        ...         data = await asyncio.gather(*(http.get(f"/market/{t}") for t in tickers))
+        ...     return [Market.model_validate(d) for d in data]
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+        http2: bool = False,
+        max_retries: int = 0,
+    ):
+        """Create a new async HTTP client.
+
+        Args:
+            base_url: Base URL for API requests
+            api_key: Optional API key for authenticated requests
+            headers: Optional additional headers to include in all requests
+            timeout: Request timeout in seconds (default: 30.0)
+            transport: Optional httpx async transport (e.g.,
+                ``httpx.MockTransport`` for testing)
+            http2: Negotiate HTTP/2 so concurrent requests share one connection.
+                Requires the ``h2`` package (``pip install dflow-sdk[http2]``).
+            max_retries: Times to retry rate-limited (429) and transient 5xx
+                responses, and failed connection attempts, using
+                ``with_retry_async`` backoff (default: 0, no retries)
+        """
+        self.base_url = base_url.rstrip("/") + "/"
+        self.api_key = api_key
+        self._default_headers = headers or {}
+        # In-flight GETs by request key, so concurrent duplicates share one call
+        self._inflight: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+        self.max_retries = max_retries
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=_build_headers(api_key, self._default_headers),
+            timeout=timeout,
+            verify=_ssl_context(),
+            transport=transport,
+            http2=http2,
+        )
+
+    async def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Make a GET request.
+
+        Identical GETs awaited concurrently are coalesced: only the first is
+        sent and the others share its result.
+
+        Args:
+            path: API endpoint path
+            params: Optional query parameters
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            DFlowApiError: If the request fails
+        """
+        clean_path = path.lstrip("/")
+        clean_params = _clean_params(params)
+        key = _request_key(clean_path, clean_params)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._get(clean_path, clean_params))
+            self._inflight[key] = task
+
+            def _finished(done: asyncio.Task[Any]) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+                # Retrieve the error so it is not reported as unhandled when
+                # every waiter was cancelled before the request finished
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(_finished)
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _send(self, request: Callable[[], Awaitable[httpx.Response]]) -> Any:
+        """Send a request and parse it, retrying if ``max_retries`` is set."""
+
+        async def attempt() -> Any:
+            return _handle_response(await request())
+
+        if not self.max_retries:
+            return await attempt()
+        # Imported here because the retry module imports DFlowApiError from this one
+        from .retry import with_retry_async
+
+        return await with_retry_async(attempt, max_retries=self.max_retries)
+
+    async def _get(self, path: str, params: dict[str, Any] | None) -> Any:
+        """Send a GET request and parse the response."""
+        return await self._send(lambda: self._client.get(path, params=params))
+
+    async def post(self, path: str, json: Any = None) -> Any:
+        """Make a POST request.
+
+        Args:
+            path: API endpoint path
+            json: Optional request body (will be JSON serialized)
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            DFlowApiError: If the request fails
+        """
+        body = json_dumps(json) if json is not None else None
+        return await self._send(lambda: self._client.post(path.lstrip("/"), content=body))
+
+    def set_api_key(self, api_key: str) -> None:
+        """Update the API key for subsequent requests.
+
+        Args:
+            api_key: New API key to use
+        """
+        self.api_key = api_key
+        self._client.headers = _build_headers(api_key, self._default_headers)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
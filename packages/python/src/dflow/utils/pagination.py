@@ -1,7 +1,10 @@
 """Pagination utilities for DFlow API responses."""
 
-from collections.abc import AsyncGenerator, Callable, Generator
-from typing import Any, TypeVar
+from collections.abc import AsyncGenerator, Callable, Generator, Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
 
 T = TypeVar("T")
 TResponse = TypeVar("TResponse")
@@ -50,7 +53,7 @@ def paginate(
             return getattr(r, "cursor", None)
 
     cursor: str | None = None
-    items_yielded = 0
+    remaining = max_items
 
     while True:
         params: dict[str, Any] = {}
@@ -62,12 +65,13 @@ def paginate(
         response = fetch_page(params)
         items = get_items(response)
 
-        for item in items:
-            yield item
-            items_yielded += 1
-
-            if max_items is not None and items_yielded >= max_items:
+        # Count per page rather than per item
+        if remaining is not None:
+            if len(items) >= remaining:
+                yield from items[:remaining]
                 return
+            remaining -= len(items)
+        yield from items
 
         cursor = get_cursor(response)
         if not cursor:
@@ -114,6 +118,93 @@ def collect_all(
     )
 
 
+def collect_all_raw(
+    fetch_page: Callable[[dict[str, Any]], TResponse],
+    get_items: Callable[[TResponse], list[Any]],
+    item_type: type[T],
+    get_cursor: Callable[[TResponse], str | None] | None = None,
+    max_items: int | None = None,
+    page_size: int | None = None,
+) -> list[T]:
+    """Collect raw items from a paginated endpoint and validate them in one pass.
+
+    Use this when ``fetch_page`` returns raw JSON (for example from
+    ``HttpClient.get``). All pages are gathered first and then validated as a
+    single ``list[item_type]``, which is cheaper than validating each page or
+    item separately.
+
+    Example:
+        >>> from dflow import HttpClient, METADATA_API_BASE_URL, Trade
+        >>> from dflow.utils import collect_all_raw
+        >>>
+        >>> http = HttpClient(METADATA_API_BASE_URL)
+        >>> trades = collect_all_raw(
+        ...     lambda params: http.get("/trades", params),
+        ...     get_items=lambda r: r["trades"],
+        ...     item_type=Trade,
+        ... )
+
+    Args:
+        fetch_page: Function that fetches a raw page given pagination params
+        get_items: Function to extract the raw items array from a page
+        item_type: Type to validate each item as (e.g. a pydantic model)
+        get_cursor: Function to extract cursor from response (default:
+            ``r["cursor"]`` for dict pages, ``r.cursor`` otherwise)
+        max_items: Maximum number of items to fetch in total
+        page_size: Number of items per page
+
+    Returns:
+        List of validated items
+
+    Raises:
+        pydantic.ValidationError: If any item fails validation
+    """
+    if get_cursor is None:
+
+        def get_cursor(r: Any) -> str | None:
+            if isinstance(r, Mapping):
+                return r.get("cursor")
+            return getattr(r, "cursor", None)
+
+    buf: list[Any] = []
+    cursor: str | None = None
+
+    while True:
+        params: dict[str, Any] = {}
+        if cursor:
+            params["cursor"] = cursor
+        if page_size:
+            params["limit"] = page_size
+
+        response = fetch_page(params)
+        buf.extend(get_items(response))
+
+        if max_items is not None and len(buf) >= max_items:
+            del buf[max_items:]
+            break
+        cursor = get_cursor(response)
+        if not cursor:
+            break
+
+    result: list[T] = _list_adapter(item_type).validate_python(buf)
+    return result
+
+
+# ``list[item_type]`` validators built by collect_all_raw, keyed by item type
+_list_adapters: dict[Any, "TypeAdapter[list[Any]]"] = {}
+
+
+def _list_adapter(item_type: Any) -> "TypeAdapter[list[Any]]":
+    """Get the ``list[item_type]`` validator, building it on first use."""
+    adapter = _list_adapters.get(item_type)
+    if adapter is None:
+        # Imported here so dflow.utils does not pull in pydantic at import time
+        from pydantic import TypeAdapter
+
+        adapter = _list_adapters[item_type] = TypeAdapter(list[item_type])
+    return adapter
+
+
 def count_all(
     fetch_page: Callable[[dict[str, Any]], TResponse],
     get_items: Callable[[TResponse], list[T]],
@@ -221,7 +312,7 @@ async def paginate_async(
             return getattr(r, "cursor", None)
 
     cursor: str | None = None
-    items_yielded = 0
+    remaining = max_items
 
     while True:
         params: dict[str, Any] = {}
@@ -233,13 +324,19 @@ async def paginate_async(
         response = await fetch_page(params)
         items = get_items(response)
 
+        done = False
+        if remaining is not None:
+            if len(items) >= remaining:
+                items = items[:remaining]
+                done = True
+            else:
+                remaining -= len(items)
+
         for item in items:
             yield item
-            items_yielded += 1
-
-            if max_items is not None and items_yielded >= max_items:
-                return
 
+        if done:
+            return
         cursor = get_cursor(response)
         if not cursor:
             break
@@ -2,16 +2,41 @@
 
 import asyncio
 import random
+import time
+import warnings
 from collections.abc import Awaitable, Callable
-from typing import Any, TypeVar
+from functools import lru_cache
+from typing import Any, Literal, TypeVar, cast
 
-from .http import DFlowApiError
+import httpx
+
+from .circuit import CircuitBreaker, CircuitOpenError, get_circuit_breaker
+from .http import DFlowApiError, _is_idempotent
 
 T = TypeVar("T")
 
+_sleep = time.sleep
+_async_sleep = asyncio.sleep
+
+# Jitter strategy applied to the capped exponential delay.
+# - "full": uniform in [0, delay] (default, best spread under contention)
+# - "equal": delay / 2 plus uniform in [0, delay / 2]
+# - "none": deterministic delay
+JitterMode = Literal["full", "equal", "none"]
+
+
+# Status codes that indicate a transient failure worth retrying.
+_RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
 
 def default_should_retry(error: Exception, attempt: int) -> bool:
-    """Default retry condition: retry on rate limits (429) or server errors (5xx).
+    """Default retry condition: retry on timeouts, rate limits, and transient server errors.
+
+    API errors and httpx transport errors (failed connections, timeouts) are
+    only retried for idempotent requests. A POST that failed with a 5xx may
+    already have been applied (e.g. an order submitted), so it is not repeated
+    unless it was sent with an ``Idempotency-Key`` header. Pass a custom
+    ``should_retry`` to opt in for other POST endpoints.
 
     Args:
         error: The exception that was raised
@@ -21,14 +46,96 @@ def default_should_retry(error: Exception, attempt: int) -> bool:
         True if the operation should be retried
     """
     if isinstance(error, DFlowApiError):
-        # Retry on rate limit (429) or server errors (5xx)
-        return error.status_code == 429 or error.status_code >= 500
+        return error.status_code in _RETRYABLE_STATUS_CODES and error.idempotent
+
+    if isinstance(error, httpx.TransportError):
+        return _transport_error_idempotent(error)
 
     # Retry on connection errors
-    if isinstance(error, (ConnectionError, TimeoutError)):
-        return True
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+def _transport_error_idempotent(error: httpx.TransportError) -> bool:
+    """Check whether the request behind a transport error is safe to repeat."""
+    try:
+        request = error.request
+    except RuntimeError:  # Raised without a request attached
+        return False
+    return _is_idempotent(request)
+
+
+def _is_backend_failure(error: Exception) -> bool:
+    """Check whether an error indicates the backend itself is unhealthy."""
+    if isinstance(error, DFlowApiError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, (ConnectionError, TimeoutError, httpx.TransportError))
+
+
+def _record_failure(breaker: CircuitBreaker | None, error: Exception) -> None:
+    """Feed an error into a circuit breaker (if any).
+
+    Only rate limits, server errors, and connection failures count against the
+    backend; other errors prove it is reachable and count as successes.
+    """
+    if breaker is None:
+        return
+    if _is_backend_failure(error):
+        breaker.on_failure()
+    else:
+        breaker.on_success()
 
-    return False
+
+def _retry_delay(
+    error: Exception, delay: float, jitter: JitterMode, max_delay_ms: int
+) -> float | None:
+    """Pick the backoff delay for an error.
+
+    A server-advertised ``Retry-After`` takes precedence: the wait is never
+    shorter than it, with up to 10% extra jitter so clients told the same
+    deadline do not all return at once. A ``Retry-After`` longer than
+    ``max_delay_ms`` is not waited out.
+
+    Returns:
+        Delay in seconds, or None if the caller should stop retrying
+    """
+    computed = _apply_jitter(delay, jitter)
+    retry_after: float | None = getattr(error, "retry_after", None)
+    if retry_after is None:
+        return computed
+    if retry_after * 1000 > max_delay_ms:
+        return None
+    return max(retry_after, computed) * random.uniform(1.0, 1.1)
+
+
+@lru_cache(maxsize=64)
+def _delay_schedule(
+    max_retries: int,
+    initial_delay_ms: int,
+    max_delay_ms: int,
+    backoff_multiplier: float,
+) -> tuple[float, ...]:
+    """Build the capped exponential delay for each retry attempt.
+
+    The schedule only depends on the retry options, so it is cached and shared
+    by every call (and every ``create_retryable`` wrapper) using the same options.
+
+    Returns:
+        Tuple of delays in seconds, indexed by attempt number
+    """
+    return tuple(
+        min(initial_delay_ms * (backoff_multiplier**attempt), max_delay_ms) / 1000
+        for attempt in range(max_retries)
+    )
+
+
+def _apply_jitter(delay: float, jitter: JitterMode) -> float:
+    """Spread a delay across the backoff window to prevent thundering herd."""
+    if jitter == "full":
+        return random.random() * delay
+    if jitter == "equal":
+        half = delay / 2
+        return half + random.random() * half
+    return delay
 
 
 def _calculate_delay(
@@ -36,6 +143,7 @@ def _calculate_delay(
     initial_delay_ms: int,
     max_delay_ms: int,
     backoff_multiplier: float,
+    jitter: JitterMode = "full",
 ) -> float:
     """Calculate delay with exponential backoff and jitter.
 
@@ -44,15 +152,13 @@ def _calculate_delay(
         initial_delay_ms: Initial delay in milliseconds
         max_delay_ms: Maximum delay in milliseconds
         backoff_multiplier: Multiplier for exponential backoff
+        jitter: Jitter strategy (default: "full")
 
     Returns:
         Delay in seconds
     """
-    exponential_delay = initial_delay_ms * (backoff_multiplier**attempt)
-    delay_with_cap = min(exponential_delay, max_delay_ms)
-    # Add jitter (0-25% of delay) to prevent thundering herd
-    jitter = delay_with_cap * random.random() * 0.25
-    return (delay_with_cap + jitter) / 1000  # Convert to seconds
+    delays = _delay_schedule(attempt + 1, initial_delay_ms, max_delay_ms, backoff_multiplier)
+    return _apply_jitter(delays[attempt], jitter)
 
 
 def with_retry(
@@ -62,9 +168,17 @@ def with_retry(
     max_delay_ms: int = 30000,
     backoff_multiplier: float = 2.0,
     should_retry: Callable[[Exception, int], bool] | None = None,
+    jitter: JitterMode = "full",
+    breaker_key: str | None = None,
 ) -> T:
     """Execute a function with automatic retry on failure using exponential backoff.
 
+    If the error carries a ``retry_after`` (parsed from the ``Retry-After``
+    header), the wait is at least that long, overriding a shorter backoff.
+    When it exceeds ``max_delay_ms`` the error is raised right away instead of
+    waiting, even if retries remain: with the default 30000 ms cap, a
+    ``Retry-After: 31`` response is raised on the first attempt.
+
     Example:
         >>> from dflow.utils import with_retry
         >>>
@@ -85,34 +199,69 @@ def with_retry(
         max_delay_ms: Maximum delay in milliseconds between retries (default: 30000)
         backoff_multiplier: Multiplier for exponential backoff (default: 2.0)
         should_retry: Function to determine if an error should trigger a retry
+        jitter: Jitter strategy: "full", "equal", or "none" (default: "full")
+        breaker_key: Optional key of a shared circuit breaker. Calls using the
+            same key stop hitting the backend once it is known to be failing.
 
     Returns:
         The result of the function
 
     Raises:
+        CircuitOpenError: If the circuit for ``breaker_key`` is open
         The last error if all retries are exhausted
+
+    Note:
+        This function blocks the calling thread while backing off. Inside a
+        running event loop use ``with_retry_async`` instead, otherwise every
+        backoff stalls the whole loop. A ``RuntimeWarning`` is emitted when a
+        running loop is detected.
     """
-    import time
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        warnings.warn(
+            "with_retry() called from a running event loop; its backoff blocks the "
+            "loop. Use with_retry_async() instead.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
 
     retry_check = should_retry or default_should_retry
+    delays = _delay_schedule(max_retries, initial_delay_ms, max_delay_ms, backoff_multiplier)
+    breaker = get_circuit_breaker(breaker_key) if breaker_key else None
     last_error: Exception | None = None
 
     for attempt in range(max_retries + 1):
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(cast(str, breaker_key)) from last_error
+
         try:
-            return fn()
+            result = fn()
         except Exception as e:
             last_error = e
+            _record_failure(breaker, e)
 
             # Check if we should retry
             if attempt < max_retries and retry_check(e, attempt):
-                delay = _calculate_delay(
-                    attempt, initial_delay_ms, max_delay_ms, backoff_multiplier
-                )
-                time.sleep(delay)
-                continue
+                delay = _retry_delay(e, delays[attempt], jitter, max_delay_ms)
+                if delay is not None:
+                    _sleep(delay)
+                    continue
 
             # No more retries, raise the error
             raise
+        except BaseException:
+            # Cancelled or interrupted: no verdict on the backend, but a
+            # half-open probe must not hold its slot forever
+            if breaker is not None:
+                breaker.release()
+            raise
+        else:
+            if breaker is not None:
+                breaker.on_success()
+            return result
 
     # This should never be reached, but satisfies type checker
     if last_error:
@@ -127,9 +276,17 @@ async def with_retry_async(
     max_delay_ms: int = 30000,
     backoff_multiplier: float = 2.0,
     should_retry: Callable[[Exception, int], bool] | None = None,
+    jitter: JitterMode = "full",
+    breaker_key: str | None = None,
 ) -> T:
     """Execute an async function with automatic retry using exponential backoff.
 
+    If the error carries a ``retry_after`` (parsed from the ``Retry-After``
+    header), the wait is at least that long, overriding a shorter backoff.
+    When it exceeds ``max_delay_ms`` the error is raised right away instead of
+    waiting, even if retries remain: with the default 30000 ms cap, a
+    ``Retry-After: 31`` response is raised on the first attempt.
+
     Example:
         >>> from dflow.utils import with_retry_async
         >>>
@@ -144,32 +301,51 @@ async def with_retry_async(
         max_delay_ms: Maximum delay in milliseconds between retries (default: 30000)
         backoff_multiplier: Multiplier for exponential backoff (default: 2.0)
         should_retry: Function to determine if an error should trigger a retry
+        jitter: Jitter strategy: "full", "equal", or "none" (default: "full")
+        breaker_key: Optional key of a shared circuit breaker. Calls using the
+            same key stop hitting the backend once it is known to be failing.
 
     Returns:
         The result of the function
 
     Raises:
+        CircuitOpenError: If the circuit for ``breaker_key`` is open
         The last error if all retries are exhausted
     """
     retry_check = should_retry or default_should_retry
+    delays = _delay_schedule(max_retries, initial_delay_ms, max_delay_ms, backoff_multiplier)
+    breaker = get_circuit_breaker(breaker_key) if breaker_key else None
     last_error: Exception | None = None
 
     for attempt in range(max_retries + 1):
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(cast(str, breaker_key)) from last_error
+
         try:
-            return await fn()
+            result = await fn()
         except Exception as e:
             last_error = e
+            _record_failure(breaker, e)
 
             # Check if we should retry
             if attempt < max_retries and retry_check(e, attempt):
-                delay = _calculate_delay(
-                    attempt, initial_delay_ms, max_delay_ms, backoff_multiplier
-                )
-                await asyncio.sleep(delay)
-                continue
+                delay = _retry_delay(e, delays[attempt], jitter, max_delay_ms)
+                if delay is not None:
+                    await _async_sleep(delay)
+                    continue
 
             # No more retries, raise the error
             raise
+        except BaseException:
+            # Cancelled or interrupted: no verdict on the backend, but a
+            # half-open probe must not hold its slot forever
+            if breaker is not None:
+                breaker.release()
+            raise
+        else:
+            if breaker is not None:
+                breaker.on_success()
+            return result
 
     # This should never be reached, but satisfies type checker
     if last_error:
@@ -184,6 +360,8 @@ def create_retryable(
     max_delay_ms: int = 30000,
     backoff_multiplier: float = 2.0,
     should_retry: Callable[[Exception, int], bool] | None = None,
+    jitter: JitterMode = "full",
+    breaker_key: str | None = None,
 ) -> Callable[..., T]:
     """Create a retryable version of a function.
 
@@ -204,6 +382,8 @@ def create_retryable(
         max_delay_ms: Maximum delay in milliseconds between retries
         backoff_multiplier: Multiplier for exponential backoff
         should_retry: Function to determine if an error should trigger a retry
+        jitter: Jitter strategy: "full", "equal", or "none" (default: "full")
+        breaker_key: Optional key of a shared circuit breaker
 
     Returns:
         A wrapped function with automatic retry
@@ -217,6 +397,59 @@ def create_retryable(
             max_delay_ms=max_delay_ms,
             backoff_multiplier=backoff_multiplier,
             should_retry=should_retry,
+            jitter=jitter,
+            breaker_key=breaker_key,
+        )
+
+    return wrapper
+
+
+def create_retryable_async(
+    fn: Callable[..., Awaitable[T]],
+    max_retries: int = 3,
+    initial_delay_ms: int = 1000,
+    max_delay_ms: int = 30000,
+    backoff_multiplier: float = 2.0,
+    should_retry: Callable[[Exception, int], bool] | None = None,
+    jitter: JitterMode = "full",
+    breaker_key: str | None = None,
+) -> Callable[..., Awaitable[T]]:
+    """Create a retryable version of an async function.
+
+    Async counterpart of ``create_retryable``. Backoff uses ``asyncio.sleep``,
+    so concurrent retrying calls do not block each other.
+
+    Example:
+        >>> from dflow.utils import create_retryable_async
+        >>>
+        >>> fetch_with_retry = create_retryable_async(fetch_markets, max_retries=5)
+        >>>
+        >>> markets = await fetch_with_retry(limit=50)
+
+    Args:
+        fn: The async function to wrap
+        max_retries: Maximum number of retry attempts (default: 3)
+        initial_delay_ms: Initial delay in milliseconds before first retry
+        max_delay_ms: Maximum delay in milliseconds between retries
+        backoff_multiplier: Multiplier for exponential backoff
+        should_retry: Function to determine if an error should trigger a retry
+        jitter: Jitter strategy: "full", "equal", or "none" (default: "full")
+        breaker_key: Optional key of a shared circuit breaker
+
+    Returns:
+        A wrapped async function with automatic retry
+    """
+
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        return await with_retry_async(
+            lambda: fn(*args, **kwargs),
+            max_retries=max_retries,
+            initial_delay_ms=initial_delay_ms,
+            max_delay_ms=max_delay_ms,
+            backoff_multiplier=backoff_multiplier,
+            should_retry=should_retry,
+            jitter=jitter,
+            breaker_key=breaker_key,
         )
 
     return wrapper
@@ -1,16 +1,54 @@
 """WebSocket client for DFlow SDK."""
 
 import asyncio
-import json
+import contextlib
+import random
+import re
+import warnings
 from collections.abc import Callable
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 import websockets
+from pydantic import BaseModel
 from websockets import ClientConnection
 
 from dflow.types import OrderbookUpdate, PriceUpdate, TradeUpdate, WebSocketChannel
+from dflow.utils.codec import json_dumps, json_loads
 from dflow.utils.constants import WEBSOCKET_URL
 
+TUpdate = TypeVar("TUpdate", bound=BaseModel)
+
+# Locate the channel name in a raw frame so it can be routed without a full parse.
+# Text and binary frames each get a pattern so bytes never need decoding to str.
+# Reconnect backoff sleep, patched out in tests
+_sleep = asyncio.sleep
+
+_CHANNEL_PATTERN = re.compile(r'"channel"\s*:\s*"([a-z]+)"')
+_CHANNEL_PATTERN_BYTES = re.compile(rb'"channel"\s*:\s*"([a-z]+)"')
+
+
+def _decode_update(
+    model: type[TUpdate], message: str | bytes, data: dict[str, Any] | None
+) -> TUpdate:
+    """Validate an update, parsing the raw frame directly when possible.
+
+    ``model_validate_json`` parses and validates in a single pass without
+    building an intermediate dict; ``data`` is only set when the frame had to
+    be parsed up front to find its channel.
+    """
+    if data is None:
+        return model.model_validate_json(message)
+    return model.model_validate(data)
+
+
+def _make_unsubscribe(callbacks: dict[int, Any], cb_id: int) -> Callable[[], None]:
+    """Create a function that removes a callback, ignoring repeat calls."""
+
+    def unsubscribe() -> None:
+        callbacks.pop(cb_id, None)
+
+    return unsubscribe
+
 
 class DFlowWebSocket:
     """WebSocket client for real-time price, trade, and orderbook updates.
@@ -37,46 +75,107 @@ class DFlowWebSocket:
         ...
         ...     unsubscribe = dflow.ws.on_price(on_price)
         ...
-        ...     # Keep running for a while
-        ...     await asyncio.sleep(60)
+        ...     # Keep running until stopped. Waiting on an event does not wake
+        ...     # the loop like a short asyncio.sleep() polling loop would; use
+        ...     # asyncio.sleep(0) when you only need to yield to the loop.
+        ...     stop = asyncio.Event()
+        ...     asyncio.get_running_loop().call_later(60, stop.set)
+        ...     await stop.wait()
         ...
         ...     # Cleanup
         ...     unsubscribe()
-        ...     dflow.ws.disconnect()
+        ...     await dflow.ws.aclose()
         >>>
         >>> asyncio.run(main())
     """
 
+    __slots__ = (
+        "url",
+        "reconnect",
+        "max_reconnect_attempts",
+        "reconnect_initial_s",
+        "reconnect_max_s",
+        "reconnect_multiplier",
+        "_ws",
+        "_reconnect_attempts",
+        "_is_connecting",
+        "_listen_task",
+        "_pending_close",
+        "_price_callbacks",
+        "_trade_callbacks",
+        "_orderbook_callbacks",
+        "_error_callbacks",
+        "_close_callbacks",
+        "_next_cb_id",
+        "_dispatch",
+    )
+
     def __init__(
         self,
         url: str | None = None,
         reconnect: bool = True,
-        reconnect_interval: float = 5.0,
+        reconnect_interval: float | None = None,
         max_reconnect_attempts: int = 10,
+        reconnect_initial_s: float = 1.0,
+        reconnect_max_s: float = 60.0,
+        reconnect_multiplier: float = 2.0,
     ):
         """Create a new WebSocket client.
 
+        Reconnect attempts back off exponentially from ``reconnect_initial_s``
+        up to ``reconnect_max_s``, waiting a random fraction of each step (full
+        jitter) so many clients do not reconnect in lockstep after an outage.
+
         Args:
             url: Custom WebSocket URL (defaults to DFlow WebSocket)
             reconnect: Whether to auto-reconnect on disconnect (default: True)
-            reconnect_interval: Seconds between reconnect attempts (default: 5.0)
+            reconnect_interval: Deprecated alias for ``reconnect_initial_s``
             max_reconnect_attempts: Max reconnection attempts (default: 10)
+            reconnect_initial_s: Backoff step before the first reconnect in seconds (default: 1.0)
+            reconnect_max_s: Maximum backoff step in seconds (default: 60.0)
+            reconnect_multiplier: Multiplier applied to the step per attempt (default: 2.0)
         """
+        if reconnect_interval is not None:
+            warnings.warn(
+                "reconnect_interval is deprecated; use reconnect_initial_s instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            reconnect_initial_s = reconnect_interval
+
         self.url = url or WEBSOCKET_URL
         self.reconnect = reconnect
-        self.reconnect_interval = reconnect_interval
         self.max_reconnect_attempts = max_reconnect_attempts
+        self.reconnect_initial_s = reconnect_initial_s
+        self.reconnect_max_s = reconnect_max_s
+        self.reconnect_multiplier = reconnect_multiplier
 
         self._ws: ClientConnection | None = None
         self._reconnect_attempts = 0
         self._is_connecting = False
         self._listen_task: asyncio.Task[Any] | None = None
-
-        self._price_callbacks: list[Callable[[PriceUpdate], None]] = []
-        self._trade_callbacks: list[Callable[[TradeUpdate], None]] = []
-        self._orderbook_callbacks: list[Callable[[OrderbookUpdate], None]] = []
-        self._error_callbacks: list[Callable[[Exception], None]] = []
-        self._close_callbacks: list[Callable[[], None]] = []
+        self._pending_close: set[asyncio.Task[Any]] = set()
+
+        # Callback registries keyed by registration id, so unsubscribing is
+        # O(1) and dispatch keeps registration order.
+        self._price_callbacks: dict[int, Callable[[PriceUpdate], None]] = {}
+        self._trade_callbacks: dict[int, Callable[[TradeUpdate], None]] = {}
+        self._orderbook_callbacks: dict[int, Callable[[OrderbookUpdate], None]] = {}
+        self._error_callbacks: dict[int, Callable[[Exception], None]] = {}
+        self._close_callbacks: dict[int, Callable[[], None]] = {}
+        self._next_cb_id = 0
+
+        # Channel -> (update model, callbacks). Keyed by both str and bytes so
+        # channels peeked from binary frames need no decoding.
+        channels: dict[str, tuple[type[BaseModel], dict[int, Any]]] = {
+            "prices": (PriceUpdate, self._price_callbacks),
+            "trades": (TradeUpdate, self._trade_callbacks),
+            "orderbook": (OrderbookUpdate, self._orderbook_callbacks),
+        }
+        self._dispatch: dict[str | bytes, tuple[type[BaseModel], dict[int, Any]]] = {}
+        for name, entry in channels.items():
+            self._dispatch[name] = entry
+            self._dispatch[name.encode()] = entry
 
     async def connect(self) -> None:
         """Connect to the WebSocket server.
@@ -119,81 +218,162 @@ class DFlowWebSocket:
             async for message in self._ws:
                 self._handle_message(message)
         except websockets.ConnectionClosed:
-            for close_cb in self._close_callbacks:
+            for close_cb in tuple(self._close_callbacks.values()):
                 close_cb()
             await self._attempt_reconnect()
         except Exception as e:
-            for error_cb in self._error_callbacks:
+            for error_cb in tuple(self._error_callbacks.values()):
                 error_cb(e)
             await self._attempt_reconnect()
 
     def _handle_message(self, message: str | bytes) -> None:
         """Handle an incoming WebSocket message."""
         try:
+            # Both the peek and the decoders accept str or bytes directly
+            data: dict[str, Any] | None = None
+            channel: str | bytes | None
+            match: re.Match[Any] | None
             if isinstance(message, bytes):
-                message = message.decode("utf-8")
-
-            data = json.loads(message)
-            channel = data.get("channel")
-
-            if channel == "prices":
-                price_update = PriceUpdate.model_validate(data)
-                for price_cb in self._price_callbacks:
-                    price_cb(price_update)
-            elif channel == "trades":
-                trade_update = TradeUpdate.model_validate(data)
-                for trade_cb in self._trade_callbacks:
-                    trade_cb(trade_update)
-            elif channel == "orderbook":
-                orderbook_update = OrderbookUpdate.model_validate(data)
-                for orderbook_cb in self._orderbook_callbacks:
-                    orderbook_cb(orderbook_update)
+                match = _CHANNEL_PATTERN_BYTES.search(message)
+            else:
+                match = _CHANNEL_PATTERN.search(message)
+            if match is not None:
+                channel = match.group(1)
+            else:
+                data = json_loads(message)
+                channel = data.get("channel") if isinstance(data, dict) else None
+
+            entry = self._dispatch.get(channel) if channel else None
+            if entry is None:
+                return
+
+            model, callbacks = entry
+            update = _decode_update(model, message, data)
+            for callback in tuple(callbacks.values()):
+                callback(update)
         except Exception as e:
-            for error_cb in self._error_callbacks:
+            for error_cb in tuple(self._error_callbacks.values()):
                 error_cb(e)
 
+    @property
+    def reconnect_interval(self) -> float:
+        """Deprecated alias for ``reconnect_initial_s``."""
+        return self.reconnect_initial_s
+
+    @reconnect_interval.setter
+    def reconnect_interval(self, value: float) -> None:
+        warnings.warn(
+            "reconnect_interval is deprecated; use reconnect_initial_s instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        self.reconnect_initial_s = value
+
+    def _reconnect_delay(self) -> float:
+        """Compute the jittered backoff before the current reconnect attempt."""
+        step = self.reconnect_initial_s * (
+            self.reconnect_multiplier ** (self._reconnect_attempts - 1)
+        )
+        return random.random() * min(step, self.reconnect_max_s)
+
     async def _attempt_reconnect(self) -> None:
-        """Attempt to reconnect to the WebSocket server."""
-        if not self.reconnect:
+        """Reconnect to the WebSocket server, backing off between attempts.
+
+        Gives up after ``max_reconnect_attempts`` failed attempts and reports
+        the failure to the error callbacks. A successful connect resets the
+        attempt counter.
+        """
+        while self.reconnect and self._reconnect_attempts < self.max_reconnect_attempts:
+            self._reconnect_attempts += 1
+            await _sleep(self._reconnect_delay())
+            if not self.reconnect:
+                return  # Disconnected while backing off
+
+            try:
+                await self.connect()
+            except Exception:
+                continue
             return
 
-        if self._reconnect_attempts >= self.max_reconnect_attempts:
+        if self.reconnect:
             error = Exception("Max reconnection attempts reached")
-            for cb in self._error_callbacks:
+            for cb in tuple(self._error_callbacks.values()):
                 cb(error)
-            return
-
-        self._reconnect_attempts += 1
-        await asyncio.sleep(self.reconnect_interval)
-
-        try:
-            await self.connect()
-        except Exception:
-            pass  # Will retry on next attempt
 
     def disconnect(self) -> None:
         """Disconnect from the WebSocket server.
 
-        Disables auto-reconnect and closes the connection.
+        Disables auto-reconnect and closes the connection without waiting for
+        the close handshake (same as ``close_nowait``). Use ``aclose`` to wait
+        for it from async code.
 
         Example:
             >>> dflow.ws.disconnect()
         """
+        self.close_nowait()
+
+    async def aclose(self, timeout: float = 5.0) -> None:
+        """Disconnect from the WebSocket server and wait for it to close.
+
+        Disables auto-reconnect, stops the listener, and waits for the
+        connection to close.
+
+        Args:
+            timeout: Maximum seconds to wait for each shutdown step (default: 5.0)
+
+        Example:
+            >>> await dflow.ws.aclose()
+        """
+        self.reconnect = False
+
+        listen_task = self._listen_task
+        self._listen_task = None
+        if listen_task is not None and listen_task is not asyncio.current_task():
+            listen_task.cancel()
+            # Wait for the cancellation so it cannot race a pending reconnect
+            with contextlib.suppress(asyncio.CancelledError, asyncio.TimeoutError):
+                await asyncio.wait_for(listen_task, timeout)
+
+        ws = self._ws
+        self._ws = None
+        if ws is not None:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(ws.close(), timeout)
+
+    def close_nowait(self) -> None:
+        """Disconnect without waiting for the connection to close.
+
+        Use from synchronous code (e.g. ``DFlowClient.close()``). The close
+        handshake is scheduled on the running event loop, if there is one.
+
+        Example:
+            >>> dflow.ws.close_nowait()
+        """
         self.reconnect = False
 
         if self._listen_task:
             self._listen_task.cancel()
             self._listen_task = None
 
-        if self._ws:
-            asyncio.create_task(self._ws.close())
-            self._ws = None
+        ws = self._ws
+        self._ws = None
+        if ws is None:
+            return
+
+        try:
+            task = asyncio.get_running_loop().create_task(ws.close())
+        except RuntimeError:
+            return  # No running loop; the connection is dropped with its loop
+
+        # Hold a reference until done so the task cannot be garbage collected
+        self._pending_close.add(task)
+        task.add_done_callback(self._pending_close.discard)
 
     async def _send(self, message: dict[str, Any]) -> None:
         """Send a message to the WebSocket server."""
         if self._ws is None or cast(Any, self._ws).closed:
             raise Exception("WebSocket is not connected")
-        await self._ws.send(json.dumps(message))
+        await self._ws.send(json_dumps(message))
 
     async def subscribe_prices(self, tickers: list[str]) -> None:
         """Subscribe to price updates for specific markets.
@@ -270,6 +450,46 @@ class DFlowWebSocket:
         """
         await self._send({"type": "subscribe", "channel": "orderbook", "all": True})
 
+    async def subscribe_many(
+        self,
+        *,
+        prices: list[str] | None = None,
+        trades: list[str] | None = None,
+        orderbook: list[str] | None = None,
+    ) -> None:
+        """Subscribe to several channels in one call.
+
+        The connection is checked once and one subscribe frame per non-empty
+        channel is sent back-to-back.
+
+        Args:
+            prices: Market tickers to subscribe to for price updates
+            trades: Market tickers to subscribe to for trade updates
+            orderbook: Market tickers to subscribe to for orderbook updates
+
+        Raises:
+            Exception: If WebSocket is not connected
+
+        Example:
+            >>> await dflow.ws.subscribe_many(
+            ...     prices=["BTCD-25DEC0313-T92749.99"],
+            ...     orderbook=["BTCD-25DEC0313-T92749.99"],
+            ... )
+        """
+        if self._ws is None or cast(Any, self._ws).closed:
+            raise Exception("WebSocket is not connected")
+
+        subscriptions: tuple[tuple[WebSocketChannel, list[str] | None], ...] = (
+            ("prices", prices),
+            ("trades", trades),
+            ("orderbook", orderbook),
+        )
+        for channel, tickers in subscriptions:
+            if tickers:
+                await self._ws.send(
+                    json_dumps({"type": "subscribe", "channel": channel, "tickers": tickers})
+                )
+
     async def unsubscribe(
         self, channel: WebSocketChannel, tickers: list[str] | None = None
     ) -> None:
@@ -294,6 +514,13 @@ class DFlowWebSocket:
         else:
             await self._send({"type": "unsubscribe", "channel": channel, "all": True})
 
+    def _register(self, callbacks: dict[int, Any], callback: Any) -> Callable[[], None]:
+        """Add a callback to a registry and return its unsubscribe function."""
+        cb_id = self._next_cb_id
+        self._next_cb_id += 1
+        callbacks[cb_id] = callback
+        return _make_unsubscribe(callbacks, cb_id)
+
     def on_price(self, callback: Callable[[PriceUpdate], None]) -> Callable[[], None]:
         """Register a callback for price updates.
 
@@ -311,8 +538,7 @@ class DFlowWebSocket:
             >>> # Later: remove callback
             >>> unsubscribe()
         """
-        self._price_callbacks.append(callback)
-        return lambda: self._price_callbacks.remove(callback)
+        return self._register(self._price_callbacks, callback)
 
     def on_trade(self, callback: Callable[[TradeUpdate], None]) -> Callable[[], None]:
         """Register a callback for trade updates.
@@ -329,8 +555,7 @@ class DFlowWebSocket:
             >>>
             >>> unsubscribe = dflow.ws.on_trade(handle_trade)
         """
-        self._trade_callbacks.append(callback)
-        return lambda: self._trade_callbacks.remove(callback)
+        return self._register(self._trade_callbacks, callback)
 
     def on_orderbook(
         self, callback: Callable[[OrderbookUpdate], None]
@@ -349,8 +574,7 @@ class DFlowWebSocket:
             >>>
             >>> unsubscribe = dflow.ws.on_orderbook(handle_orderbook)
         """
-        self._orderbook_callbacks.append(callback)
-        return lambda: self._orderbook_callbacks.remove(callback)
+        return self._register(self._orderbook_callbacks, callback)
 
     def on_error(self, callback: Callable[[Exception], None]) -> Callable[[], None]:
         """Register a callback for WebSocket errors.
@@ -367,8 +591,7 @@ class DFlowWebSocket:
             >>>
             >>> unsubscribe = dflow.ws.on_error(handle_error)
         """
-        self._error_callbacks.append(callback)
-        return lambda: self._error_callbacks.remove(callback)
+        return self._register(self._error_callbacks, callback)
 
     def on_close(self, callback: Callable[[], None]) -> Callable[[], None]:
         """Register a callback for WebSocket close events.
@@ -385,8 +608,7 @@ class DFlowWebSocket:
             >>>
             >>> unsubscribe = dflow.ws.on_close(handle_close)
         """
-        self._close_callbacks.append(callback)
-        return lambda: self._close_callbacks.remove(callback)
+        return self._register(self._close_callbacks, callback)
 
     @property
     def is_connected(self) -> bool:
@@ -1,9 +1,41 @@
-"""Pytest configuration and fixtures."""
+"""Pytest configuration and fixtures.
+
+Mock payload fixtures are session-scoped and shared by every test, so tests
+must not mutate them; build a new dict (e.g. ``{**mock_event_data, ...}``)
+when a variant is needed.
+"""
+
+import json
 
 import pytest
 
+from dflow import DFlowClient
+from dflow.types import CandlestickParams, ForecastHistoryParams
+
 
 @pytest.fixture
+def no_sleep(monkeypatch):
+    """Skip retry backoff waits so retry tests do not sleep for real."""
+
+    async def async_no_sleep(delay):
+        pass
+
+    monkeypatch.setattr("dflow.utils.retry._sleep", lambda delay: None)
+    monkeypatch.setattr("dflow.utils.retry._async_sleep", async_no_sleep)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Shared development client for API tests.
+
+    ``pytest_httpx`` patches the transport and resets mocks per test, so one
+    client can serve the whole session.
+    """
+    with DFlowClient() as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
 def mock_market_data():
     """Sample market data for testing (matches actual API format)."""
     return {
@@ -39,7 +71,7 @@ def mock_market_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_event_data():
     """Sample event data for testing."""
     return {
@@ -51,7 +83,7 @@ def mock_event_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_quote_data():
     """Sample swap quote data for testing."""
     return {
@@ -63,7 +95,7 @@ def mock_quote_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_orderbook_data():
     """Sample orderbook data for testing (matches actual API format)."""
     return {
@@ -73,7 +105,7 @@ def mock_orderbook_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_trade_data():
     """Sample trade data for testing (matches actual API format)."""
     return {
@@ -90,7 +122,7 @@ def mock_trade_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_search_data(mock_event_data):
     """Sample search result data for testing."""
     return {
@@ -99,7 +131,7 @@ def mock_search_data(mock_event_data):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_series_data():
     """Sample series data for testing."""
     return {
@@ -117,7 +149,7 @@ def mock_series_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_tags_data():
     """Sample tags data for testing."""
     return {
@@ -129,7 +161,7 @@ def mock_tags_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_live_data():
     """Sample live data for testing."""
     return {
@@ -145,7 +177,7 @@ def mock_live_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_sports_filters_data():
     """Sample sports filters data for testing."""
     return {
@@ -168,7 +200,7 @@ def mock_sports_filters_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_token_data():
     """Sample token data for testing."""
     return {
@@ -178,7 +210,7 @@ def mock_token_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_token_with_decimals_data():
     """Sample token with decimals data for testing."""
     return {
@@ -189,7 +221,7 @@ def mock_token_with_decimals_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_venue_data():
     """Sample venue data for testing."""
     return {
@@ -199,7 +231,7 @@ def mock_venue_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_order_response_data():
     """Sample order response data for testing."""
     return {
@@ -212,7 +244,7 @@ def mock_order_response_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_order_status_data():
     """Sample order status data for testing."""
     return {
@@ -233,7 +265,7 @@ def mock_order_status_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_intent_quote_data():
     """Sample intent quote data for testing."""
     return {
@@ -247,7 +279,7 @@ def mock_intent_quote_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_intent_response_data(mock_intent_quote_data):
     """Sample intent response data for testing."""
     return {
@@ -257,7 +289,7 @@ def mock_intent_response_data(mock_intent_quote_data):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_swap_response_data():
     """Sample swap response data for testing."""
     return {
@@ -268,7 +300,7 @@ def mock_swap_response_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_swap_instructions_data():
     """Sample swap instructions response data for testing."""
     return {
@@ -291,3 +323,54 @@ def mock_swap_instructions_data():
         "cleanupInstruction": None,
         "addressLookupTableAddresses": ["ALT1111111111111111111111111111111111111111"],
     }
+
+
+@pytest.fixture(scope="session")
+def candle_params():
+    """Candlestick query parameters covering one day at 1-minute intervals."""
+    return CandlestickParams(start_ts=1704067200, end_ts=1704153600, period_interval=60)
+
+
+@pytest.fixture(scope="session")
+def forecast_params():
+    """Forecast history query parameters for the median percentile."""
+    return ForecastHistoryParams(
+        percentiles="5000",
+        start_ts=1704067200,
+        end_ts=1704153600,
+        period_interval=60,
+    )
+
+
+# Pre-encoded response bodies for the most reused payloads, serialized once
+# per session instead of by pytest_httpx on every add_response(json=...).
+
+
+@pytest.fixture(scope="session")
+def mock_market_bytes(mock_market_data):
+    """JSON body of mock_market_data."""
+    return json.dumps(mock_market_data).encode()
+
+
+@pytest.fixture(scope="session")
+def mock_quote_bytes(mock_quote_data):
+    """JSON body of mock_quote_data."""
+    return json.dumps(mock_quote_data).encode()
+
+
+@pytest.fixture(scope="session")
+def mock_trades_page_bytes(mock_trade_data):
+    """JSON body of a single trades page holding mock_trade_data."""
+    return json.dumps({"trades": [mock_trade_data], "cursor": None}).encode()
+
+
+@pytest.fixture(scope="session")
+def mock_intent_quote_bytes(mock_intent_quote_data):
+    """JSON body of mock_intent_quote_data."""
+    return json.dumps(mock_intent_quote_data).encode()
+
+
+@pytest.fixture(scope="session")
+def mock_intent_response_bytes(mock_intent_response_data):
+    """JSON body of mock_intent_response_data."""
+    return json.dumps(mock_intent_response_data).encode()
@@ -1,131 +1,324 @@
 """Tests for API modules."""
 
+import json
+from operator import attrgetter
+from unittest.mock import patch
+
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
-from dflow import DFlowClient
+from dflow import DFlowApiError, DFlowClient
+
+PM_BASE = "https://dev-prediction-markets-api.dflow.net/api/v1"
+Q_BASE = "https://dev-quote-api.dflow.net"
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Quote URLs shared by several tests, parsed once
+SWAP_QUOTE_URL = httpx.URL(
+    f"{Q_BASE}/quote?inputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+    "&outputMint=YesMint123&amount=1000000&slippageBps=50"
+)
+INTENT_QUOTE_URL = httpx.URL(
+    f"{Q_BASE}/intent?inputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+    "&outputMint=YesMint123&amount=1000000&mode=ExactIn"
+)
+
+# One past the batch limits of get_markets_batch (100) and filter_outcome_mints (200)
+_OVER_LIMIT_TICKERS = [f"t{i}" for i in range(101)]
+_OVER_LIMIT_MINTS = [f"addr{i}" for i in range(201)]
+
+
+def assert_attrs(obj, expected):
+    """Assert each dotted attribute path on obj equals its expected value."""
+    for path, value in expected.items():
+        assert attrgetter(path)(obj) == value, path
+
+
+@pytest.fixture(autouse=True)
+def clear_api_caches(client):
+    """Start each test with empty response caches on the shared client."""
+    apis = (
+        client.live_data,
+        client.markets,
+        client.series,
+        client.sports,
+        client.tags,
+        client.tokens,
+        client.venues,
+    )
+    for api in apis:
+        api.clear_cache()
+
+
+class TestGetSingleResource:
+    """Tests for lookups that fetch one resource by ticker or mint."""
+
+    @pytest.mark.parametrize(
+        "path, method_path, arg, fixture, expected_attr, expected_value",
+        [
+            (
+                "market/by-mint/YesMint123456789abcdefghijklmnopqrstuvwxyz",
+                "markets.get_market_by_mint",
+                "YesMint123456789abcdefghijklmnopqrstuvwxyz",
+                "mock_market_data",
+                "ticker",
+                "BTCD-25DEC0313-T92749.99",
+            ),
+            (
+                "event/BTCD-25DEC0313",
+                "events.get_event",
+                "BTCD-25DEC0313",
+                "mock_event_data",
+                "series_ticker",
+                "KXBTC",
+            ),
+            (
+                "orderbook/by-mint/YesMint123456789abcdefghijklmnopqrstuvwxyz",
+                "orderbook.get_orderbook_by_mint",
+                "YesMint123456789abcdefghijklmnopqrstuvwxyz",
+                "mock_orderbook_data",
+                "sequence",
+                1704067200000,
+            ),
+            (
+                "series/KXBTC",
+                "series.get_series_by_ticker",
+                "KXBTC",
+                "mock_series_data",
+                "title",
+                "Bitcoin Price",
+            ),
+            (
+                "live_data/by-event/BTCD-25DEC0313",
+                "live_data.get_live_data_by_event",
+                "BTCD-25DEC0313",
+                "mock_live_data",
+                "event_ticker",
+                "BTCD-25DEC0313",
+            ),
+            (
+                "live_data/by-mint/YesMint123456789abcdefghijklmnopqrstuvwxyz",
+                "live_data.get_live_data_by_mint",
+                "YesMint123456789abcdefghijklmnopqrstuvwxyz",
+                "mock_live_data",
+                "event_ticker",
+                "BTCD-25DEC0313",
+            ),
+        ],
+    )
+    def test_get_single_resource(
+        self,
+        httpx_mock: HTTPXMock,
+        request,
+        client,
+        path,
+        method_path,
+        arg,
+        fixture,
+        expected_attr,
+        expected_value,
+    ):
+        """Test single-resource getters parse the response model."""
+        httpx_mock.add_response(
+            url=f"{PM_BASE}/{path}",
+            json=request.getfixturevalue(fixture),
+        )
+
+        result = attrgetter(method_path)(client)(arg)
+
+        assert getattr(result, expected_attr) == expected_value
 
 
 class TestMarketsAPI:
     """Tests for MarketsAPI."""
 
-    def test_get_market(self, httpx_mock: HTTPXMock, mock_market_data):
+    def test_get_market(self, httpx_mock: HTTPXMock, mock_market_bytes, client):
         """Test get_market method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/market/BTCD-25DEC0313-T92749.99",
-            json=mock_market_data,
+            url=f"{PM_BASE}/market/BTCD-25DEC0313-T92749.99",
+            content=mock_market_bytes,
+            headers=JSON_HEADERS,
         )
 
-        with DFlowClient() as client:
-            market = client.markets.get_market("BTCD-25DEC0313-T92749.99")
-
-            assert market.ticker == "BTCD-25DEC0313-T92749.99"
-            assert market.yes_bid == "0.6500"
-            assert market.yes_price == 0.65  # computed property
-            assert market.status == "active"
+        market = client.markets.get_market("BTCD-25DEC0313-T92749.99")
 
-    def test_get_market_by_mint(self, httpx_mock: HTTPXMock, mock_market_data):
-        """Test get_market_by_mint method."""
-        httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/market/by-mint/YesMint123456789abcdefghijklmnopqrstuvwxyz",
-            json=mock_market_data,
+        assert_attrs(
+            market,
+            {
+                "ticker": "BTCD-25DEC0313-T92749.99",
+                "yes_bid": "0.6500",
+                "yes_price": 0.65,  # computed property
+                "status": "active",
+            },
         )
 
-        with DFlowClient() as client:
-            market = client.markets.get_market_by_mint(
-                "YesMint123456789abcdefghijklmnopqrstuvwxyz"
-            )
+    def test_get_market_finalized_is_cached_on_disk(
+        self, httpx_mock: HTTPXMock, mock_market_data, tmp_path
+    ):
+        """Test finalized markets are served from the disk cache across clients."""
+        url = f"{PM_BASE}/market/BTCD-25DEC0313-T92749.99"
+        httpx_mock.add_response(url=url, json={**mock_market_data, "status": "finalized"})
+
+        with DFlowClient(cache_dir=tmp_path) as dflow:
+            first = dflow.markets.get_market("BTCD-25DEC0313-T92749.99")
+        with DFlowClient(cache_dir=tmp_path) as dflow:
+            second = dflow.markets.get_market("BTCD-25DEC0313-T92749.99")
 
-            assert market.ticker == "BTCD-25DEC0313-T92749.99"
-            assert market.status == "active"
+        assert first == second
+        assert second.status == "finalized"
+        assert len(httpx_mock.get_requests(url=url)) == 1
+
+    def test_get_market_active_is_not_cached_on_disk(
+        self, httpx_mock: HTTPXMock, mock_market_data, tmp_path
+    ):
+        """Test markets that can still change are always fetched."""
+        url = f"{PM_BASE}/market/BTCD-25DEC0313-T92749.99"
+        httpx_mock.add_response(url=url, json=mock_market_data, is_reusable=True)
 
-    def test_get_markets(self, httpx_mock: HTTPXMock, mock_market_data):
+        with DFlowClient(cache_dir=tmp_path) as dflow:
+            dflow.markets.get_market("BTCD-25DEC0313-T92749.99")
+            dflow.markets.get_market("BTCD-25DEC0313-T92749.99")
+
+        assert len(httpx_mock.get_requests(url=url)) == 2
+
+    def test_get_markets(self, httpx_mock: HTTPXMock, mock_market_data, client):
         """Test get_markets method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/markets?status=active",
+            url=f"{PM_BASE}/markets?status=active",
             json={"markets": [mock_market_data], "cursor": None},
         )
 
-        with DFlowClient() as client:
-            response = client.markets.get_markets(status="active")
+        response = client.markets.get_markets(status="active")
 
-            assert len(response.markets) == 1
-            assert response.markets[0].ticker == "BTCD-25DEC0313-T92749.99"
+        assert len(response.markets) == 1
+        assert response.markets[0].ticker == "BTCD-25DEC0313-T92749.99"
 
-    def test_get_markets_batch(self, httpx_mock: HTTPXMock, mock_market_data):
+    def test_get_markets_batch(self, httpx_mock: HTTPXMock, mock_market_data, client):
         """Test get_markets_batch method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/markets/batch",
+            url=f"{PM_BASE}/markets/batch",
             json={"markets": [mock_market_data]},
         )
 
-        with DFlowClient() as client:
-            markets = client.markets.get_markets_batch(
-                tickers=["BTCD-25DEC0313-T92749.99"]
-            )
-
-            assert len(markets) == 1
-            assert markets[0].ticker == "BTCD-25DEC0313-T92749.99"
+        markets = client.markets.get_markets_batch(
+            tickers=["BTCD-25DEC0313-T92749.99"]
+        )
 
-    def test_get_markets_batch_exceeds_limit(self):
-        """Test get_markets_batch raises error when exceeding limit."""
-        with DFlowClient() as client:
-            with pytest.raises(ValueError, match="exceeds maximum"):
-                client.markets.get_markets_batch(
-                    tickers=["t" + str(i) for i in range(101)]
-                )
+        assert len(markets) == 1
+        assert markets[0].ticker == "BTCD-25DEC0313-T92749.99"
 
-    def test_get_outcome_mints(self, httpx_mock: HTTPXMock):
+    def test_get_outcome_mints(self, httpx_mock: HTTPXMock, client):
         """Test get_outcome_mints method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/outcome_mints",
+            url=f"{PM_BASE}/outcome_mints",
             json={"mints": ["mint1", "mint2", "mint3"]},
         )
 
-        with DFlowClient() as client:
-            mints = client.markets.get_outcome_mints()
+        mints = client.markets.get_outcome_mints()
 
-            assert len(mints) == 3
-            assert "mint1" in mints
+        assert len(mints) == 3
+        assert "mint1" in mints
 
-    def test_get_outcome_mints_with_filter(self, httpx_mock: HTTPXMock):
+    def test_get_outcome_mints_with_filter(self, httpx_mock: HTTPXMock, client):
         """Test get_outcome_mints with min_close_ts filter."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/outcome_mints?minCloseTs=1704067200",
+            url=f"{PM_BASE}/outcome_mints?minCloseTs=1704067200",
             json={"mints": ["mint1", "mint2"]},
         )
 
-        with DFlowClient() as client:
-            mints = client.markets.get_outcome_mints(min_close_ts=1704067200)
+        mints = client.markets.get_outcome_mints(min_close_ts=1704067200)
+
+        assert len(mints) == 2
 
-            assert len(mints) == 2
+    def test_get_outcome_mint_set(self, httpx_mock: HTTPXMock, client):
+        """Test get_outcome_mint_set returns a cached frozenset of mints."""
+        httpx_mock.add_response(
+            url=f"{PM_BASE}/outcome_mints",
+            json={"mints": ["mint1", "mint2", "mint1"]},
+        )
 
-    def test_filter_outcome_mints(self, httpx_mock: HTTPXMock):
+        assert client.markets.get_outcome_mint_set() == frozenset({"mint1", "mint2"})
+        assert client.markets.get_outcome_mint_set() == frozenset({"mint1", "mint2"})
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_filter_outcome_mints(self, httpx_mock: HTTPXMock, client):
         """Test filter_outcome_mints method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/filter_outcome_mints",
+            url=f"{PM_BASE}/filter_outcome_mints",
             json={"outcomeMints": ["mint1", "mint3"]},
         )
 
-        with DFlowClient() as client:
-            filtered = client.markets.filter_outcome_mints(["mint1", "mint2", "mint3"])
+        filtered = client.markets.filter_outcome_mints(["mint1", "mint2", "mint3"])
 
-            assert len(filtered) == 2
-            assert "mint1" in filtered
-            assert "mint3" in filtered
+        assert len(filtered) == 2
+        assert "mint1" in filtered
+        assert "mint3" in filtered
 
-    def test_filter_outcome_mints_exceeds_limit(self):
-        """Test filter_outcome_mints raises error when exceeding limit."""
-        with DFlowClient() as client:
-            with pytest.raises(ValueError, match="exceeds maximum"):
-                client.markets.filter_outcome_mints(
-                    ["addr" + str(i) for i in range(201)]
-                )
+    @pytest.mark.parametrize(
+        "method, payload",
+        [
+            ("get_markets_batch", _OVER_LIMIT_TICKERS),
+            ("filter_outcome_mints", _OVER_LIMIT_MINTS),
+        ],
+    )
+    def test_exceeds_limit(self, client, method, payload):
+        """Test batch methods raise over their limit unless chunking is requested."""
+        with pytest.raises(ValueError, match="exceeds maximum"):
+            getattr(client.markets, method)(payload)
 
-    def test_get_market_candlesticks(self, httpx_mock: HTTPXMock):
-        """Test get_market_candlesticks method."""
-        from dflow.types import CandlestickParams
+    def test_get_markets_batch_chunks_over_limit(
+        self, httpx_mock: HTTPXMock, mock_market_data, client
+    ):
+        """Test get_markets_batch splits over-limit lookups and merges results."""
+        httpx_mock.add_callback(
+            lambda request: httpx.Response(
+                200,
+                json={"markets": [mock_market_data] * len(json.loads(request.content)["tickers"])},
+            ),
+            url=f"{PM_BASE}/markets/batch",
+            is_reusable=True,
+        )
+
+        markets = client.markets.get_markets_batch(tickers=_OVER_LIMIT_TICKERS, chunk=True)
+
+        assert len(markets) == len(_OVER_LIMIT_TICKERS)
+        assert sorted(
+            len(json.loads(r.content)["tickers"]) for r in httpx_mock.get_requests()
+        ) == [1, 100]
+
+    def test_filter_outcome_mints_chunks_over_limit(self, httpx_mock: HTTPXMock, client):
+        """Test filter_outcome_mints splits long lists and keeps chunk order."""
+        httpx_mock.add_callback(
+            lambda request: httpx.Response(
+                200, json={"outcomeMints": json.loads(request.content)["addresses"][:1]}
+            ),
+            url=f"{PM_BASE}/filter_outcome_mints",
+            is_reusable=True,
+        )
+
+        filtered = client.markets.filter_outcome_mints(_OVER_LIMIT_MINTS, chunk=True)
+
+        assert filtered == ["addr0", "addr200"]
 
+    def test_chunked_batch_failure_raises(self, httpx_mock: HTTPXMock, mock_market_data, client):
+        """Test a failing chunk fails the whole chunked lookup."""
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            tickers = json.loads(request.content)["tickers"]
+            if len(tickers) == 1:
+                return httpx.Response(503, json={"error": "unavailable"})
+            return httpx.Response(200, json={"markets": [mock_market_data] * len(tickers)})
+
+        httpx_mock.add_callback(respond, url=f"{PM_BASE}/markets/batch", is_reusable=True)
+
+        with pytest.raises(DFlowApiError) as exc_info:
+            client.markets.get_markets_batch(tickers=_OVER_LIMIT_TICKERS, chunk=True)
+
+        assert exc_info.value.status_code == 503
+
+    def test_get_market_candlesticks(self, httpx_mock: HTTPXMock, candle_params, client):
+        """Test get_market_candlesticks method."""
         mock_candlesticks = {
             "candlesticks": [
                 {
@@ -140,28 +333,44 @@ class TestMarketsAPI:
             ]
         }
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/market/BTCD-25DEC0313-T92749.99/candlesticks?startTs=1704067200&endTs=1704153600&periodInterval=60",
+            url=f"{PM_BASE}/market/BTCD-25DEC0313-T92749.99/candlesticks?startTs=1704067200&endTs=1704153600&periodInterval=60",
             json=mock_candlesticks,
         )
 
-        with DFlowClient() as client:
-            candles = client.markets.get_market_candlesticks(
-                "BTCD-25DEC0313-T92749.99",
-                CandlestickParams(
-                    start_ts=1704067200,
-                    end_ts=1704153600,
-                    period_interval=60,
-                ),
-            )
-
-            assert len(candles) == 1
-            assert candles[0].open == 65
-            assert candles[0].close == 66
-
-    def test_get_market_candlesticks_by_mint(self, httpx_mock: HTTPXMock):
-        """Test get_market_candlesticks_by_mint method."""
-        from dflow.types import CandlestickParams
+        candles = client.markets.get_market_candlesticks(
+            "BTCD-25DEC0313-T92749.99",
+            candle_params,
+        )
+
+        assert len(candles) == 1
+        assert candles[0].open == 65
+        assert candles[0].close == 66
+
+    def test_get_market_candlestick_columns(self, httpx_mock: HTTPXMock, candle_params, client):
+        """Test candlesticks are returned as parallel columns."""
+        candle = {"timestamp": 1704067200, "open": 65, "high": 68, "low": 62, "close": 66}
+        httpx_mock.add_response(
+            url=f"{PM_BASE}/market/BTCD-25DEC0313-T92749.99/candlesticks?startTs=1704067200&endTs=1704153600&periodInterval=60",
+            json={
+                "candlesticks": [
+                    {**candle, "volume": 1000},
+                    {**candle, "timestamp": 1704070800, "close": 67, "volume": 250},
+                ]
+            },
+        )
+
+        columns = client.markets.get_market_candlestick_columns(
+            "BTCD-25DEC0313-T92749.99",
+            candle_params,
+        )
+
+        assert columns["timestamp"] == [1704067200, 1704070800]
+        assert columns["close"] == [66.0, 67.0]
+        assert columns["volume"] == [1000.0, 250.0]
+        assert list(columns) == ["timestamp", "open", "high", "low", "close", "volume"]
 
+    def test_get_market_candlesticks_by_mint(self, httpx_mock: HTTPXMock, candle_params, client):
+        """Test get_market_candlesticks_by_mint method."""
         mock_candlesticks = {
             "candlesticks": [
                 {
@@ -176,74 +385,52 @@ class TestMarketsAPI:
             ]
         }
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/market/by-mint/YesMint123/candlesticks?startTs=1704067200&endTs=1704153600&periodInterval=60",
+            url=f"{PM_BASE}/market/by-mint/YesMint123/candlesticks?startTs=1704067200&endTs=1704153600&periodInterval=60",
             json=mock_candlesticks,
         )
 
-        with DFlowClient() as client:
-            candles = client.markets.get_market_candlesticks_by_mint(
-                "YesMint123",
-                CandlestickParams(
-                    start_ts=1704067200,
-                    end_ts=1704153600,
-                    period_interval=60,
-                ),
-            )
+        candles = client.markets.get_market_candlesticks_by_mint(
+            "YesMint123",
+            candle_params,
+        )
 
-            assert len(candles) == 1
-            assert candles[0].open == 65
+        assert len(candles) == 1
+        assert candles[0].open == 65
 
 
 class TestEventsAPI:
     """Tests for EventsAPI."""
 
-    def test_get_event(self, httpx_mock: HTTPXMock, mock_event_data):
-        """Test get_event method."""
-        httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/event/BTCD-25DEC0313",
-            json=mock_event_data,
-        )
-
-        with DFlowClient() as client:
-            event = client.events.get_event("BTCD-25DEC0313")
-
-            assert event.ticker == "BTCD-25DEC0313"
-            assert event.series_ticker == "KXBTC"
-
     def test_get_event_with_nested_markets(
-        self, httpx_mock: HTTPXMock, mock_event_data, mock_market_data
+        self, httpx_mock: HTTPXMock, mock_event_data, mock_market_data, client
     ):
         """Test get_event with nested markets."""
         event_with_markets = {**mock_event_data, "markets": [mock_market_data]}
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/event/BTCD-25DEC0313?withNestedMarkets=true",
+            url=f"{PM_BASE}/event/BTCD-25DEC0313?withNestedMarkets=true",
             json=event_with_markets,
         )
 
-        with DFlowClient() as client:
-            event = client.events.get_event("BTCD-25DEC0313", with_nested_markets=True)
+        event = client.events.get_event("BTCD-25DEC0313", with_nested_markets=True)
 
-            assert event.ticker == "BTCD-25DEC0313"
-            assert event.markets is not None
-            assert len(event.markets) == 1
+        assert event.ticker == "BTCD-25DEC0313"
+        assert event.markets is not None
+        assert len(event.markets) == 1
 
-    def test_get_events(self, httpx_mock: HTTPXMock, mock_event_data):
+    def test_get_events(self, httpx_mock: HTTPXMock, mock_event_data, client):
         """Test get_events method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/events?status=active",
+            url=f"{PM_BASE}/events?status=active",
             json={"events": [mock_event_data], "cursor": None},
         )
 
-        with DFlowClient() as client:
-            response = client.events.get_events(status="active")
+        response = client.events.get_events(status="active")
 
-            assert len(response.events) == 1
-            assert response.events[0].ticker == "BTCD-25DEC0313"
+        assert len(response.events) == 1
+        assert response.events[0].ticker == "BTCD-25DEC0313"
 
-    def test_get_event_forecast_history(self, httpx_mock: HTTPXMock):
+    def test_get_event_forecast_history(self, httpx_mock: HTTPXMock, forecast_params, client):
         """Test get_event_forecast_history method."""
-        from dflow.types import ForecastHistoryParams
-
         mock_forecast = {
             "eventTicker": "event-123",
             "history": [
@@ -256,30 +443,22 @@ class TestEventsAPI:
             ],
         }
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/event/KXBTC/event-123/forecast_percentile_history?percentiles=5000&startTs=1704067200&endTs=1704153600&periodInterval=60",
+            url=f"{PM_BASE}/event/KXBTC/event-123/forecast_percentile_history?percentiles=5000&startTs=1704067200&endTs=1704153600&periodInterval=60",
             json=mock_forecast,
         )
 
-        with DFlowClient() as client:
-            history = client.events.get_event_forecast_history(
-                "KXBTC",
-                "event-123",
-                ForecastHistoryParams(
-                    percentiles="5000",
-                    start_ts=1704067200,
-                    end_ts=1704153600,
-                    period_interval=60,
-                ),
-            )
-
-            assert history.event_ticker == "event-123"
-            assert len(history.history) == 1
-            assert history.history[0].timestamp == 1704067200
-
-    def test_get_event_forecast_by_mint(self, httpx_mock: HTTPXMock):
-        """Test get_event_forecast_by_mint method."""
-        from dflow.types import ForecastHistoryParams
+        history = client.events.get_event_forecast_history(
+            "KXBTC",
+            "event-123",
+            forecast_params,
+        )
 
+        assert history.event_ticker == "event-123"
+        assert len(history.history) == 1
+        assert history.history[0].timestamp == 1704067200
+
+    def test_get_event_forecast_by_mint(self, httpx_mock: HTTPXMock, forecast_params, client):
+        """Test get_event_forecast_by_mint method."""
         mock_forecast = {
             "eventTicker": "BTCD-25DEC0313",
             "history": [
@@ -291,27 +470,19 @@ class TestEventsAPI:
             ],
         }
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/event/by-mint/YesMint123/forecast_percentile_history?percentiles=5000&startTs=1704067200&endTs=1704153600&periodInterval=60",
+            url=f"{PM_BASE}/event/by-mint/YesMint123/forecast_percentile_history?percentiles=5000&startTs=1704067200&endTs=1704153600&periodInterval=60",
             json=mock_forecast,
         )
 
-        with DFlowClient() as client:
-            history = client.events.get_event_forecast_by_mint(
-                "YesMint123",
-                ForecastHistoryParams(
-                    percentiles="5000",
-                    start_ts=1704067200,
-                    end_ts=1704153600,
-                    period_interval=60,
-                ),
-            )
+        history = client.events.get_event_forecast_by_mint(
+            "YesMint123",
+            forecast_params,
+        )
 
-            assert len(history.history) == 1
+        assert len(history.history) == 1
 
-    def test_get_event_candlesticks(self, httpx_mock: HTTPXMock):
+    def test_get_event_candlesticks(self, httpx_mock: HTTPXMock, candle_params, client):
         """Test get_event_candlesticks method."""
-        from dflow.types import CandlestickParams
-
         mock_data = {
             "market_tickers": ["MARKET-1", "MARKET-2"],
             "market_candlesticks": [
@@ -334,491 +505,487 @@ class TestEventsAPI:
             ],
         }
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/event/BTCD-25DEC0313/candlesticks?startTs=1704067200&endTs=1704153600&periodInterval=60",
+            url=f"{PM_BASE}/event/BTCD-25DEC0313/candlesticks?startTs=1704067200&endTs=1704153600&periodInterval=60",
             json=mock_data,
         )
 
-        with DFlowClient() as client:
-            candles = client.events.get_event_candlesticks(
-                "BTCD-25DEC0313",
-                CandlestickParams(
-                    start_ts=1704067200,
-                    end_ts=1704153600,
-                    period_interval=60,
-                ),
-            )
+        candles = client.events.get_event_candlesticks(
+            "BTCD-25DEC0313",
+            candle_params,
+        )
 
-            assert "MARKET-1" in candles
-            assert "MARKET-2" in candles
-            assert len(candles["MARKET-1"]) == 1
-            assert candles["MARKET-1"][0].price.open == 65
+        assert "MARKET-1" in candles
+        assert "MARKET-2" in candles
+        assert len(candles["MARKET-1"]) == 1
+        assert candles["MARKET-1"][0].price.open == 65
 
 
 class TestOrderbookAPI:
     """Tests for OrderbookAPI."""
 
-    def test_get_orderbook(self, httpx_mock: HTTPXMock, mock_orderbook_data):
+    def test_get_orderbook(self, httpx_mock: HTTPXMock, mock_orderbook_data, client):
         """Test get_orderbook method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/orderbook/BTCD-25DEC0313-T92749.99",
+            url=f"{PM_BASE}/orderbook/BTCD-25DEC0313-T92749.99",
             json=mock_orderbook_data,
         )
 
-        with DFlowClient() as client:
-            orderbook = client.orderbook.get_orderbook("BTCD-25DEC0313-T92749.99")
+        orderbook = client.orderbook.get_orderbook("BTCD-25DEC0313-T92749.99")
 
-            assert orderbook.sequence == 1704067200000
-            assert orderbook.timestamp == 1704067200000  # backwards compat
-            assert len(orderbook.yes_bids) == 2
-            yes_levels = orderbook.get_yes_levels()
-            assert yes_levels[0].price == 0.65
-
-    def test_get_orderbook_by_mint(self, httpx_mock: HTTPXMock, mock_orderbook_data):
-        """Test get_orderbook_by_mint method."""
-        httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/orderbook/by-mint/YesMint123456789abcdefghijklmnopqrstuvwxyz",
-            json=mock_orderbook_data,
-        )
-
-        with DFlowClient() as client:
-            orderbook = client.orderbook.get_orderbook_by_mint(
-                "YesMint123456789abcdefghijklmnopqrstuvwxyz"
-            )
-
-            assert orderbook.sequence == 1704067200000
-            assert len(orderbook.yes_bids) == 2
+        assert orderbook.sequence == 1704067200000
+        assert orderbook.timestamp == 1704067200000  # backwards compat
+        assert len(orderbook.yes_bids) == 2
+        yes_levels = orderbook.get_yes_levels()
+        assert yes_levels[0].price == 0.65
 
 
 class TestTradesAPI:
     """Tests for TradesAPI."""
 
-    def test_get_trades(self, httpx_mock: HTTPXMock, mock_trade_data):
+    def test_get_trades(self, httpx_mock: HTTPXMock, mock_trades_page_bytes, client):
         """Test get_trades method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/trades?ticker=BTCD-25DEC0313-T92749.99",
-            json={"trades": [mock_trade_data], "cursor": None},
+            url=f"{PM_BASE}/trades?ticker=BTCD-25DEC0313-T92749.99",
+            content=mock_trades_page_bytes,
+            headers=JSON_HEADERS,
         )
 
-        with DFlowClient() as client:
-            response = client.trades.get_trades(
-                ticker="BTCD-25DEC0313-T92749.99"
-            )
+        response = client.trades.get_trades(
+            ticker="BTCD-25DEC0313-T92749.99"
+        )
 
-            assert len(response.trades) == 1
-            assert response.trades[0].side == "yes"  # backwards compat property
-            assert response.trades[0].taker_side == "yes"
-            assert response.trades[0].price == 65  # price in cents
+        assert len(response.trades) == 1
+        assert response.trades[0].side == "yes"  # backwards compat property
+        assert response.trades[0].taker_side == "yes"
+        assert response.trades[0].price == 65  # price in cents
 
-    def test_get_trades_with_filters(self, httpx_mock: HTTPXMock, mock_trade_data):
+    def test_get_trades_with_filters(self, httpx_mock: HTTPXMock, mock_trade_data, client):
         """Test get_trades with timestamp filters."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/trades?minTs=1704067200&maxTs=1704153600&limit=50",
+            url=f"{PM_BASE}/trades?minTs=1704067200&maxTs=1704153600&limit=50",
             json={"trades": [mock_trade_data], "cursor": "next-cursor"},
         )
 
-        with DFlowClient() as client:
-            response = client.trades.get_trades(
-                min_ts=1704067200, max_ts=1704153600, limit=50
-            )
+        response = client.trades.get_trades(
+            min_ts=1704067200, max_ts=1704153600, limit=50
+        )
 
-            assert len(response.trades) == 1
-            assert response.cursor == "next-cursor"
+        assert len(response.trades) == 1
+        assert response.cursor == "next-cursor"
 
-    def test_get_trades_by_mint(self, httpx_mock: HTTPXMock, mock_trade_data):
+    def test_get_trades_by_mint(self, httpx_mock: HTTPXMock, mock_trades_page_bytes, client):
         """Test get_trades_by_mint method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/trades/by-mint/YesMint123456789abcdefghijklmnopqrstuvwxyz",
-            json={"trades": [mock_trade_data], "cursor": None},
+            url=f"{PM_BASE}/trades/by-mint/YesMint123456789abcdefghijklmnopqrstuvwxyz",
+            content=mock_trades_page_bytes,
+            headers=JSON_HEADERS,
         )
 
-        with DFlowClient() as client:
-            response = client.trades.get_trades_by_mint(
-                "YesMint123456789abcdefghijklmnopqrstuvwxyz"
-            )
+        response = client.trades.get_trades_by_mint(
+            "YesMint123456789abcdefghijklmnopqrstuvwxyz"
+        )
 
-            assert len(response.trades) == 1
-            assert response.trades[0].ticker == "BTCD-25DEC0313-T92749.99"
+        assert len(response.trades) == 1
+        assert response.trades[0].ticker == "BTCD-25DEC0313-T92749.99"
 
 
 class TestSwapAPI:
     """Tests for SwapAPI."""
 
-    def test_get_quote(self, httpx_mock: HTTPXMock, mock_quote_data):
+    def test_get_quote(self, httpx_mock: HTTPXMock, mock_quote_bytes, client):
         """Test get_quote method."""
         httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/quote?inputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v&outputMint=YesMint123&amount=1000000",
-            json=mock_quote_data,
+            url=f"{Q_BASE}/quote?inputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v&outputMint=YesMint123&amount=1000000",
+            content=mock_quote_bytes,
+            headers=JSON_HEADERS,
         )
 
-        with DFlowClient() as client:
-            quote = client.swap.get_quote(
-                input_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
-                output_mint="YesMint123",
-                amount=1000000,
-            )
+        quote = client.swap.get_quote(
+            input_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+            output_mint="YesMint123",
+            amount=1000000,
+        )
 
-            assert quote.in_amount == "1000000"
-            assert quote.out_amount == "1538461"
-            assert quote.price_impact_pct == 0.05
+        assert_attrs(
+            quote,
+            {"in_amount": "1000000", "out_amount": "1538461", "price_impact_pct": 0.05},
+        )
 
     def test_create_swap(
-        self, httpx_mock: HTTPXMock, mock_quote_data, mock_swap_response_data
+        self, httpx_mock: HTTPXMock, mock_quote_bytes, mock_swap_response_data, client
     ):
         """Test create_swap method."""
         # First call gets the quote
         httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/quote?inputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v&outputMint=YesMint123&amount=1000000&slippageBps=50",
-            json=mock_quote_data,
+            url=SWAP_QUOTE_URL,
+            content=mock_quote_bytes,
+            headers=JSON_HEADERS,
         )
         # Second call creates the swap
         httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/swap",
+            url=f"{Q_BASE}/swap",
             json=mock_swap_response_data,
         )
 
-        with DFlowClient() as client:
-            swap = client.swap.create_swap(
-                input_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
-                output_mint="YesMint123",
-                amount=1000000,
-                slippage_bps=50,
-                user_public_key="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
-            )
+        swap = client.swap.create_swap(
+            input_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+            output_mint="YesMint123",
+            amount=1000000,
+            slippage_bps=50,
+            user_public_key="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+        )
 
-            assert swap.swap_transaction == "base64_encoded_swap_transaction"
-            assert swap.last_valid_block_height == 123456789
+        assert swap.swap_transaction == "base64_encoded_swap_transaction"
+        assert swap.last_valid_block_height == 123456789
 
     def test_get_swap_instructions(
-        self, httpx_mock: HTTPXMock, mock_quote_data, mock_swap_instructions_data
+        self, httpx_mock: HTTPXMock, mock_quote_bytes, mock_swap_instructions_data, client
     ):
         """Test get_swap_instructions method."""
         # First call gets the quote
         httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/quote?inputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v&outputMint=YesMint123&amount=1000000&slippageBps=50",
-            json=mock_quote_data,
+            url=SWAP_QUOTE_URL,
+            content=mock_quote_bytes,
+            headers=JSON_HEADERS,
         )
         # Second call gets swap instructions
         httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/swap-instructions",
+            url=f"{Q_BASE}/swap-instructions",
             json=mock_swap_instructions_data,
         )
 
-        with DFlowClient() as client:
-            instructions = client.swap.get_swap_instructions(
-                input_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
-                output_mint="YesMint123",
-                amount=1000000,
-                slippage_bps=50,
-                user_public_key="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
-            )
+        instructions = client.swap.get_swap_instructions(
+            input_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+            output_mint="YesMint123",
+            amount=1000000,
+            slippage_bps=50,
+            user_public_key="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+        )
 
-            assert len(instructions.setup_instructions) == 1
-            assert instructions.swap_instruction is not None
-            assert len(instructions.address_lookup_table_addresses) == 1
+        assert len(instructions.setup_instructions) == 1
+        assert instructions.swap_instruction is not None
+        assert len(instructions.address_lookup_table_addresses) == 1
 
 
 class TestSearchAPI:
     """Tests for SearchAPI."""
 
-    def test_search(self, httpx_mock: HTTPXMock, mock_event_data, mock_search_data):
+    def test_search(self, httpx_mock: HTTPXMock, mock_event_data, mock_search_data, client):
         """Test search method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/search?q=bitcoin&limit=10",
+            url=f"{PM_BASE}/search?q=bitcoin&limit=10",
             json=mock_search_data,
         )
 
-        with DFlowClient() as client:
-            result = client.search.search(query="bitcoin", limit=10)
+        result = client.search.search(query="bitcoin", limit=10)
 
-            assert len(result.events) == 1
-            assert result.events[0].ticker == "BTCD-25DEC0313"
-            assert result.cursor == 0
+        assert len(result.events) == 1
+        assert result.events[0].ticker == "BTCD-25DEC0313"
+        assert result.cursor == 0
 
 
 class TestSeriesAPI:
     """Tests for SeriesAPI."""
 
-    def test_get_series(self, httpx_mock: HTTPXMock, mock_series_data):
+    def test_get_series(self, httpx_mock: HTTPXMock, mock_series_data, client):
         """Test get_series method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/series",
+            url=f"{PM_BASE}/series",
             json={"series": [mock_series_data]},
         )
 
-        with DFlowClient() as client:
-            series_list = client.series.get_series()
+        series_list = client.series.get_series()
 
-            assert len(series_list) == 1
-            assert series_list[0].ticker == "KXBTC"
-            assert series_list[0].title == "Bitcoin Price"
-            assert series_list[0].category == "Crypto"
+        assert len(series_list) == 1
+        assert series_list[0].ticker == "KXBTC"
+        assert series_list[0].title == "Bitcoin Price"
+        assert series_list[0].category == "Crypto"
 
-    def test_get_series_with_filters(self, httpx_mock: HTTPXMock, mock_series_data):
+    def test_get_series_with_filters(self, httpx_mock: HTTPXMock, mock_series_data, client):
         """Test get_series with filter parameters."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/series?category=Crypto&isInitialized=true",
+            url=f"{PM_BASE}/series?category=Crypto&isInitialized=true",
             json={"series": [mock_series_data]},
         )
 
-        with DFlowClient() as client:
-            series_list = client.series.get_series(
-                category="Crypto", is_initialized=True
-            )
-
-            assert len(series_list) == 1
-            assert series_list[0].category == "Crypto"
-
-    def test_get_series_by_ticker(self, httpx_mock: HTTPXMock, mock_series_data):
-        """Test get_series_by_ticker method."""
-        httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/series/KXBTC",
-            json=mock_series_data,
+        series_list = client.series.get_series(
+            category="Crypto", is_initialized=True
         )
 
-        with DFlowClient() as client:
-            series = client.series.get_series_by_ticker("KXBTC")
-
-            assert series.ticker == "KXBTC"
-            assert series.title == "Bitcoin Price"
+        assert len(series_list) == 1
+        assert series_list[0].category == "Crypto"
 
 
 class TestTagsAPI:
     """Tests for TagsAPI."""
 
-    def test_get_tags_by_categories(self, httpx_mock: HTTPXMock, mock_tags_data):
+    def test_get_tags_by_categories(self, httpx_mock: HTTPXMock, mock_tags_data, client):
         """Test get_tags_by_categories method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/tags_by_categories",
+            url=f"{PM_BASE}/tags_by_categories",
             json=mock_tags_data,
         )
 
-        with DFlowClient() as client:
-            tags = client.tags.get_tags_by_categories()
+        tags = client.tags.get_tags_by_categories()
 
-            assert "Crypto" in tags
-            assert "bitcoin" in tags["Crypto"]
-            assert "Politics" in tags
-            assert "election" in tags["Politics"]
+        assert "Crypto" in tags
+        assert "bitcoin" in tags["Crypto"]
+        assert "Politics" in tags
+        assert "election" in tags["Politics"]
+
+    def test_get_tags_by_categories_cached(self, httpx_mock: HTTPXMock, mock_tags_data, client):
+        """Test get_tags_by_categories reuses the cached result until cleared."""
+        httpx_mock.add_response(
+            url=f"{PM_BASE}/tags_by_categories", json=mock_tags_data, is_reusable=True
+        )
+
+        assert client.tags.get_tags_by_categories() == client.tags.get_tags_by_categories()
+        assert len(httpx_mock.get_requests()) == 1
+
+        client.tags.clear_cache()
+        client.tags.get_tags_by_categories()
+        assert len(httpx_mock.get_requests()) == 2
 
 
 class TestLiveDataAPI:
     """Tests for LiveDataAPI."""
 
-    def test_get_live_data(self, httpx_mock: HTTPXMock, mock_live_data):
+    def test_get_live_data(self, httpx_mock: HTTPXMock, mock_live_data, client):
         """Test get_live_data method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/live_data?milestoneIds=milestone-1",
+            url=f"{PM_BASE}/live_data?milestoneIds=milestone-1",
             json={"data": [mock_live_data]},
         )
 
-        with DFlowClient() as client:
-            data = client.live_data.get_live_data(["milestone-1"])
+        data = client.live_data.get_live_data(["milestone-1"])
 
-            assert len(data) == 1
-            assert data[0].milestones is not None
-            assert len(data[0].milestones) == 1
-            assert data[0].milestones[0].name == "BTC Price"
+        assert len(data) == 1
+        assert data[0].milestones is not None
+        assert len(data[0].milestones) == 1
+        assert data[0].milestones[0].name == "BTC Price"
 
-    def test_get_live_data_by_event(self, httpx_mock: HTTPXMock, mock_live_data):
-        """Test get_live_data_by_event method."""
+    def test_get_live_data_by_event_cached(self, httpx_mock: HTTPXMock, mock_live_data, client):
+        """Test a fresh by-event response is reused without a request."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/live_data/by-event/BTCD-25DEC0313",
+            url=f"{PM_BASE}/live_data/by-event/BTCD-25DEC0313",
             json=mock_live_data,
         )
 
-        with DFlowClient() as client:
-            data = client.live_data.get_live_data_by_event("BTCD-25DEC0313")
+        first = client.live_data.get_live_data_by_event("BTCD-25DEC0313")
+        second = client.live_data.get_live_data_by_event("BTCD-25DEC0313")
 
-            assert data.milestones is not None
-            assert len(data.milestones) == 1
-            assert data.milestones[0].value == "92750.00"
+        assert second is first
+        assert len(httpx_mock.get_requests()) == 1
 
-    def test_get_live_data_by_mint(self, httpx_mock: HTTPXMock, mock_live_data):
-        """Test get_live_data_by_mint method."""
-        httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/live_data/by-mint/YesMint123456789abcdefghijklmnopqrstuvwxyz",
-            json=mock_live_data,
-        )
+    def test_get_live_data_by_mint_not_modified(
+        self, httpx_mock: HTTPXMock, mock_live_data, client
+    ):
+        """Test a stale response is revalidated with its ETag and reused on 304."""
+        url = f"{PM_BASE}/live_data/by-mint/YesMint123"
+        httpx_mock.add_response(url=url, json=mock_live_data, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"v1"'})
 
-        with DFlowClient() as client:
-            data = client.live_data.get_live_data_by_mint(
-                "YesMint123456789abcdefghijklmnopqrstuvwxyz"
-            )
+        with patch("time.monotonic", return_value=1000.0):
+            first = client.live_data.get_live_data_by_mint("YesMint123")
+        with patch("time.monotonic", return_value=1002.0):
+            second = client.live_data.get_live_data_by_mint("YesMint123")
 
-            assert data.milestones is not None
-            assert len(data.milestones) == 1
+        assert second is first
+        assert len(httpx_mock.get_requests()) == 2
 
 
 class TestSportsAPI:
     """Tests for SportsAPI."""
 
-    def test_get_filters_by_sports(self, httpx_mock: HTTPXMock, mock_sports_filters_data):
+    def test_get_filters_by_sports(
+        self, httpx_mock: HTTPXMock, mock_sports_filters_data, client
+    ):
         """Test get_filters_by_sports method."""
         httpx_mock.add_response(
-            url="https://dev-prediction-markets-api.dflow.net/api/v1/filters_by_sports",
+            url=f"{PM_BASE}/filters_by_sports",
             json=mock_sports_filters_data,
         )
 
-        with DFlowClient() as client:
-            response = client.sports.get_filters_by_sports()
+        response = client.sports.get_filters_by_sports()
 
-            assert response.sport_ordering == ["NFL", "NBA"]
-            assert "NFL" in response.filters_by_sports
-            # competitions is a dict, check key exists
-            assert response.filters_by_sports["NFL"].competitions is not None
-            assert "Super Bowl" in response.filters_by_sports["NFL"].competitions
+        assert response.sport_ordering == ["NFL", "NBA"]
+        assert "NFL" in response.filters_by_sports
+        # competitions is a dict, check key exists
+        assert response.filters_by_sports["NFL"].competitions is not None
+        assert "Super Bowl" in response.filters_by_sports["NFL"].competitions
 
 
 class TestTokensAPI:
     """Tests for TokensAPI."""
 
-    def test_get_tokens(self, httpx_mock: HTTPXMock, mock_token_data):
+    def test_get_tokens(self, httpx_mock: HTTPXMock, mock_token_data, client):
         """Test get_tokens method."""
         httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/tokens",
+            url=f"{Q_BASE}/tokens",
             json=[mock_token_data],
         )
 
-        with DFlowClient() as client:
-            tokens = client.tokens.get_tokens()
+        tokens = client.tokens.get_tokens()
+
+        assert len(tokens) == 1
+        assert tokens[0].mint == "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+        assert tokens[0].symbol == "USDC"
 
-            assert len(tokens) == 1
-            assert tokens[0].mint == "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
-            assert tokens[0].symbol == "USDC"
+    def test_get_tokens_cached(self, httpx_mock: HTTPXMock, mock_token_data, client):
+        """Test get_tokens reuses the cached list until the cache is cleared."""
+        httpx_mock.add_response(url=f"{Q_BASE}/tokens", json=[mock_token_data], is_reusable=True)
+
+        first = client.tokens.get_tokens()
+        first.clear()
+        second = client.tokens.get_tokens()
+        assert len(httpx_mock.get_requests()) == 1
+        assert len(second) == 1
+
+        client.tokens.clear_cache()
+        client.tokens.get_tokens()
+        assert len(httpx_mock.get_requests()) == 2
 
     def test_get_tokens_with_decimals(
-        self, httpx_mock: HTTPXMock, mock_token_with_decimals_data
+        self, httpx_mock: HTTPXMock, mock_token_with_decimals_data, client
     ):
         """Test get_tokens_with_decimals method."""
         httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/tokens-with-decimals",
+            url=f"{Q_BASE}/tokens-with-decimals",
             json=[mock_token_with_decimals_data],
         )
 
-        with DFlowClient() as client:
-            tokens = client.tokens.get_tokens_with_decimals()
+        tokens = client.tokens.get_tokens_with_decimals()
 
-            assert len(tokens) == 1
-            assert tokens[0].decimals == 6
-            assert tokens[0].symbol == "USDC"
+        assert len(tokens) == 1
+        assert tokens[0].decimals == 6
+        assert tokens[0].symbol == "USDC"
 
 
 class TestVenuesAPI:
     """Tests for VenuesAPI."""
 
-    def test_get_venues(self, httpx_mock: HTTPXMock, mock_venue_data):
+    def test_get_venues(self, httpx_mock: HTTPXMock, mock_venue_data, client):
         """Test get_venues method."""
         httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/venues",
+            url=f"{Q_BASE}/venues",
             json=[mock_venue_data],
         )
 
-        with DFlowClient() as client:
-            venues = client.venues.get_venues()
+        venues = client.venues.get_venues()
 
-            assert len(venues) == 1
-            assert venues[0].name == "kalshi"
-            assert venues[0].label == "Kalshi"
+        assert len(venues) == 1
+        assert venues[0].name == "kalshi"
+        assert venues[0].label == "Kalshi"
 
 
 class TestOrdersAPI:
     """Tests for OrdersAPI."""
 
-    def test_get_order(self, httpx_mock: HTTPXMock, mock_order_response_data):
+    def test_get_order(self, httpx_mock: HTTPXMock, mock_order_response_data, client):
         """Test get_order method."""
         httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/order?inputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v&outputMint=YesMint123&amount=1000000&slippageBps=50&userPublicKey=7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+            url=f"{Q_BASE}/order?inputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v&outputMint=YesMint123&amount=1000000&slippageBps=50&userPublicKey=7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
             json=mock_order_response_data,
         )
 
-        with DFlowClient() as client:
-            order = client.orders.get_order(
-                input_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
-                output_mint="YesMint123",
-                amount=1000000,
-                slippage_bps=50,
-                user_public_key="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
-            )
+        order = client.orders.get_order(
+            input_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+            output_mint="YesMint123",
+            amount=1000000,
+            slippage_bps=50,
+            user_public_key="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+        )
 
-            assert order.transaction == "base64_encoded_transaction"
-            assert order.in_amount == "1000000"
-            assert order.out_amount == "1538461"
-            assert order.execution_mode == "sync"
+        assert_attrs(
+            order,
+            {
+                "transaction": "base64_encoded_transaction",
+                "in_amount": "1000000",
+                "out_amount": "1538461",
+                "execution_mode": "sync",
+            },
+        )
 
-    def test_get_order_status(self, httpx_mock: HTTPXMock, mock_order_status_data):
+    def test_get_order_status(self, httpx_mock: HTTPXMock, mock_order_status_data, client):
         """Test get_order_status method."""
         httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/order-status?signature=5TuPHPFe7p3nLh123456",
+            url=f"{Q_BASE}/order-status?signature=5TuPHPFe7p3nLh123456",
             json=mock_order_status_data,
         )
 
-        with DFlowClient() as client:
-            status = client.orders.get_order_status("5TuPHPFe7p3nLh123456")
+        status = client.orders.get_order_status("5TuPHPFe7p3nLh123456")
+
+        assert status.status == "closed"
+        assert status.signature == "5TuPHPFe7p3nLh123456"
+        assert len(status.fills) == 1
+        assert status.fills[0].price == 65
+        assert status.fills[0].in_amount == "1000000"
 
-            assert status.status == "closed"
-            assert status.signature == "5TuPHPFe7p3nLh123456"
-            assert len(status.fills) == 1
-            assert status.fills[0].price == 65
-            assert status.fills[0].in_amount == "1000000"
+
+@pytest.fixture
+def intent_endpoints(httpx_mock: HTTPXMock, mock_intent_quote_bytes, mock_intent_response_bytes):
+    """Mock the quote and submit endpoints used by submit_intent."""
+    # First call gets the quote
+    httpx_mock.add_response(
+        url=INTENT_QUOTE_URL,
+        content=mock_intent_quote_bytes,
+        headers=JSON_HEADERS,
+    )
+    # Second call submits the intent
+    httpx_mock.add_response(
+        url=f"{Q_BASE}/submit-intent",
+        content=mock_intent_response_bytes,
+        headers=JSON_HEADERS,
+    )
 
 
 class TestIntentAPI:
     """Tests for IntentAPI."""
 
-    def test_get_intent_quote(self, httpx_mock: HTTPXMock, mock_intent_quote_data):
+    def test_get_intent_quote(self, httpx_mock: HTTPXMock, mock_intent_quote_data, client):
         """Test get_intent_quote method."""
         httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/intent?inputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v&outputMint=YesMint123&amount=1000000&mode=ExactIn",
+            url=INTENT_QUOTE_URL,
             json=mock_intent_quote_data,
         )
 
-        with DFlowClient() as client:
-            quote = client.intent.get_intent_quote(
-                input_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
-                output_mint="YesMint123",
-                amount=1000000,
-                mode="ExactIn",
-            )
+        quote = client.intent.get_intent_quote(
+            input_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+            output_mint="YesMint123",
+            amount=1000000,
+            mode="ExactIn",
+        )
 
-            assert quote.in_amount == "1000000"
-            assert quote.out_amount == "1538461"
-            assert quote.min_out_amount == "1500000"
-            assert quote.max_in_amount == "1050000"
+        assert_attrs(
+            quote,
+            {
+                "in_amount": "1000000",
+                "out_amount": "1538461",
+                "min_out_amount": "1500000",
+                "max_in_amount": "1050000",
+            },
+        )
 
-    def test_submit_intent(
-        self, httpx_mock: HTTPXMock, mock_intent_quote_data, mock_intent_response_data
-    ):
+    def test_submit_intent(self, intent_endpoints, client):
         """Test submit_intent method."""
-        # First call gets the quote
-        httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/intent?inputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v&outputMint=YesMint123&amount=1000000&mode=ExactIn",
-            json=mock_intent_quote_data,
-        )
-        # Second call submits the intent
-        httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/submit-intent",
-            json=mock_intent_response_data,
+        response = client.intent.submit_intent(
+            input_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+            output_mint="YesMint123",
+            amount=1000000,
+            mode="ExactIn",
+            user_public_key="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+            slippage_bps=50,
         )
 
-        with DFlowClient() as client:
-            response = client.intent.submit_intent(
-                input_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
-                output_mint="YesMint123",
-                amount=1000000,
-                mode="ExactIn",
-                user_public_key="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
-                slippage_bps=50,
-            )
-
-            assert response.transaction == "base64_encoded_intent_transaction"
-            assert response.intent_id == "intent-123456"
-            assert response.quote is not None
+        assert response.transaction == "base64_encoded_intent_transaction"
+        assert response.intent_id == "intent-123456"
+        assert response.quote is not None
 
 
 class TestPredictionMarketAPI:
     """Tests for PredictionMarketAPI."""
 
-    def test_initialize_market(self, httpx_mock: HTTPXMock):
+    def test_initialize_market(self, httpx_mock: HTTPXMock, client):
         """Test initialize_market method."""
         mock_init_response = {
             "transaction": "base64_encoded_init_transaction",
@@ -827,16 +994,20 @@ class TestPredictionMarketAPI:
             "marketLedger": "Ledger123456789abcdefghijklmnopqrstuvwxyz",
         }
         httpx_mock.add_response(
-            url="https://dev-quote-api.dflow.net/prediction-market-init?marketTicker=MY-MARKET&userPublicKey=7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU&settlementMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+            url=f"{Q_BASE}/prediction-market-init?marketTicker=MY-MARKET&userPublicKey=7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU&settlementMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
             json=mock_init_response,
         )
 
-        with DFlowClient() as client:
-            response = client.prediction_market.initialize_market(
-                market_ticker="MY-MARKET",
-                user_public_key="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
-            )
+        response = client.prediction_market.initialize_market(
+            market_ticker="MY-MARKET",
+            user_public_key="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+        )
 
-            assert response.transaction == "base64_encoded_init_transaction"
-            assert response.yes_mint == "YesMint123456789abcdefghijklmnopqrstuvwxyz"
-            assert response.no_mint == "NoMint123456789abcdefghijklmnopqrstuvwxyz"
+        assert_attrs(
+            response,
+            {
+                "transaction": "base64_encoded_init_transaction",
+                "yes_mint": "YesMint123456789abcdefghijklmnopqrstuvwxyz",
+                "no_mint": "NoMint123456789abcdefghijklmnopqrstuvwxyz",
+            },
+        )
@@ -0,0 +1,117 @@
+"""Tests for TTL and on-disk cache utilities."""
+
+from unittest.mock import patch
+
+from dflow.utils.cache import TTL_CACHE_MAX_SIZE, ttl_cache
+from dflow.utils.diskcache import FileCache
+
+
+class FakeAPI:
+    """API stand-in that counts calls to its cached method."""
+
+    def __init__(self, cache_ttl: float = 60.0):
+        self._cache_ttl = cache_ttl
+        self._cache: dict = {}
+        self.calls = 0
+
+    @ttl_cache
+    def get_items(self, kind: str | None = None) -> list[str]:
+        self.calls += 1
+        return [f"{kind}-{self.calls}"]
+
+
+class TestTtlCache:
+    """Tests for the ttl_cache decorator."""
+
+    def test_reuses_result_within_ttl(self):
+        """Test repeated calls with the same arguments hit the cache."""
+        api = FakeAPI()
+
+        assert api.get_items("a") == api.get_items("a")
+        assert api.calls == 1
+
+    def test_keys_on_arguments(self):
+        """Test different arguments are cached separately."""
+        api = FakeAPI()
+        api.get_items("a")
+        api.get_items(kind="a")
+        api.get_items("b")
+
+        assert api.calls == 3
+
+    def test_refetches_after_ttl(self):
+        """Test results older than the TTL are fetched again."""
+        api = FakeAPI(cache_ttl=10.0)
+        with patch("dflow.utils.cache.time.monotonic", side_effect=[100.0, 111.0]):
+            api.get_items("a")
+            api.get_items("a")
+
+        assert api.calls == 2
+
+    def test_zero_ttl_disables_cache(self):
+        """Test a TTL of 0 always calls through and stores nothing."""
+        api = FakeAPI(cache_ttl=0)
+        api.get_items("a")
+        api.get_items("a")
+
+        assert api.calls == 2
+        assert api._cache == {}
+
+    def test_returns_copy_of_lists(self):
+        """Test callers cannot mutate the cached list."""
+        api = FakeAPI()
+        api.get_items("a").append("extra")
+
+        assert api.get_items("a") == ["a-1"]
+
+    def test_list_arguments_are_cached(self):
+        """Test list and dict arguments are frozen into cache keys."""
+        api = FakeAPI()
+        api.get_items(["a", "b"])
+        api.get_items(["a", "b"])
+        api.get_items({"sport": "nba"})
+        api.get_items({"sport": "nba"})
+
+        assert api.calls == 2
+
+    def test_unhashable_arguments_bypass_cache(self):
+        """Test arguments that cannot be frozen are passed through uncached."""
+        api = FakeAPI()
+        api.get_items(bytearray(b"a"))
+        api.get_items(bytearray(b"a"))
+
+        assert api.calls == 2
+        assert api._cache == {}
+
+    def test_evicts_oldest_entry_when_full(self):
+        """Test the cache stays bounded by evicting the oldest entry."""
+        api = FakeAPI()
+        for i in range(TTL_CACHE_MAX_SIZE + 1):
+            api.get_items(str(i))
+
+        assert len(api._cache) == TTL_CACHE_MAX_SIZE
+        api.get_items("0")
+        assert api.calls == TTL_CACHE_MAX_SIZE + 2
+
+
+class TestFileCache:
+    """Tests for FileCache."""
+
+    def test_round_trip_across_instances(self, tmp_path):
+        """Test stored values are read back by a new cache on the same directory."""
+        FileCache(tmp_path).set("market:A", {"ticker": "A", "volume": 1})
+
+        cache = FileCache(tmp_path)
+        assert cache.get("market:A") == {"ticker": "A", "volume": 1}
+        assert cache.get("market:B") is None
+
+        cache.clear()
+        assert cache.get("market:A") is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test an unreadable entry is treated as missing."""
+        cache = FileCache(tmp_path)
+        cache.set("market:A", {"ticker": "A"})
+        next(tmp_path.glob("*.json")).write_text("{not json")
+
+        assert cache.get("market:A") is None
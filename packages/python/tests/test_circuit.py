@@ -0,0 +1,149 @@
+"""Tests for circuit breaker utilities."""
+
+import asyncio
+
+import pytest
+
+from dflow.utils.circuit import CircuitBreaker, CircuitOpenError, get_circuit_breaker
+from dflow.utils.http import DFlowApiError
+from dflow.utils.retry import with_retry, with_retry_async
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_starts_closed(self):
+        """Test a new breaker allows calls."""
+        breaker = CircuitBreaker()
+        assert breaker.state == "closed"
+        assert breaker.allow() is True
+
+    def test_opens_after_threshold(self):
+        """Test breaker opens once failures reach the threshold and rate."""
+        breaker = CircuitBreaker(failure_threshold=3, error_rate=0.5, cooldown_s=60.0)
+        for _ in range(3):
+            breaker.on_failure()
+
+        assert breaker.state == "open"
+        assert breaker.allow() is False
+
+    def test_stays_closed_below_error_rate(self):
+        """Test breaker stays closed when failures are diluted by successes."""
+        breaker = CircuitBreaker(failure_threshold=3, error_rate=0.5)
+        for _ in range(10):
+            breaker.on_success()
+        for _ in range(3):
+            breaker.on_failure()
+
+        assert breaker.state == "closed"
+
+    def test_half_open_admits_single_probe(self):
+        """Test only one probe is admitted after the cooldown."""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_s=0.0)
+        breaker.on_failure()
+
+        assert breaker.allow() is True
+        assert breaker.state == "half_open"
+        assert breaker.allow() is False
+
+    def test_probe_success_closes(self):
+        """Test a successful probe closes the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_s=0.0)
+        breaker.on_failure()
+        breaker.allow()
+        breaker.on_success()
+
+        assert breaker.state == "closed"
+
+    def test_probe_failure_reopens(self):
+        """Test a failed probe re-opens the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_s=60.0)
+        breaker.on_failure()
+        breaker._opened_at -= 60.0
+        breaker.allow()
+        breaker.on_failure()
+
+        assert breaker.state == "open"
+        assert breaker.allow() is False
+
+    def test_release_frees_probe(self):
+        """Test releasing an abandoned probe admits the next one."""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_s=0.0)
+        breaker.on_failure()
+        breaker.allow()
+        breaker.release()
+
+        assert breaker.state == "half_open"
+        assert breaker.allow() is True
+
+    def test_registry_shares_breaker(self):
+        """Test the same key returns the same breaker."""
+        assert get_circuit_breaker("test-shared") is get_circuit_breaker("test-shared")
+
+
+class TestWithRetryCircuit:
+    """Tests for with_retry circuit breaker integration."""
+
+    def test_open_circuit_fails_fast(self):
+        """Test calls are rejected without invoking fn while the circuit is open."""
+        call_count = 0
+
+        def always_fail():
+            nonlocal call_count
+            call_count += 1
+            raise DFlowApiError("Service unavailable", 503)
+
+        breaker = get_circuit_breaker("test-fail-fast")
+        breaker.failure_threshold = 2
+        breaker.cooldown_s = 60.0
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            with_retry(
+                always_fail,
+                max_retries=5,
+                initial_delay_ms=1,
+                breaker_key="test-fail-fast",
+            )
+
+        assert exc_info.value.key == "test-fail-fast"
+        assert call_count == 2
+
+        with pytest.raises(CircuitOpenError):
+            with_retry(always_fail, breaker_key="test-fail-fast")
+        assert call_count == 2
+
+    def test_interrupted_probe_is_released(self):
+        """Test a probe that raises BaseException does not keep the circuit stuck."""
+        breaker = get_circuit_breaker("test-interrupted-probe")
+        breaker.failure_threshold = 1
+        breaker.cooldown_s = 0.0
+        breaker.on_failure()
+
+        def interrupted():
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            with_retry(interrupted, breaker_key="test-interrupted-probe")
+
+        assert breaker.allow() is True
+
+    async def test_cancelled_probe_is_released(self):
+        """Test cancelling an async probe frees the half-open slot."""
+        breaker = get_circuit_breaker("test-cancelled-probe")
+        breaker.failure_threshold = 1
+        breaker.cooldown_s = 0.0
+        breaker.on_failure()
+        started = asyncio.Event()
+
+        async def hang():
+            started.set()
+            await asyncio.Event().wait()
+
+        task = asyncio.create_task(with_retry_async(hang, breaker_key="test-cancelled-probe"))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert breaker.state == "half_open"
+        assert breaker.allow() is True
@@ -1,19 +1,47 @@
 """Tests for HTTP client."""
 
+import asyncio
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
-from dflow.utils.http import DFlowApiError, HttpClient
+from dflow.utils.http import AsyncHttpClient, DFlowApiError, HttpClient, _ssl_context
+
+
+@pytest.fixture(scope="module")
+def http_client():
+    """Shared keyless client; ``pytest_httpx`` mocks its transport per test."""
+    with HttpClient("https://api.example.com") as client:
+        yield client
 
 
 class TestHttpClient:
     """Tests for HttpClient."""
 
-    def test_init_adds_trailing_slash(self):
+    def test_init_adds_trailing_slash(self, http_client):
         """Test that base URL gets trailing slash."""
-        client = HttpClient("https://api.example.com")
-        assert client.base_url == "https://api.example.com/"
-        client.close()
+        assert http_client.base_url == "https://api.example.com/"
+
+    def test_ssl_context_is_shared(self, monkeypatch: pytest.MonkeyPatch):
+        """Test clients reuse one SSL context instead of loading CA certs each time."""
+        _ssl_context()
+        loads = []
+        original = ssl.SSLContext.load_verify_locations
+        monkeypatch.setattr(
+            ssl.SSLContext,
+            "load_verify_locations",
+            lambda ctx, *args, **kwargs: loads.append(1) or original(ctx, *args, **kwargs),
+        )
+
+        for _ in range(3):
+            HttpClient("https://api.example.com").close()
+
+        assert loads == []
 
     def test_init_preserves_trailing_slash(self):
         """Test that existing trailing slash is preserved."""
@@ -21,57 +49,75 @@ class TestHttpClient:
         assert client.base_url == "https://api.example.com/"
         client.close()
 
-    def test_get_request(self, httpx_mock: HTTPXMock):
+    def test_get_request(self, httpx_mock: HTTPXMock, http_client):
         """Test GET request."""
         httpx_mock.add_response(
             url="https://api.example.com/markets",
             json={"markets": []},
         )
         
-        client = HttpClient("https://api.example.com")
-        result = client.get("/markets")
+        result = http_client.get("/markets")
         
         assert result == {"markets": []}
-        client.close()
 
-    def test_get_request_with_params(self, httpx_mock: HTTPXMock):
+    def test_get_request_with_params(self, httpx_mock: HTTPXMock, http_client):
         """Test GET request with query parameters."""
         httpx_mock.add_response(
             url="https://api.example.com/markets?status=active&limit=10",
             json={"markets": []},
         )
         
-        client = HttpClient("https://api.example.com")
-        result = client.get("/markets", {"status": "active", "limit": 10})
+        result = http_client.get("/markets", {"status": "active", "limit": 10})
         
         assert result == {"markets": []}
-        client.close()
 
-    def test_get_request_filters_none_params(self, httpx_mock: HTTPXMock):
+    def test_get_request_filters_none_params(self, httpx_mock: HTTPXMock, http_client):
         """Test GET request filters out None parameters."""
         httpx_mock.add_response(
             url="https://api.example.com/markets?status=active",
             json={"markets": []},
         )
         
-        client = HttpClient("https://api.example.com")
-        result = client.get("/markets", {"status": "active", "cursor": None})
+        result = http_client.get("/markets", {"status": "active", "cursor": None})
         
         assert result == {"markets": []}
-        client.close()
 
-    def test_post_request(self, httpx_mock: HTTPXMock):
+    def test_get_conditional_not_modified(self, httpx_mock: HTTPXMock, http_client):
+        """Test conditional GET sends If-None-Match and reports 304 as None."""
+        httpx_mock.add_response(
+            url="https://api.example.com/live",
+            status_code=304,
+            match_headers={"If-None-Match": '"v1"'},
+        )
+
+        result, etag = http_client.get_conditional("/live", etag='"v1"')
+
+        assert result is None
+        assert etag == '"v1"'
+
+    def test_get_conditional_returns_etag(self, httpx_mock: HTTPXMock, http_client):
+        """Test conditional GET returns the body and the response ETag."""
+        httpx_mock.add_response(
+            url="https://api.example.com/live",
+            json={"value": 1},
+            headers={"ETag": '"v2"'},
+        )
+
+        result, etag = http_client.get_conditional("/live")
+
+        assert result == {"value": 1}
+        assert etag == '"v2"'
+
+    def test_post_request(self, httpx_mock: HTTPXMock, http_client):
         """Test POST request."""
         httpx_mock.add_response(
             url="https://api.example.com/swap",
             json={"transaction": "base64..."},
         )
         
-        client = HttpClient("https://api.example.com")
-        result = client.post("/swap", {"amount": 1000000})
+        result = http_client.post("/swap", {"amount": 1000000})
         
         assert result == {"transaction": "base64..."}
-        client.close()
 
     def test_api_key_header(self, httpx_mock: HTTPXMock):
         """Test API key is included in headers."""
@@ -87,7 +133,7 @@ class TestHttpClient:
         assert request.headers["x-api-key"] == "test-api-key"
         client.close()
 
-    def test_error_response_raises_exception(self, httpx_mock: HTTPXMock):
+    def test_error_response_raises_exception(self, httpx_mock: HTTPXMock, http_client):
         """Test error response raises DFlowApiError."""
         httpx_mock.add_response(
             url="https://api.example.com/markets",
@@ -95,16 +141,13 @@ class TestHttpClient:
             json={"error": "Not found"},
         )
         
-        client = HttpClient("https://api.example.com")
-        
         with pytest.raises(DFlowApiError) as exc_info:
-            client.get("/markets")
+            http_client.get("/markets")
         
         assert exc_info.value.status_code == 404
         assert exc_info.value.response == {"error": "Not found"}
-        client.close()
 
-    def test_rate_limit_error(self, httpx_mock: HTTPXMock):
+    def test_rate_limit_error(self, httpx_mock: HTTPXMock, http_client):
         """Test rate limit error."""
         httpx_mock.add_response(
             url="https://api.example.com/markets",
@@ -112,13 +155,38 @@ class TestHttpClient:
             json={"error": "Rate limit exceeded"},
         )
         
-        client = HttpClient("https://api.example.com")
-        
         with pytest.raises(DFlowApiError) as exc_info:
-            client.get("/markets")
+            http_client.get("/markets")
         
         assert exc_info.value.status_code == 429
-        client.close()
+        assert exc_info.value.retry_after is None
+
+    def test_rate_limit_error_retry_after(self, httpx_mock: HTTPXMock, http_client):
+        """Test Retry-After header is parsed onto the error."""
+        httpx_mock.add_response(
+            url="https://api.example.com/markets",
+            status_code=429,
+            headers={"Retry-After": "7"},
+            json={"error": "Rate limit exceeded"},
+        )
+
+        with pytest.raises(DFlowApiError) as exc_info:
+            http_client.get("/markets")
+
+        assert exc_info.value.retry_after == 7.0
+
+    def test_post_error_is_not_idempotent(self, httpx_mock: HTTPXMock, http_client):
+        """Test POST errors are flagged as non-idempotent."""
+        httpx_mock.add_response(
+            url="https://api.example.com/swap",
+            status_code=503,
+            json={"error": "Service unavailable"},
+        )
+
+        with pytest.raises(DFlowApiError) as exc_info:
+            http_client.post("/swap", {"amount": 1000000})
+
+        assert exc_info.value.idempotent is False
 
     def test_set_api_key(self):
         """Test setting API key after initialization."""
@@ -129,20 +197,232 @@ class TestHttpClient:
         assert client.api_key == "new-key"
         client.close()
 
+    @pytest.mark.parametrize("http2", [False, True])
+    def test_set_api_key_keeps_connection_pool(self, http2):
+        """Test rotating the key reuses the same client and sends the new key."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("x-api-key"))
+            return httpx.Response(200, json={})
+
+        client = HttpClient(
+            "https://api.example.com",
+            api_key="old",
+            transport=httpx.MockTransport(handler),
+            http2=http2,
+        )
+        pool = client._client
+        client.get("/a")
+        client.set_api_key("new-key")
+        client.get("/a")
+
+        assert client._client is pool
+        assert seen == ["old", "new-key"]
+        client.close()
+
+    def test_concurrent_identical_gets_are_coalesced(self):
+        """Test a GET issued while an identical one is in flight shares its result."""
+        calls = []
+        entered = threading.Event()
+        release = threading.Event()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            entered.set()
+            release.wait(5)
+            return httpx.Response(200, json={"ticker": "A"})
+
+        client = HttpClient("https://api.example.com", transport=httpx.MockTransport(handler))
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.get("/market/A")))
+            for _ in range(2)
+        ]
+        threads[0].start()
+        entered.wait(5)
+        threads[1].start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert calls == ["https://api.example.com/market/A"]
+        assert results == [{"ticker": "A"}, {"ticker": "A"}]
+        client.get("/market/A")
+        assert len(calls) == 2
+        client.close()
+
+    def test_close_shuts_down_own_executor_only(self):
+        """Test close shuts down the client's own pool but not a shared one."""
+        client = HttpClient("https://api.example.com")
+        own = client.executor
+        assert client.executor is own
+        client.close()
+        with pytest.raises(RuntimeError):
+            own.submit(int)
+
+        shared = ThreadPoolExecutor(max_workers=1)
+        client = HttpClient("https://api.example.com", executor=shared)
+        client.close()
+        assert shared.submit(int).result() == 0
+        shared.shutdown()
+
+    def test_max_retries_retries_transient_errors(self, no_sleep):
+        """Test 503 responses are retried when max_retries is set."""
+        statuses = iter([503, 503, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={"ok": True})
+
+        transport = httpx.MockTransport(handler)
+        client = HttpClient("https://api.example.com", transport=transport, max_retries=2)
+        assert client.get("/markets") == {"ok": True}
+        client.close()
+
+        statuses = iter([503])
+        client = HttpClient("https://api.example.com", transport=transport)
+        with pytest.raises(DFlowApiError) as exc_info:
+            client.get("/markets")
+        assert exc_info.value.status_code == 503
+        client.close()
+
+    def test_max_retries_connect_error_is_retried_once_per_attempt(self, no_sleep):
+        """Test a connect error makes max_retries + 1 attempts, and POSTs are not repeated."""
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request.method)
+            raise httpx.ConnectError("connection refused", request=request)
+
+        transport = httpx.MockTransport(handler)
+        with HttpClient("https://api.example.com", transport=transport, max_retries=2) as client:
+            with pytest.raises(httpx.ConnectError):
+                client.get("/markets")
+            assert attempts == ["GET"] * 3
+
+            attempts.clear()
+            with pytest.raises(httpx.ConnectError):
+                client.post("/swap", {"amount": 1})
+            assert attempts == ["POST"]
+
+
+class TestAsyncHttpClient:
+    """Tests for AsyncHttpClient."""
+
+    async def test_concurrent_get_requests(self, httpx_mock: HTTPXMock):
+        """Test gathered GET requests each get their own parsed response."""
+        for ticker in ("A", "B"):
+            httpx_mock.add_response(
+                url=f"https://api.example.com/market/{ticker}",
+                json={"ticker": ticker},
+            )
+
+        async with AsyncHttpClient("https://api.example.com") as client:
+            results = await asyncio.gather(client.get("/market/A"), client.get("/market/B"))
+
+        assert results == [{"ticker": "A"}, {"ticker": "B"}]
+
+    async def test_concurrent_identical_gets_are_coalesced(self):
+        """Test gathered identical GETs send a single request."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            return httpx.Response(200, json={"mints": ["a"]})
+
+        transport = httpx.MockTransport(handler)
+        async with AsyncHttpClient("https://api.example.com", transport=transport) as client:
+            results = await asyncio.gather(
+                client.get("/outcome_mints", {"ids": ["x", "y"]}),
+                client.get("/outcome_mints", {"ids": ["x", "y"]}),
+            )
+
+        assert len(calls) == 1
+        assert results == [{"mints": ["a"]}, {"mints": ["a"]}]
+
+    async def test_cancelled_waiter_leaves_shared_get_running(self):
+        """Test cancelling one waiter neither cancels nor leaks the shared GET."""
+        calls = []
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            await release.wait()
+            return httpx.Response(200, json={"call": len(calls)})
+
+        transport = httpx.MockTransport(handler)
+        async with AsyncHttpClient("https://api.example.com", transport=transport) as client:
+            first = asyncio.ensure_future(client.get("/markets"))
+            while not calls:
+                await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+            second = asyncio.ensure_future(client.get("/markets"))
+            release.set()
+            assert await second == {"call": 1}
+            assert client._inflight == {}
+            assert await client.get("/markets") == {"call": 2}
+
+    async def test_post_and_api_key(self, httpx_mock: HTTPXMock):
+        """Test POST bodies are JSON encoded and a rotated key is sent."""
+        httpx_mock.add_response(
+            url="https://api.example.com/swap",
+            method="POST",
+            match_json={"amount": 1},
+            match_headers={"x-api-key": "new-key"},
+            json={"ok": True},
+        )
+
+        async with AsyncHttpClient("https://api.example.com", api_key="old") as client:
+            client.set_api_key("new-key")
+            assert await client.post("/swap", {"amount": 1}) == {"ok": True}
+
+    async def test_max_retries_connect_error(self, no_sleep):
+        """Test a connect error is retried by the single with_retry_async layer."""
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request.method)
+            raise httpx.ConnectError("connection refused", request=request)
+
+        transport = httpx.MockTransport(handler)
+        async with AsyncHttpClient(
+            "https://api.example.com", transport=transport, max_retries=2
+        ) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("/markets")
+
+        assert attempts == ["GET"] * 3
+
+    async def test_error_response_raises_exception(self, httpx_mock: HTTPXMock):
+        """Test non-2xx responses raise DFlowApiError."""
+        httpx_mock.add_response(status_code=404, json={"error": "Not found"})
+
+        async with AsyncHttpClient("https://api.example.com") as client:
+            with pytest.raises(DFlowApiError) as exc_info:
+                await client.get("/missing")
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.response == {"error": "Not found"}
+
 
 class TestDFlowApiError:
     """Tests for DFlowApiError."""
 
-    def test_error_message(self):
-        """Test error message."""
-        error = DFlowApiError("HTTP 404: Not Found", 404, {"error": "Not found"})
-        assert str(error) == "HTTP 404: Not Found"
-        assert error.status_code == 404
-        assert error.response == {"error": "Not found"}
-
-    def test_error_without_response(self):
-        """Test error without response body."""
-        error = DFlowApiError("HTTP 500: Internal Server Error", 500)
-        assert str(error) == "HTTP 500: Internal Server Error"
-        assert error.status_code == 500
-        assert error.response is None
+    @pytest.mark.parametrize(
+        "args, response",
+        [
+            (("HTTP 404: Not Found", 404, {"error": "Not found"}), {"error": "Not found"}),
+            # Response body is optional
+            (("HTTP 500: Internal Server Error", 500), None),
+        ],
+    )
+    def test_error_attributes(self, args, response):
+        """Test error message, status code and response body."""
+        error = DFlowApiError(*args)
+        assert str(error) == args[0]
+        assert error.status_code == args[1]
+        assert error.response == response
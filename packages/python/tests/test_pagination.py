@@ -1,16 +1,32 @@
 """Tests for pagination utilities."""
 
+from collections.abc import Callable
+from typing import NamedTuple
+
 import pytest
+from pydantic import BaseModel, ValidationError
 
-from dflow.utils.pagination import collect_all, count_all, find_first, paginate
+from dflow.utils.pagination import (
+    _list_adapter,
+    collect_all,
+    collect_all_raw,
+    count_all,
+    find_first,
+    paginate,
+)
 
 
-class MockResponse:
+class MockResponse(NamedTuple):
     """Mock paginated response."""
 
-    def __init__(self, items: list, cursor: str | None = None):
-        self.items = items
-        self.cursor = cursor
+    items: list
+    cursor: str | None = None
+
+
+def paged_fetch(pages: list) -> Callable[[dict], MockResponse]:
+    """Create a fetch_page fake that returns the given pages in order."""
+    next_page = iter(pages).__next__
+    return lambda params: next_page()
 
 
 class TestPaginate:
@@ -35,12 +51,7 @@ class TestPaginate:
             MockResponse(items=[4, 5, 6], cursor="cursor2"),
             MockResponse(items=[7, 8, 9], cursor=None),
         ]
-        page_index = [0]
-        
-        def fetch_page(params):
-            response = pages[page_index[0]]
-            page_index[0] += 1
-            return response
+        fetch_page = paged_fetch(pages)
         
         results = list(paginate(
             fetch_page,
@@ -55,12 +66,7 @@ class TestPaginate:
             MockResponse(items=[1, 2, 3], cursor="cursor1"),
             MockResponse(items=[4, 5, 6], cursor="cursor2"),
         ]
-        page_index = [0]
-        
-        def fetch_page(params):
-            response = pages[page_index[0]]
-            page_index[0] += 1
-            return response
+        fetch_page = paged_fetch(pages)
         
         results = list(paginate(
             fetch_page,
@@ -70,6 +76,23 @@ class TestPaginate:
         
         assert results == [1, 2, 3, 4, 5]
 
+    def test_max_items_at_page_boundary(self):
+        """Test reaching max_items at the end of a page stops fetching."""
+        calls = []
+
+        def fetch_page(params):
+            calls.append(params)
+            return MockResponse(items=[1, 2, 3], cursor="cursor1")
+
+        results = list(paginate(
+            fetch_page,
+            get_items=lambda r: r.items,
+            max_items=3,
+        ))
+
+        assert results == [1, 2, 3]
+        assert len(calls) == 1
+
     def test_empty_response(self):
         """Test pagination with empty response."""
         def fetch_page(params):
@@ -92,12 +115,7 @@ class TestCollectAll:
             MockResponse(items=["a", "b"], cursor="c1"),
             MockResponse(items=["c", "d"], cursor=None),
         ]
-        page_index = [0]
-        
-        def fetch_page(params):
-            response = pages[page_index[0]]
-            page_index[0] += 1
-            return response
+        fetch_page = paged_fetch(pages)
         
         results = collect_all(
             fetch_page,
@@ -120,6 +138,72 @@ class TestCollectAll:
         assert results == [1, 2, 3]
 
 
+class RawItem(BaseModel):
+    """Model used to validate raw pagination items."""
+
+    id: int
+
+
+class TestCollectAllRaw:
+    """Tests for collect_all_raw function."""
+
+    def test_collect_all_raw_validates_items(self):
+        """Test raw items from every page are validated into models."""
+        fetch_page = paged_fetch([
+            {"items": [{"id": 1}, {"id": 2}], "cursor": "c1"},
+            {"items": [{"id": 3}], "cursor": None},
+        ])
+
+        results = collect_all_raw(
+            fetch_page,
+            get_items=lambda r: r["items"],
+            item_type=RawItem,
+            get_cursor=lambda r: r["cursor"],
+        )
+
+        assert results == [RawItem(id=1), RawItem(id=2), RawItem(id=3)]
+
+    def test_collect_all_raw_with_limit(self):
+        """Test collect_all_raw stops fetching once max_items is reached."""
+        fetch_page = paged_fetch([
+            {"items": [{"id": 1}, {"id": 2}], "cursor": "c1"},
+        ])
+
+        results = collect_all_raw(
+            fetch_page,
+            get_items=lambda r: r["items"],
+            item_type=RawItem,
+            get_cursor=lambda r: r["cursor"],
+            max_items=1,
+        )
+
+        assert results == [RawItem(id=1)]
+
+    def test_collect_all_raw_default_cursor_reads_dict_pages(self):
+        """Test the default cursor getter follows the "cursor" key of raw pages."""
+        fetch_page = paged_fetch([
+            {"items": [{"id": 1}], "cursor": "c1"},
+            {"items": [{"id": 2}], "cursor": None},
+        ])
+
+        results = collect_all_raw(fetch_page, get_items=lambda r: r["items"], item_type=RawItem)
+
+        assert results == [RawItem(id=1), RawItem(id=2)]
+        assert _list_adapter(RawItem) is _list_adapter(RawItem)
+
+    def test_collect_all_raw_invalid_item(self):
+        """Test collect_all_raw raises when an item fails validation."""
+        fetch_page = paged_fetch([{"items": [{"id": "x"}], "cursor": None}])
+
+        with pytest.raises(ValidationError):
+            collect_all_raw(
+                fetch_page,
+                get_items=lambda r: r["items"],
+                item_type=RawItem,
+                get_cursor=lambda r: r["cursor"],
+            )
+
+
 class TestCountAll:
     """Tests for count_all function."""
 
@@ -129,12 +213,7 @@ class TestCountAll:
             MockResponse(items=[1, 2, 3], cursor="c1"),
             MockResponse(items=[4, 5], cursor=None),
         ]
-        page_index = [0]
-        
-        def fetch_page(params):
-            response = pages[page_index[0]]
-            page_index[0] += 1
-            return response
+        fetch_page = paged_fetch(pages)
         
         count = count_all(
             fetch_page,
@@ -180,12 +259,7 @@ class TestFindFirst:
             MockResponse(items=[3, 4], cursor="c2"),
             MockResponse(items=[5, 6], cursor=None),
         ]
-        page_index = [0]
-        
-        def fetch_page(params):
-            response = pages[page_index[0]]
-            page_index[0] += 1
-            return response
+        fetch_page = paged_fetch(pages)
         
         result = find_first(
             fetch_page,
@@ -194,3 +268,20 @@ class TestFindFirst:
         )
         
         assert result == 4
+
+    def test_find_first_stops_fetching_after_match(self):
+        """Test no further pages are fetched once a match is found."""
+        calls = []
+
+        def fetch_page(params):
+            calls.append(params)
+            return MockResponse(items=[1, 2, 3], cursor="next")
+
+        result = find_first(
+            fetch_page,
+            get_items=lambda r: r.items,
+            predicate=lambda x: x == 2,
+        )
+
+        assert result == 2
+        assert len(calls) == 1
@@ -0,0 +1,197 @@
+"""Tests for Solana position utilities."""
+
+import struct
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from solders.pubkey import Pubkey
+
+from dflow.solana import positions
+from dflow.solana.positions import (
+    calculate_scalar_payout,
+    calculate_scalar_payouts,
+    clear_mint_decimals,
+    get_token_balances,
+    get_user_positions,
+)
+from dflow.types import Market
+
+MINT_A = Pubkey.new_unique()
+MINT_B = Pubkey.new_unique()
+OWNER = Pubkey.new_unique()
+
+
+def token_account(mint: Pubkey, amount: int) -> SimpleNamespace:
+    """Build a keyed token account holding the first 72 bytes of SPL data."""
+    data = struct.pack("<32s32sQ", bytes(mint), bytes(OWNER), amount)
+    return SimpleNamespace(pubkey=Pubkey.new_unique(), account=SimpleNamespace(data=data))
+
+
+def parsed_token_account(mint: Pubkey, amount: int, decimals: int) -> SimpleNamespace:
+    """Build a keyed token account in ``jsonParsed`` encoding."""
+    token_amount = {
+        "amount": str(amount),
+        "decimals": decimals,
+        "uiAmount": amount / 10**decimals,
+    }
+    parsed = {"info": {"mint": str(mint), "tokenAmount": token_amount}}
+    return SimpleNamespace(account=SimpleNamespace(data=SimpleNamespace(parsed=parsed)))
+
+
+@pytest.fixture(autouse=True)
+def forget_mint_decimals():
+    """Start each test without remembered mint decimals."""
+    clear_mint_decimals()
+
+
+@pytest.fixture
+def connection():
+    """RPC connection fake with one Token and one Token-2022 holding."""
+    conn = MagicMock()
+    conn.get_token_accounts_by_owner.side_effect = lambda wallet, opts: SimpleNamespace(
+        value=[token_account(MINT_A, 1_500_000), token_account(MINT_B, 0)]
+        if opts.program_id == positions.TOKEN_PROGRAM_ID
+        else [token_account(MINT_B, 42)]
+    )
+    conn.get_multiple_accounts.side_effect = lambda pubkeys, data_slice: SimpleNamespace(
+        value=[SimpleNamespace(data=bytes([6 if p == MINT_A else 0])) for p in pubkeys]
+    )
+    return conn
+
+
+class TestGetTokenBalances:
+    """Tests for get_token_balances."""
+
+    def test_unpacks_raw_account_slices(self, connection):
+        """Test balances are decoded from raw data and zero balances skipped."""
+        balances = get_token_balances(connection, OWNER)
+
+        assert [(b.mint, b.raw_balance, b.balance, b.decimals) for b in balances] == [
+            (str(MINT_A), "1500000", 1.5, 6),
+            (str(MINT_B), "42", 42.0, 0),
+        ]
+        opts = connection.get_token_accounts_by_owner.call_args.args[1]
+        assert opts.data_slice.length == 72
+
+    def test_mint_decimals_are_remembered(self, connection):
+        """Test mint decimals are fetched once across calls."""
+        get_token_balances(connection, OWNER)
+        get_token_balances(connection, OWNER)
+
+        assert connection.get_multiple_accounts.call_count == 1
+
+    def test_short_account_data_is_skipped_and_logged(self, connection, caplog):
+        """Test accounts with less than 72 bytes of data are skipped with a warning."""
+        short = SimpleNamespace(pubkey=Pubkey.new_unique(), account=SimpleNamespace(data=b"x"))
+        connection.get_token_accounts_by_owner.side_effect = lambda wallet, opts: (
+            SimpleNamespace(value=[short, token_account(MINT_A, 1_000_000)])
+            if opts.program_id == positions.TOKEN_PROGRAM_ID
+            else SimpleNamespace(value=[])
+        )
+
+        with caplog.at_level("WARNING", logger="dflow.solana.positions"):
+            balances = get_token_balances(connection, OWNER)
+
+        assert [b.mint for b in balances] == [str(MINT_A)]
+        assert str(short.pubkey) in caplog.text
+
+    def test_parsed_uses_json_parsed_accounts(self):
+        """Test parsed=True reads jsonParsed data and skips empty or malformed accounts."""
+        conn = MagicMock()
+        conn.get_token_accounts_by_owner_json_parsed.side_effect = lambda wallet, opts: (
+            SimpleNamespace(
+                value=[
+                    parsed_token_account(MINT_A, 1_500_000, 6),
+                    parsed_token_account(MINT_B, 0, 6),
+                    SimpleNamespace(account=SimpleNamespace(data=b"raw")),
+                ]
+            )
+            if opts.program_id == positions.TOKEN_PROGRAM_ID
+            else SimpleNamespace(value=[parsed_token_account(MINT_B, 42, 0)])
+        )
+
+        balances = get_token_balances(conn, OWNER, parsed=True)
+
+        assert [(b.mint, b.raw_balance, b.balance, b.decimals) for b in balances] == [
+            (str(MINT_A), "1500000", 1.5, 6),
+            (str(MINT_B), "42", 42.0, 0),
+        ]
+        conn.get_token_accounts_by_owner.assert_not_called()
+        conn.get_multiple_accounts.assert_not_called()
+
+
+class TestCalculateScalarPayouts:
+    """Tests for calculate_scalar_payouts."""
+
+    def test_matches_single_position_payouts(self, mock_market_data):
+        """Test batch payouts equal per-position payouts, including unknown mints."""
+        data = {**mock_market_data, "result": ""}
+        data["accounts"] = {
+            "usdc": {**data["accounts"]["usdc"], "scalarOutcomePct": 2500},
+        }
+        market = Market.model_validate(data)
+        account = market.accounts["usdc"]
+        held = [(account.yes_mint, 10.0), (account.no_mint, 10.0), ("Other", 5.0)]
+
+        payouts = calculate_scalar_payouts(market, held)
+
+        assert payouts == [2.5, 7.5, 0.0]
+        assert payouts == [calculate_scalar_payout(market, m, a) for m, a in held]
+
+
+class TestGetUserPositions:
+    """Tests for get_user_positions."""
+
+    def test_classifies_held_outcome_tokens(self, mock_market_data):
+        """Test YES, NO, ledger and unlisted outcome mints map to the right side."""
+        yes, no, ledger, orphan, other = (Pubkey.new_unique() for _ in range(5))
+        held = [yes, no, ledger, orphan, other]
+
+        connection = MagicMock()
+        connection.get_token_accounts_by_owner.side_effect = lambda wallet, opts: SimpleNamespace(
+            value=[token_account(mint, 2_000_000) for mint in held]
+            if opts.program_id == positions.TOKEN_PROGRAM_ID
+            else []
+        )
+        connection.get_multiple_accounts.side_effect = lambda pubkeys, data_slice: SimpleNamespace(
+            value=[SimpleNamespace(data=bytes([6])) for _ in pubkeys]
+        )
+
+        data = {**mock_market_data}
+        data["accounts"] = {
+            "usdc": {
+                **data["accounts"]["usdc"],
+                "yesMint": str(yes),
+                "noMint": str(no),
+                "marketLedger": str(ledger),
+            },
+        }
+        market = Market.model_validate(data)
+        markets_api = MagicMock()
+        markets_api.get_outcome_mint_set.return_value = frozenset(
+            str(mint) for mint in (yes, no, ledger, orphan)
+        )
+        # The batch lookup does not return a market for the orphan mint
+        markets_api.get_markets_batch.return_value = [market]
+
+        result = get_user_positions(connection, OWNER, markets_api)
+
+        assert [(p.mint, p.position, p.market) for p in result] == [
+            (str(yes), "YES", market),
+            (str(no), "NO", market),
+            (str(ledger), "UNKNOWN", market),
+            (str(orphan), "UNKNOWN", None),
+        ]
+        assert all(p.balance == 2.0 and p.decimals == 6 for p in result)
+        markets_api.get_markets_batch.assert_called_once_with(
+            mints=[str(yes), str(no), str(ledger), str(orphan)], chunk=True
+        )
+
+    def test_no_outcome_tokens_skips_market_lookup(self, connection):
+        """Test wallets without outcome tokens return no positions or batch calls."""
+        markets_api = MagicMock()
+        markets_api.get_outcome_mint_set.return_value = frozenset()
+
+        assert get_user_positions(connection, OWNER, markets_api) == []
+        markets_api.get_markets_batch.assert_not_called()
@@ -4,43 +4,48 @@ import time
 from unittest.mock import patch
 
 import pytest
+from pydantic import ValidationError
 from pytest_httpx import HTTPXMock
 
-from dflow import DFlowClient, DeepLinkParams, DFlowApiError
+from dflow import DeepLinkParams, DFlowApiError
+
+
+@pytest.fixture(autouse=True)
+def clear_verify_cache(client):
+    """Start each test with an empty verify_address cache on the shared client."""
+    client.proof.clear_verify_cache()
 
 
 class TestProofAPI:
     """Tests for ProofAPI."""
 
-    def test_verify_address_verified(self, httpx_mock: HTTPXMock):
+    def test_verify_address_verified(self, httpx_mock: HTTPXMock, client):
         """Test verify_address returns verified=True for verified wallet."""
         httpx_mock.add_response(
             url="https://proof.dflow.net/verify/7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
             json={"verified": True},
         )
 
-        with DFlowClient() as client:
-            result = client.proof.verify_address(
-                "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
-            )
+        result = client.proof.verify_address(
+            "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
+        )
 
-            assert result.verified is True
+        assert result.verified is True
 
-    def test_verify_address_not_verified(self, httpx_mock: HTTPXMock):
+    def test_verify_address_not_verified(self, httpx_mock: HTTPXMock, client):
         """Test verify_address returns verified=False for unverified wallet."""
         httpx_mock.add_response(
             url="https://proof.dflow.net/verify/UnverifiedWallet123456789abcdefghijk",
             json={"verified": False},
         )
 
-        with DFlowClient() as client:
-            result = client.proof.verify_address(
-                "UnverifiedWallet123456789abcdefghijk"
-            )
+        result = client.proof.verify_address(
+            "UnverifiedWallet123456789abcdefghijk"
+        )
 
-            assert result.verified is False
+        assert result.verified is False
 
-    def test_verify_address_invalid_address(self, httpx_mock: HTTPXMock):
+    def test_verify_address_invalid_address(self, httpx_mock: HTTPXMock, client):
         """Test verify_address handles invalid address error."""
         httpx_mock.add_response(
             url="https://proof.dflow.net/verify/invalid",
@@ -48,13 +53,12 @@ class TestProofAPI:
             json={"error": "Invalid wallet address"},
         )
 
-        with DFlowClient() as client:
-            with pytest.raises(DFlowApiError) as exc_info:
-                client.proof.verify_address("invalid")
+        with pytest.raises(DFlowApiError) as exc_info:
+            client.proof.verify_address("invalid")
 
-            assert exc_info.value.status_code == 400
+        assert exc_info.value.status_code == 400
 
-    def test_verify_address_not_found(self, httpx_mock: HTTPXMock):
+    def test_verify_address_not_found(self, httpx_mock: HTTPXMock, client):
         """Test verify_address handles 404 error."""
         httpx_mock.add_response(
             url="https://proof.dflow.net/verify/NonExistentWallet12345678901234567",
@@ -62,120 +66,191 @@ class TestProofAPI:
             json={"error": "Address not found"},
         )
 
-        with DFlowClient() as client:
-            with pytest.raises(DFlowApiError) as exc_info:
-                client.proof.verify_address("NonExistentWallet12345678901234567")
+        with pytest.raises(DFlowApiError) as exc_info:
+            client.proof.verify_address("NonExistentWallet12345678901234567")
+
+        assert exc_info.value.status_code == 404
+
+    def test_verify_addresses(self, httpx_mock: HTTPXMock, client):
+        """Test verify_addresses checks each unique address once."""
+        httpx_mock.add_response(
+            url="https://proof.dflow.net/verify/VerifiedWallet",
+            json={"verified": True},
+        )
+        httpx_mock.add_response(
+            url="https://proof.dflow.net/verify/UnverifiedWallet",
+            json={"verified": False},
+        )
+
+        status = client.proof.verify_addresses(
+            ["VerifiedWallet", "UnverifiedWallet", "VerifiedWallet"]
+        )
+
+        assert status == {"VerifiedWallet": True, "UnverifiedWallet": False}
+        assert len(httpx_mock.get_requests()) == 2
 
-            assert exc_info.value.status_code == 404
+    def test_verify_addresses_empty(self, client):
+        """Test verify_addresses with no addresses makes no requests."""
+        assert client.proof.verify_addresses([]) == {}
+
+
+class TestProofAPIVerifyCache:
+    """Tests for the ProofAPI.verify_address result cache."""
+
+    def test_verify_address_caches_verified(self, httpx_mock: HTTPXMock, client):
+        """Test a verified result is reused within the cache TTL."""
+        httpx_mock.add_response(
+            url="https://proof.dflow.net/verify/7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+            json={"verified": True},
+        )
+
+        first = client.proof.verify_address("7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU")
+        second = client.proof.verify_address("7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU")
+
+        assert first.verified is True
+        assert second is first
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_verify_address_refetches_after_ttl(self, httpx_mock: HTTPXMock, client):
+        """Test a cached result expires after the TTL."""
+        url = "https://proof.dflow.net/verify/7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
+        httpx_mock.add_response(url=url, json={"verified": True})
+        httpx_mock.add_response(url=url, json={"verified": False})
+
+        with patch("time.monotonic", return_value=1000.0):
+            client.proof.verify_address("7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU")
+        with patch("time.monotonic", return_value=1061.0):
+            result = client.proof.verify_address(
+                "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
+            )
+
+        assert result.verified is False
+
+    def test_verify_address_does_not_cache_unverified(self, httpx_mock: HTTPXMock, client):
+        """Test unverified results always hit the API."""
+        url = "https://proof.dflow.net/verify/UnverifiedWallet123456789abcdefghijk"
+        httpx_mock.add_response(url=url, json={"verified": False})
+        httpx_mock.add_response(url=url, json={"verified": True})
+
+        first = client.proof.verify_address("UnverifiedWallet123456789abcdefghijk")
+        second = client.proof.verify_address("UnverifiedWallet123456789abcdefghijk")
+
+        assert first.verified is False
+        assert second.verified is True
+
+    def test_verify_addresses_concurrent_eviction(
+        self, httpx_mock: HTTPXMock, client, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test concurrent lookups evict safely and keep the cache bounded."""
+        monkeypatch.setattr(client.proof, "_VERIFY_CACHE_MAX_SIZE", 4)
+        httpx_mock.add_response(json={"verified": True}, is_reusable=True)
+        wallets = [f"Wallet{i}" for i in range(64)]
+
+        status = client.proof.verify_addresses(wallets)
+
+        assert status == dict.fromkeys(wallets, True)
+        assert len(client.proof._verify_cache) == 4
 
 
 class TestProofAPISignatureMessage:
     """Tests for ProofAPI.generate_signature_message."""
 
-    def test_generate_signature_message_with_timestamp(self):
+    def test_generate_signature_message_with_timestamp(self, client):
         """Test generate_signature_message with explicit timestamp."""
-        with DFlowClient() as client:
-            message = client.proof.generate_signature_message(1699123456789)
+        message = client.proof.generate_signature_message(1699123456789)
 
-            assert message == "Proof KYC verification: 1699123456789"
+        assert message == "Proof KYC verification: 1699123456789"
 
-    def test_generate_signature_message_without_timestamp(self):
+    def test_generate_signature_message_without_timestamp(self, client):
         """Test generate_signature_message uses current time when no timestamp provided."""
-        with DFlowClient() as client:
-            # Mock time to get predictable result
-            with patch("time.time", return_value=1699123456.789):
-                message = client.proof.generate_signature_message()
+        # Mock time to get predictable result
+        with patch("time.time", return_value=1699123456.789):
+            message = client.proof.generate_signature_message()
 
-            assert message == "Proof KYC verification: 1699123456789"
+        assert message == "Proof KYC verification: 1699123456789"
 
-    def test_generate_signature_message_format(self):
+    def test_generate_signature_message_format(self, client):
         """Test generate_signature_message follows correct format."""
-        with DFlowClient() as client:
-            message = client.proof.generate_signature_message(1234567890123)
+        message = client.proof.generate_signature_message(1234567890123)
 
-            # Verify format: "Proof KYC verification: {timestamp}"
-            assert message.startswith("Proof KYC verification: ")
-            timestamp_part = message.split(": ")[1]
-            assert timestamp_part == "1234567890123"
-            assert int(timestamp_part) == 1234567890123
+        # Verify format: "Proof KYC verification: {timestamp}"
+        assert message.startswith("Proof KYC verification: ")
+        timestamp_part = message.split(": ")[1]
+        assert timestamp_part == "1234567890123"
+        assert int(timestamp_part) == 1234567890123
 
-    def test_generate_signature_message_different_timestamps(self):
+    def test_generate_signature_message_different_timestamps(self, client):
         """Test generate_signature_message produces different messages for different timestamps."""
-        with DFlowClient() as client:
-            message1 = client.proof.generate_signature_message(1000000000000)
-            message2 = client.proof.generate_signature_message(2000000000000)
+        message1 = client.proof.generate_signature_message(1000000000000)
+        message2 = client.proof.generate_signature_message(2000000000000)
 
-            assert message1 != message2
-            assert "1000000000000" in message1
-            assert "2000000000000" in message2
+        assert message1 != message2
+        assert "1000000000000" in message1
+        assert "2000000000000" in message2
 
 
 class TestProofAPIDeepLink:
     """Tests for ProofAPI.build_deep_link."""
 
-    def test_build_deep_link_basic(self):
+    def test_build_deep_link_basic(self, client):
         """Test build_deep_link with required parameters only."""
-        with DFlowClient() as client:
-            link = client.proof.build_deep_link(
-                DeepLinkParams(
-                    wallet="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
-                    signature="5TuPHPFe7p3nLh",
-                    timestamp=1699123456789,
-                    redirect_uri="https://myapp.com/callback",
-                )
+        link = client.proof.build_deep_link(
+            DeepLinkParams(
+                wallet="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+                signature="5TuPHPFe7p3nLh",
+                timestamp=1699123456789,
+                redirect_uri="https://myapp.com/callback",
             )
+        )
 
-            assert link.startswith("https://dflow.net/proof?")
-            assert "wallet=7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU" in link
-            assert "signature=5TuPHPFe7p3nLh" in link
-            assert "timestamp=1699123456789" in link
-            assert "redirect_uri=https%3A%2F%2Fmyapp.com%2Fcallback" in link
-            assert "projectId" not in link
+        assert link.startswith("https://dflow.net/proof?")
+        assert "wallet=7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU" in link
+        assert "signature=5TuPHPFe7p3nLh" in link
+        assert "timestamp=1699123456789" in link
+        assert "redirect_uri=https%3A%2F%2Fmyapp.com%2Fcallback" in link
+        assert "projectId" not in link
 
-    def test_build_deep_link_with_project_id(self):
+    def test_build_deep_link_with_project_id(self, client):
         """Test build_deep_link with optional project_id."""
-        with DFlowClient() as client:
-            link = client.proof.build_deep_link(
-                DeepLinkParams(
-                    wallet="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
-                    signature="5TuPHPFe7p3nLh",
-                    timestamp=1699123456789,
-                    redirect_uri="https://myapp.com/callback",
-                    project_id="my-dapp-project",
-                )
+        link = client.proof.build_deep_link(
+            DeepLinkParams(
+                wallet="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+                signature="5TuPHPFe7p3nLh",
+                timestamp=1699123456789,
+                redirect_uri="https://myapp.com/callback",
+                project_id="my-dapp-project",
             )
+        )
 
-            assert "projectId=my-dapp-project" in link
+        assert "projectId=my-dapp-project" in link
 
-    def test_build_deep_link_url_encoding(self):
+    def test_build_deep_link_url_encoding(self, client):
         """Test build_deep_link properly URL encodes special characters."""
-        with DFlowClient() as client:
-            link = client.proof.build_deep_link(
-                DeepLinkParams(
-                    wallet="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
-                    signature="abc+def/ghi=",
-                    timestamp=1699123456789,
-                    redirect_uri="https://myapp.com/callback?foo=bar&baz=qux",
-                )
+        link = client.proof.build_deep_link(
+            DeepLinkParams(
+                wallet="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+                signature="abc+def/ghi=",
+                timestamp=1699123456789,
+                redirect_uri="https://myapp.com/callback?foo=bar&baz=qux",
             )
+        )
 
-            # Check URL encoding of special characters
-            assert "signature=abc%2Bdef%2Fghi%3D" in link
-            assert "redirect_uri=https%3A%2F%2Fmyapp.com%2Fcallback%3Ffoo%3Dbar%26baz%3Dqux" in link
+        # Check URL encoding of special characters
+        assert "signature=abc%2Bdef%2Fghi%3D" in link
+        assert "redirect_uri=https%3A%2F%2Fmyapp.com%2Fcallback%3Ffoo%3Dbar%26baz%3Dqux" in link
 
-    def test_build_deep_link_base_url(self):
+    def test_build_deep_link_base_url(self, client):
         """Test build_deep_link uses correct base URL."""
-        with DFlowClient() as client:
-            link = client.proof.build_deep_link(
-                DeepLinkParams(
-                    wallet="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
-                    signature="test",
-                    timestamp=1699123456789,
-                    redirect_uri="https://example.com",
-                )
+        link = client.proof.build_deep_link(
+            DeepLinkParams(
+                wallet="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+                signature="test",
+                timestamp=1699123456789,
+                redirect_uri="https://example.com",
             )
+        )
 
-            assert link.startswith("https://dflow.net/proof?")
+        assert link.startswith("https://dflow.net/proof?")
 
     def test_build_deep_link_with_alias_field_names(self):
         """Test DeepLinkParams works with both snake_case and camelCase field names."""
@@ -201,11 +276,41 @@ class TestProofAPIDeepLink:
         assert params_camel.redirect_uri == "https://example.com"
         assert params_camel.project_id == "project123"
 
+    def test_deep_link_params_frozen(self):
+        """Test DeepLinkParams is immutable and equal instances hash alike."""
+        kwargs = {
+            "wallet": "wallet123",
+            "signature": "sig123",
+            "timestamp": 1699123456789,
+            "redirect_uri": "https://example.com",
+        }
+        params = DeepLinkParams(**kwargs)
+
+        with pytest.raises(ValidationError):
+            params.wallet = "other"  # type: ignore[misc]
+        assert hash(params) == hash(DeepLinkParams(**kwargs))
+
+    def test_build_deep_link_cached(self, client):
+        """Test equal params reuse the cached deep link."""
+        kwargs = {
+            "wallet": "wallet123",
+            "signature": "sig123",
+            "timestamp": 1699123456789,
+            "redirect_uri": "https://example.com",
+        }
+        first = client.proof.build_deep_link(DeepLinkParams(**kwargs))
+
+        with patch("dflow.api.proof.quote_plus") as quote:
+            second = client.proof.build_deep_link(DeepLinkParams(**kwargs))
+
+        assert second == first
+        quote.assert_not_called()
+
 
 class TestProofAPIIntegration:
     """Integration tests for ProofAPI combining multiple methods."""
 
-    def test_full_verification_flow(self, httpx_mock: HTTPXMock):
+    def test_full_verification_flow(self, httpx_mock: HTTPXMock, client):
         """Test the full partner verification flow."""
         # Step 1: Check if wallet is verified (it's not)
         httpx_mock.add_response(
@@ -213,34 +318,33 @@ class TestProofAPIIntegration:
             json={"verified": False},
         )
 
-        with DFlowClient() as client:
-            # Check initial verification status
-            result = client.proof.verify_address(
-                "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
-            )
-            assert result.verified is False
-
-            # Generate signature message
-            timestamp = 1699123456789
-            message = client.proof.generate_signature_message(timestamp)
-            assert "1699123456789" in message
-
-            # Build deep link for user to verify
-            link = client.proof.build_deep_link(
-                DeepLinkParams(
-                    wallet="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
-                    signature="user_signature_here",
-                    timestamp=timestamp,
-                    redirect_uri="https://partner-app.com/verified",
-                    project_id="partner-app",
-                )
+        # Check initial verification status
+        result = client.proof.verify_address(
+            "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
+        )
+        assert result.verified is False
+
+        # Generate signature message
+        timestamp = 1699123456789
+        message = client.proof.generate_signature_message(timestamp)
+        assert "1699123456789" in message
+
+        # Build deep link for user to verify
+        link = client.proof.build_deep_link(
+            DeepLinkParams(
+                wallet="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+                signature="user_signature_here",
+                timestamp=timestamp,
+                redirect_uri="https://partner-app.com/verified",
+                project_id="partner-app",
             )
+        )
 
-            # Verify the link contains all expected parameters
-            assert "wallet=7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU" in link
-            assert "signature=user_signature_here" in link
-            assert "timestamp=1699123456789" in link
-            assert "projectId=partner-app" in link
+        # Verify the link contains all expected parameters
+        assert "wallet=7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU" in link
+        assert "signature=user_signature_here" in link
+        assert "timestamp=1699123456789" in link
+        assert "projectId=partner-app" in link
 
 
 class TestProofConstants:
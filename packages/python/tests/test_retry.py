@@ -4,11 +4,18 @@ import pytest
 
 from dflow.utils.http import DFlowApiError
 from dflow.utils.retry import (
+    _calculate_delay,
+    _delay_schedule,
+    _retry_delay,
     create_retryable,
+    create_retryable_async,
     default_should_retry,
     with_retry,
 )
 
+# Backoff delays are checked directly below; retry loops never need to wait
+pytestmark = pytest.mark.usefixtures("no_sleep")
+
 
 class TestDefaultShouldRetry:
     """Tests for default_should_retry function."""
@@ -34,6 +41,16 @@ class TestDefaultShouldRetry:
         error = DFlowApiError("Bad request", 400)
         assert default_should_retry(error, 0) is False
 
+    def test_no_retry_on_unlisted_server_error(self):
+        """Test no retry on 5xx codes that are not transient (e.g. 501)."""
+        error = DFlowApiError("Not implemented", 501)
+        assert default_should_retry(error, 0) is False
+
+    def test_no_retry_on_non_idempotent_request(self):
+        """Test no retry when the failed request is not idempotent."""
+        error = DFlowApiError("Server error", 503, idempotent=False)
+        assert default_should_retry(error, 0) is False
+
     def test_retry_on_connection_error(self):
         """Test retry on connection errors."""
         error = ConnectionError("Connection refused")
@@ -50,6 +67,55 @@ class TestDefaultShouldRetry:
         assert default_should_retry(error, 0) is False
 
 
+class TestCalculateDelay:
+    """Tests for _calculate_delay function."""
+
+    def test_full_jitter_within_window(self):
+        """Test full jitter stays within [0, capped delay]."""
+        for _ in range(100):
+            delay = _calculate_delay(3, 1000, 5000, 2.0, "full")
+            assert 0 <= delay <= 5.0
+
+    def test_equal_jitter_within_upper_half(self):
+        """Test equal jitter stays within [delay / 2, delay]."""
+        for _ in range(100):
+            delay = _calculate_delay(1, 1000, 30000, 2.0, "equal")
+            assert 1.0 <= delay <= 2.0
+
+    def test_no_jitter_is_deterministic(self):
+        """Test no jitter returns the capped exponential delay."""
+        assert _calculate_delay(0, 1000, 30000, 2.0, "none") == 1.0
+        assert _calculate_delay(10, 1000, 30000, 2.0, "none") == 30.0
+
+    def test_delay_schedule_is_capped_and_cached(self):
+        """Test the delay schedule caps each step and is reused across calls."""
+        schedule = _delay_schedule(4, 1000, 5000, 2.0)
+        assert schedule == (1.0, 2.0, 4.0, 5.0)
+        assert _delay_schedule(4, 1000, 5000, 2.0) is schedule
+
+
+class TestRetryDelay:
+    """Tests for _retry_delay function."""
+
+    def test_retry_after_overrides_shorter_backoff(self):
+        """Test Retry-After sets a floor on the delay (with up to 10% extra jitter)."""
+        error = DFlowApiError("Rate limited", 429, retry_after=5.0)
+        delay = _retry_delay(error, 1.0, "none", 30000)
+        assert delay is not None
+        assert 5.0 <= delay <= 5.5
+
+    @pytest.mark.parametrize("retry_after", [31.0, 3600.0])
+    def test_retry_after_beyond_max_delay_stops(self, retry_after):
+        """Test a Retry-After longer than max_delay_ms is not waited out."""
+        error = DFlowApiError("Rate limited", 429, retry_after=retry_after)
+        assert _retry_delay(error, 1.0, "none", 30000) is None
+
+    def test_backoff_used_without_retry_after(self):
+        """Test computed backoff is used when no Retry-After is present."""
+        error = DFlowApiError("Rate limited", 429)
+        assert _retry_delay(error, 1.0, "none", 30000) == 1.0
+
+
 class TestWithRetry:
     """Tests for with_retry function."""
 
@@ -106,6 +172,20 @@ class TestWithRetry:
         # Should only be called once (no retries for 404)
         assert call_count == 1
 
+    def test_long_retry_after_raises_without_waiting(self):
+        """Test a Retry-After past max_delay_ms raises instead of blocking."""
+        call_count = 0
+
+        def rate_limited():
+            nonlocal call_count
+            call_count += 1
+            raise DFlowApiError("Rate limited", 429, retry_after=3600.0)
+
+        with pytest.raises(DFlowApiError):
+            with_retry(rate_limited, max_retries=3)
+
+        assert call_count == 1
+
     def test_custom_should_retry(self):
         """Test custom should_retry function."""
         call_count = 0
@@ -129,6 +209,13 @@ class TestWithRetry:
         # Should try 3 times (initial + 2 retries)
         assert call_count == 3
 
+    async def test_warns_inside_running_loop(self):
+        """Test with_retry warns when called from a running event loop."""
+        with pytest.warns(RuntimeWarning, match="with_retry_async"):
+            result = with_retry(lambda: "success")
+
+        assert result == "success"
+
 
 class TestCreateRetryable:
     """Tests for create_retryable function."""
@@ -158,3 +245,24 @@ class TestCreateRetryable:
         
         assert result == 10
         assert call_count == 3
+
+
+class TestCreateRetryableAsync:
+    """Tests for create_retryable_async function."""
+
+    async def test_retryable_async_wrapper_retries(self):
+        """Test async retryable wrapper retries on failure."""
+        call_count = 0
+
+        async def fail_twice(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise DFlowApiError("Rate limited", 429)
+            return x * 2
+
+        retryable_fn = create_retryable_async(fail_twice, initial_delay_ms=10)
+        result = await retryable_fn(5)
+
+        assert result == 10
+        assert call_count == 3
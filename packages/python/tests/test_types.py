@@ -7,6 +7,25 @@ from dflow.types.markets import Market, MarketAccount
 from dflow.types.orderbook import Orderbook, OrderbookLevel
 from dflow.types.orders import SwapQuote
 from dflow.types.trades import Trade
+from dflow.utils.codec import json_dumps
+
+# Fields parsed from the ``mock_market_data`` fixture
+EXPECTED_MARKET = {
+    "ticker": "BTCD-25DEC0313-T92749.99",
+    "title": "Bitcoin above $92,749.99?",
+    "event_ticker": "BTCD-25DEC0313",
+    "status": "active",
+    "result": "",
+    "market_type": "binary",
+    "yes_sub_title": "YES",
+    "no_sub_title": "NO",
+    "can_close_early": False,
+    "yes_bid": "0.6500",
+    "no_bid": "0.3400",
+    "yes_price": 0.65,  # computed from yes_bid
+    "no_price": 0.34,  # computed from no_bid
+    "volume": 1000000,
+}
 
 
 class TestMarketTypes:
@@ -28,24 +47,16 @@ class TestMarketTypes:
         assert account.redemption_status == "open"
         assert account.scalar_outcome_pct == 5000
 
-    def test_market_parsing(self, mock_market_data):
-        """Test Market parsing with nested accounts."""
-        market = Market.model_validate(mock_market_data)
-        assert market.ticker == "BTCD-25DEC0313-T92749.99"
-        assert market.title == "Bitcoin above $92,749.99?"
-        assert market.event_ticker == "BTCD-25DEC0313"
-        assert market.status == "active"
-        assert market.result == ""
-        assert market.market_type == "binary"
-        assert market.yes_sub_title == "YES"
-        assert market.no_sub_title == "NO"
-        assert market.can_close_early is False
+    @pytest.mark.parametrize("via", ["dict", "json"])
+    def test_market_parsing(self, mock_market_data, via):
+        """Test Market parsing with nested accounts, from a dict or raw JSON."""
+        if via == "json":
+            market = Market.model_validate_json(json_dumps(mock_market_data))
+        else:
+            market = Market.model_validate(mock_market_data)
+        # One comparison so a mismatch reports every wrong field at once
+        assert {name: getattr(market, name) for name in EXPECTED_MARKET} == EXPECTED_MARKET
         assert market.rules_primary is not None
-        assert market.yes_bid == "0.6500"
-        assert market.no_bid == "0.3400"
-        assert market.yes_price == 0.65  # computed from yes_bid
-        assert market.no_price == 0.34  # computed from no_bid
-        assert market.volume == 1000000
         assert "usdc" in market.accounts
         assert market.accounts["usdc"].yes_mint == "YesMint123456789abcdefghijklmnopqrstuvwxyz"
 
@@ -101,16 +112,17 @@ class TestMarketTypes:
         assert market.close_time == 1774969200
         assert market.expiration_time == 1774969200
 
-    def test_market_account_closed_status(self):
-        """Test MarketAccount with 'closed' redemption status."""
+    @pytest.mark.parametrize("status", ["open", "closed", "pending"])
+    def test_market_account_redemption_status(self, status):
+        """Test MarketAccount accepts every redemption status."""
         data = {
             "yesMint": "YesMint123",
             "noMint": "NoMint123",
             "marketLedger": "Ledger123",
-            "redemptionStatus": "closed",
+            "redemptionStatus": status,
         }
         account = MarketAccount.model_validate(data)
-        assert account.redemption_status == "closed"
+        assert account.redemption_status == status
 
 
 class TestEventTypes:
@@ -126,8 +138,8 @@ class TestEventTypes:
 
     def test_event_with_markets(self, mock_event_data, mock_market_data):
         """Test Event with nested markets."""
-        mock_event_data["markets"] = [mock_market_data]
-        event = Event.model_validate(mock_event_data)
+        event_with_markets = {**mock_event_data, "markets": [mock_market_data]}
+        event = Event.model_validate(event_with_markets)
         assert event.markets is not None
         assert len(event.markets) == 1
         assert event.markets[0].ticker == "BTCD-25DEC0313-T92749.99"
@@ -157,6 +169,31 @@ class TestOrderbookTypes:
         # Test backwards-compatible property
         assert orderbook.yes_bid[0].price == 0.65
 
+    def test_orderbook_levels_are_built_once(self, mock_orderbook_data):
+        """Test sorted levels are cached and callers get independent lists."""
+        orderbook = Orderbook.model_validate(mock_orderbook_data)
+
+        assert orderbook.yes_levels is orderbook.yes_levels
+        assert [level.price for level in orderbook.no_levels] == [0.36, 0.34]
+        levels = orderbook.get_yes_levels()
+        levels.clear()
+        assert len(orderbook.get_yes_levels()) == 2
+
+    def test_orderbook_levels_follow_bid_changes(self, mock_orderbook_data):
+        """Test cached levels are rebuilt after the bids are resized or replaced."""
+        orderbook = Orderbook.model_validate(mock_orderbook_data)
+        orderbook.get_yes_levels()
+
+        orderbook.yes_bids["0.7"] = 3
+        assert orderbook.get_yes_levels()[0] == OrderbookLevel(price=0.7, quantity=3)
+
+        orderbook.yes_bids = {**orderbook.yes_bids, "0.7": 4}
+        assert orderbook.get_yes_levels()[0] == OrderbookLevel(price=0.7, quantity=4)
+
+        orderbook.no_bids = {"0.2": 5}
+        orderbook.sequence = 2
+        assert [level.price for level in orderbook.get_no_levels()] == [0.2]
+
 
 class TestTradeTypes:
     """Tests for trade types."""
@@ -0,0 +1,282 @@
+"""Tests for WebSocket client."""
+
+import asyncio
+import json
+
+import pytest
+
+from dflow.websocket import DFlowWebSocket
+from dflow.websocket import client as ws_module
+
+
+class StubConnection:
+    """Minimal stand-in for a websockets client connection."""
+
+    def __init__(self):
+        self.closed = False
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        await asyncio.sleep(0)
+        self.closed = True
+
+
+def price_message(ticker: str = "BTCD-25DEC0313-T92749.99") -> str:
+    """Build a raw price update frame."""
+    return json.dumps(
+        {
+            "channel": "prices",
+            "ticker": ticker,
+            "timestamp": 1704067200,
+            "yesPrice": 0.65,
+            "noPrice": 0.35,
+        }
+    )
+
+
+class TestDFlowWebSocketInit:
+    """Tests for DFlowWebSocket construction."""
+
+    def test_uses_slots(self):
+        """Test instances have no per-instance __dict__."""
+        ws = DFlowWebSocket()
+        assert not hasattr(ws, "__dict__")
+        with pytest.raises(AttributeError):
+            ws.unknown_attribute = 1
+
+
+class TestHandleMessage:
+    """Tests for DFlowWebSocket message dispatch."""
+
+    def test_dispatches_price_update(self):
+        """Test price frames are dispatched to price callbacks."""
+        ws = DFlowWebSocket()
+        received = []
+        ws.on_price(received.append)
+
+        ws._handle_message(price_message())
+
+        assert len(received) == 1
+        assert received[0].yes_price == 0.65
+
+    def test_dispatches_frames_in_any_key_order(self):
+        """Test frames are routed regardless of key order or frame type."""
+        ws = DFlowWebSocket()
+        received = []
+        ws.on_trade(received.append)
+
+        ws._handle_message(
+            '{"ticker": "T", "timestamp": 1, "side": "yes", "price": 0.5, '
+            '"quantity": 10, "tradeId": "t-1", "channel" : "trades"}'
+        )
+        ws._handle_message(
+            b'{"channel":"trades","ticker":"T","timestamp":1,"side":"no",'
+            b'"price":0.5,"quantity":10,"tradeId":"t-2"}'
+        )
+
+        assert [t.trade_id for t in received] == ["t-1", "t-2"]
+
+    def test_unsubscribe_during_dispatch(self):
+        """Test a callback can unsubscribe itself without skipping others."""
+        ws = DFlowWebSocket()
+        received = []
+
+        def once(update):
+            received.append("once")
+            unsubscribe_once()
+
+        unsubscribe_once = ws.on_price(once)
+        ws.on_price(lambda update: received.append("always"))
+
+        ws._handle_message(price_message())
+        ws._handle_message(price_message())
+
+        assert received == ["once", "always", "always"]
+
+    def test_unsubscribe_twice_is_noop(self):
+        """Test calling an unsubscribe function twice does not raise."""
+        ws = DFlowWebSocket()
+        unsubscribe = ws.on_price(lambda update: None)
+
+        unsubscribe()
+        unsubscribe()
+
+    def test_unsubscribe_removes_only_its_registration(self):
+        """Test the same callback registered twice is removed one at a time."""
+        ws = DFlowWebSocket()
+        received = []
+
+        first = ws.on_price(received.append)
+        ws.on_price(received.append)
+        first()
+
+        ws._handle_message(price_message())
+
+        assert len(received) == 1
+
+    def test_invalid_message_reports_error(self):
+        """Test malformed frames are reported to error callbacks."""
+        ws = DFlowWebSocket()
+        errors = []
+        ws.on_error(errors.append)
+
+        ws._handle_message("not json")
+
+        assert len(errors) == 1
+
+
+class TestSubscribe:
+    """Tests for DFlowWebSocket subscriptions."""
+
+    async def test_subscribe_many_sends_each_channel(self):
+        """Test subscribe_many sends one frame per requested channel."""
+        ws = DFlowWebSocket()
+        conn = StubConnection()
+        ws._ws = conn
+
+        await ws.subscribe_many(prices=["A", "B"], orderbook=["A"])
+
+        assert conn.sent == [
+            {"type": "subscribe", "channel": "prices", "tickers": ["A", "B"]},
+            {"type": "subscribe", "channel": "orderbook", "tickers": ["A"]},
+        ]
+
+    async def test_subscribe_many_requires_connection(self):
+        """Test subscribe_many raises when not connected."""
+        ws = DFlowWebSocket()
+
+        with pytest.raises(Exception, match="not connected"):
+            await ws.subscribe_many(prices=["A"])
+
+
+class TestDisconnect:
+    """Tests for DFlowWebSocket shutdown."""
+
+    async def test_aclose_awaits_close(self):
+        """Test aclose closes the connection and stops the listener."""
+        ws = DFlowWebSocket()
+        conn = StubConnection()
+        ws._ws = conn
+        ws._listen_task = asyncio.create_task(asyncio.sleep(60))
+
+        await ws.aclose()
+
+        assert conn.closed is True
+        assert ws._ws is None
+        assert ws._listen_task is None
+        assert ws.reconnect is False
+
+    async def test_close_nowait_keeps_task_reference(self):
+        """Test close_nowait tracks its close task until it completes."""
+        ws = DFlowWebSocket()
+        conn = StubConnection()
+        ws._ws = conn
+
+        ws.close_nowait()
+        assert len(ws._pending_close) == 1
+
+        await asyncio.gather(*ws._pending_close)
+        await asyncio.sleep(0)
+
+        assert conn.closed is True
+        assert not ws._pending_close
+
+    async def test_disconnect_is_synchronous(self):
+        """Test disconnect closes without being awaited."""
+        ws = DFlowWebSocket()
+        conn = StubConnection()
+        ws._ws = conn
+
+        assert ws.disconnect() is None
+        await asyncio.gather(*ws._pending_close)
+
+        assert conn.closed is True
+        assert ws.reconnect is False
+
+    def test_close_nowait_without_loop(self):
+        """Test close_nowait is safe to call outside an event loop."""
+        ws = DFlowWebSocket()
+        ws._ws = StubConnection()
+
+        ws.close_nowait()
+
+        assert ws._ws is None
+
+
+class TestReconnectBackoff:
+    """Tests for DFlowWebSocket reconnect backoff."""
+
+    def test_delay_grows_and_caps(self):
+        """Test the backoff window grows exponentially up to the cap."""
+        ws = DFlowWebSocket(reconnect_initial_s=1.0, reconnect_max_s=4.0)
+        for attempt, window in [(1, 1.0), (2, 2.0), (3, 4.0), (6, 4.0)]:
+            ws._reconnect_attempts = attempt
+            for _ in range(50):
+                assert 0 <= ws._reconnect_delay() <= window
+
+    def test_reconnect_interval_is_deprecated_alias(self):
+        """Test reconnect_interval still configures the initial backoff step."""
+        with pytest.warns(DeprecationWarning):
+            ws = DFlowWebSocket(reconnect_interval=2.5)
+
+        assert ws.reconnect_initial_s == 2.5
+        assert ws.reconnect_interval == 2.5
+
+        with pytest.warns(DeprecationWarning):
+            ws.reconnect_interval = 4.0
+        assert ws.reconnect_initial_s == 4.0
+
+    async def test_reconnect_retries_until_connected(self, monkeypatch: pytest.MonkeyPatch):
+        """Test failed reconnects are retried with growing delays until one succeeds."""
+        delays = []
+        attempts = []
+
+        async def record_sleep(delay):
+            delays.append(delay)
+
+        async def flaky_connect(url):
+            attempts.append(url)
+            if len(attempts) < 3:
+                raise OSError("connection refused")
+            return StubConnection()
+
+        async def no_listen(self):
+            pass
+
+        monkeypatch.setattr(ws_module, "_sleep", record_sleep)
+        monkeypatch.setattr(ws_module.random, "random", lambda: 1.0)
+        monkeypatch.setattr(ws_module.websockets, "connect", flaky_connect)
+        monkeypatch.setattr(DFlowWebSocket, "_listen", no_listen)
+        ws = DFlowWebSocket(reconnect_initial_s=1.0, reconnect_multiplier=2.0)
+
+        await ws._attempt_reconnect()
+
+        assert len(attempts) == 3
+        assert delays == [1.0, 2.0, 4.0]
+        assert ws.is_connected
+        assert ws._reconnect_attempts == 0
+
+    async def test_reconnect_gives_up_after_max_attempts(self, monkeypatch: pytest.MonkeyPatch):
+        """Test reconnecting stops after max_reconnect_attempts and reports an error."""
+        attempts = []
+        errors = []
+
+        async def no_sleep(delay):
+            pass
+
+        async def failing_connect(url):
+            attempts.append(url)
+            raise OSError("connection refused")
+
+        monkeypatch.setattr(ws_module, "_sleep", no_sleep)
+        monkeypatch.setattr(ws_module.websockets, "connect", failing_connect)
+        ws = DFlowWebSocket(max_reconnect_attempts=3)
+        ws.on_error(errors.append)
+
+        await ws._attempt_reconnect()
+
+        assert len(attempts) == 3
+        assert [str(e) for e in errors] == ["Max reconnection attempts reached"]